@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
-import psutil
-
+from submit_autoclicker.adapters.process_cache import ProcessNameCache
+from submit_autoclicker.adapters.session import AutomationSession
 from submit_autoclicker.config import AppConfig
-from submit_autoclicker.core.policy import AllowlistPolicy
+from submit_autoclicker.core.policy import CompiledPolicy, PolicySlot
 from submit_autoclicker.models import ButtonCandidate, WindowIdentity
 
 try:
@@ -14,11 +15,6 @@ try:
 except ImportError:  # pragma: no cover - environment dependent
     pyautogui = None  # type: ignore[assignment]
 
-try:
-    from pywinauto import Desktop
-except ImportError:  # pragma: no cover - environment dependent
-    Desktop = None  # type: ignore[assignment]
-
 
 class ImageFallbackAdapter:
     """
@@ -32,15 +28,27 @@ class ImageFallbackAdapter:
 
     name = "image_fallback"
 
-    def __init__(self, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        session: AutomationSession | None = None,
+        process_name_fn: Callable[[int], str] | None = None,
+    ) -> None:
         self._logger = logger
         self._warned_missing_dep = False
+        self._session = session or AutomationSession(logger)
+        self._process_name_fn = process_name_fn or ProcessNameCache().name
+        self._policy_slot = PolicySlot()
+
+    def bind_policy(self, policy: CompiledPolicy) -> None:
+        self._policy_slot.bind(policy)
 
     def scan(self, config: AppConfig) -> list[ButtonCandidate]:
         if not config.enable_image_fallback:
             return []
 
-        if pyautogui is None or Desktop is None:
+        if pyautogui is None or not self._session.available:
             if not self._warned_missing_dep:
                 self._logger.warning(
                     "Image fallback requested but pyautogui/pywinauto is missing. Skipping fallback."
@@ -51,16 +59,12 @@ class ImageFallbackAdapter:
         if not config.image_button_templates:
             return []
 
-        active_window = self._active_window()
-        if active_window is None:
-            return []
-
-        policy = AllowlistPolicy(config.allowed_processes, config.allowed_window_title_contains)
-        if not policy.is_allowed(active_window):
+        active_info = self._active_window_info()
+        if active_info is None:
             return []
 
-        region = self._active_window_region()
-        if region is None:
+        active_window, region = active_info
+        if not self._policy_slot.for_config(config).is_window_allowed(active_window):
             return []
 
         for template in config.image_button_templates:
@@ -99,28 +103,24 @@ class ImageFallbackAdapter:
 
         return []
 
-    def _active_window(self) -> WindowIdentity | None:
+    def _active_window_info(self) -> tuple[WindowIdentity, tuple[int, int, int, int]] | None:
+        """Identity and screen region of the foreground window from a single get_active() call."""
+        active = self._session.active_window()
+        if active is None:
+            return None
         try:
-            active = Desktop(backend="uia").get_active()
             title = str(getattr(active, "window_text")() or "<untitled>").strip()
             process_id = int(getattr(active, "process_id")())
-            process_name = psutil.Process(process_id).name()
+            process_name = self._process_name_fn(process_id)
             handle = int(getattr(active, "handle", 0))
-            return WindowIdentity(title=title, process_name=process_name, handle=handle)
-        except Exception:
-            self._logger.debug("Unable to resolve active window for image fallback.", exc_info=True)
-            return None
-
-    def _active_window_region(self) -> tuple[int, int, int, int] | None:
-        try:
-            active = Desktop(backend="uia").get_active()
             rect = active.rectangle()
             width = max(1, int(rect.width()))
             height = max(1, int(rect.height()))
-            return (int(rect.left), int(rect.top), width, height)
         except Exception:
-            self._logger.debug("Unable to resolve active window region.", exc_info=True)
+            self._logger.debug("Unable to resolve active window for image fallback.", exc_info=True)
             return None
+        identity = WindowIdentity(title=title, process_name=process_name, handle=handle)
+        return identity, (int(rect.left), int(rect.top), width, height)
 
     def _build_click_action(self, x: int, y: int):
         def _click(allow_focus: bool) -> bool:
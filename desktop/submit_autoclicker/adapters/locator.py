@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import normalize_text
+
+
+MAX_LOCATOR_DEPTH = 32
+LOCATOR_CACHE_FILENAME = "locator_cache.json"
+LOCATOR_CACHE_VERSION = 1
+LOCATOR_AUTOSAVE_INTERVAL_S = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class LocatorStep:
+    control_type: str
+    automation_id: str
+    class_name: str
+
+
+LocatorPath = tuple[LocatorStep, ...]
+AppKey = tuple[str, str]
+
+
+def _element_step(element: object) -> LocatorStep:
+    info = getattr(element, "element_info")
+    return LocatorStep(
+        control_type=str(getattr(info, "control_type", "") or ""),
+        automation_id=str(getattr(info, "automation_id", "") or ""),
+        class_name=str(getattr(info, "class_name", "") or ""),
+    )
+
+
+def _step_matches(element: object, step: LocatorStep) -> bool:
+    info = getattr(element, "element_info")
+    return (
+        (getattr(info, "control_type", "") or "") == step.control_type
+        and (getattr(info, "automation_id", "") or "") == step.automation_id
+        and (getattr(info, "class_name", "") or "") == step.class_name
+    )
+
+
+def _element_handle(element: object) -> int:
+    return int(getattr(getattr(element, "element_info"), "handle", 0) or 0)
+
+
+def locator_path(window_handle: int, button: object) -> LocatorPath | None:
+    """
+    Steps from the window down to the button's parent, or None when the chain does not reach the window.
+    The window is recognised by its native handle; comparing wrappers would cost a CompareElements call per step.
+    """
+    if not window_handle:
+        return None
+    steps: list[LocatorStep] = []
+    current = getattr(button, "parent")()
+    while current is not None and len(steps) <= MAX_LOCATOR_DEPTH:
+        if _element_handle(current) == window_handle:
+            return tuple(reversed(steps))
+        steps.append(_element_step(current))
+        current = getattr(current, "parent")()
+    return None
+
+
+def resolve_path(window: object, path: LocatorPath) -> object | None:
+    """Follow the path child by child. Returns the container element, or None once a step is missing."""
+    current = window
+    for step in path:
+        current = next((child for child in getattr(current, "children")() if _step_matches(child, step)), None)
+        if current is None:
+            return None
+    return current
+
+
+@dataclass(slots=True)
+class _Hint:
+    path: LocatorPath
+    uses: int = 0
+
+
+class LocatorHints:
+    """
+    Per window handle: the ancestor path where a matching button was last found.
+    - A hinted scan only searches below that path.
+    - Every full_walk_every-th lookup returns no hint so the whole window is walked again.
+    - Hints are kept for the max_windows most recently used windows.
+    """
+
+    def __init__(self, max_windows: int = 256) -> None:
+        self._hints: BoundedLRU[int, _Hint] = BoundedLRU(max_windows)
+        self._lock = self._hints.lock
+        self.hits = 0
+        self.misses = 0
+        self.full_walks = 0
+
+    def __len__(self) -> int:
+        return len(self._hints)
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self._hints
+
+    def path_for(self, handle: int, full_walk_every: int) -> LocatorPath | None:
+        with self._lock:
+            hint = self._hints.get(handle)
+            if hint is None:
+                return None
+            hint.uses += 1
+            if hint.uses >= full_walk_every:
+                hint.uses = 0
+                self.full_walks += 1
+                return None
+            return hint.path
+
+    def remember(self, handle: int, path: LocatorPath) -> None:
+        self._hints.put(handle, _Hint(path=path))
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self, handle: int) -> None:
+        with self._lock:
+            self.misses += 1
+            self._hints.pop(handle)
+
+
+def button_texts_fingerprint(button_texts: list[str]) -> str:
+    labels = sorted({normalize_text(text) for text in button_texts if normalize_text(text)})
+    return hashlib.sha1("\n".join(labels).encode("utf-8")).hexdigest()
+
+
+class LocatorStore:
+    """
+    Locator paths per application, keyed by (process name, window class) so they survive restarts.
+    - Persisted as versioned JSON; a file with another version or larger than max_bytes is ignored.
+    - Paths were learned for one set of button_texts and are dropped when that set changes.
+    - Keeps the max_entries most recently used paths; a save drops the oldest until the file fits max_bytes.
+    - With autosave, a new or changed path is written out on a background timer, at most once per
+      min_interval_s, so a reboot or logoff that kills the process does not lose it.
+    """
+
+    def __init__(self, button_texts: list[str], *, max_entries: int = 64, max_bytes: int = 64 * 1024) -> None:
+        self._max_bytes = max(256, max_bytes)
+        self._paths: BoundedLRU[AppKey, LocatorPath] = BoundedLRU(max_entries)
+        # The path map's lock also guards the fingerprint and the autosave state.
+        self._lock = self._paths.lock
+        self._fingerprint = button_texts_fingerprint(button_texts)
+        self._dirty = False
+        self._autosave_path: Path | None = None
+        self._autosave_logger: logging.Logger | None = None
+        self._autosave_interval_s = LOCATOR_AUTOSAVE_INTERVAL_S
+        self._save_timer: threading.Timer | None = None
+        self._last_save = float("-inf")
+        self.warm_starts = 0
+        self.saves = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def bind_button_texts(self, button_texts: list[str]) -> None:
+        fingerprint = button_texts_fingerprint(button_texts)
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self._paths.clear()
+                self._mark_dirty()
+
+    def get(self, key: AppKey) -> LocatorPath | None:
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                self.warm_starts += 1
+            return path
+
+    def remember(self, key: AppKey, path: LocatorPath) -> None:
+        with self._lock:
+            changed = self._paths.peek(key) != path
+            self._paths.put(key, path)
+            if changed:
+                self._mark_dirty()
+
+    def autosave(
+        self,
+        path: Path,
+        logger: logging.Logger,
+        *,
+        min_interval_s: float = LOCATOR_AUTOSAVE_INTERVAL_S,
+    ) -> None:
+        with self._lock:
+            self._autosave_path = path
+            self._autosave_logger = logger
+            self._autosave_interval_s = max(0.0, min_interval_s)
+            if self._dirty:
+                self._schedule_save()
+
+    def flush(self) -> None:
+        """Cancel a pending autosave and write any unsaved change now."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+            path, logger = self._autosave_path, self._autosave_logger
+            dirty = self._dirty
+        if timer is not None:
+            timer.cancel()
+        if dirty and path is not None and logger is not None:
+            self.save(path, logger)
+
+    def _mark_dirty(self) -> None:
+        """Call with the lock held."""
+        self._dirty = True
+        if self._autosave_path is not None:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Call with the lock held."""
+        if self._save_timer is not None:
+            return
+        delay_s = max(0.0, self._last_save + self._autosave_interval_s - time.monotonic())
+        self._save_timer = threading.Timer(delay_s, self._autosave)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _autosave(self) -> None:
+        with self._lock:
+            self._save_timer = None
+            path, logger = self._autosave_path, self._autosave_logger
+        if path is not None and logger is not None:
+            self.save(path, logger)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        button_texts: list[str],
+        logger: logging.Logger,
+        *,
+        max_entries: int = 64,
+        max_bytes: int = 64 * 1024,
+    ) -> LocatorStore:
+        store = cls(button_texts, max_entries=max_entries, max_bytes=max_bytes)
+        try:
+            if not path.exists():
+                return store
+            if path.stat().st_size > store._max_bytes:
+                logger.warning("Ignoring oversized locator cache %s.", path)
+                return store
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != LOCATOR_CACHE_VERSION or data.get("button_texts") != store._fingerprint:
+                logger.info("Locator cache %s is stale. Starting cold.", path)
+                return store
+            for entry in data.get("entries", []):
+                steps = tuple(LocatorStep(*(str(part) for part in step)) for step in entry["path"])
+                store.remember((str(entry["process"]), str(entry["window_class"])), steps)
+            store._dirty = False
+        except Exception:
+            logger.warning("Failed to read locator cache %s. Starting cold.", path, exc_info=True)
+            return cls(button_texts, max_entries=max_entries, max_bytes=max_bytes)
+        return store
+
+    def save(self, path: Path, logger: logging.Logger) -> None:
+        with self._lock:
+            items = self._paths.items()
+            fingerprint = self._fingerprint
+            self._dirty = False
+            self._last_save = time.monotonic()
+            self.saves += 1
+        while True:
+            payload = json.dumps(
+                {
+                    "version": LOCATOR_CACHE_VERSION,
+                    "button_texts": fingerprint,
+                    "entries": [
+                        {
+                            "process": key[0],
+                            "window_class": key[1],
+                            "path": [[step.control_type, step.automation_id, step.class_name] for step in steps],
+                        }
+                        for key, steps in items
+                    ],
+                },
+                ensure_ascii=False,
+            )
+            if len(payload.encode("utf-8")) <= self._max_bytes or not items:
+                break
+            items.pop(0)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + ".tmp")
+            temp_path.write_text(payload, encoding="utf-8")
+            os.replace(temp_path, path)
+        except Exception:
+            with self._lock:
+                self._dirty = True
+            logger.warning("Failed to write locator cache %s.", path, exc_info=True)
+
+
+def app_key(process_name: str, window: object) -> AppKey:
+    class_name = getattr(getattr(window, "element_info"), "class_name", "") or ""
+    return (normalize_text(process_name), str(class_name))
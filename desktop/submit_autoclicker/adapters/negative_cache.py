@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from submit_autoclicker.core.lru import BoundedLRU
+
+
+@dataclass(slots=True)
+class _WindowRecord:
+    title: str
+    empty_scans: int = 0
+    backoff: int = 0
+    next_scan: int = 0
+
+
+class NegativeWindowCache:
+    """
+    Windows that never produce a matching button, keyed by handle.
+    - After `threshold` empty scans in a row a window is skipped, then re-scanned after
+      2, 4, 8, ... scan cycles, capped at max_backoff cycles.
+    - A title change or invalidate() (structure change) resets the window.
+    - Only the max_windows most recently recorded windows are tracked.
+    """
+
+    def __init__(self, max_windows: int = 512) -> None:
+        self._records: BoundedLRU[int, _WindowRecord] = BoundedLRU(max_windows)
+        self._lock = self._records.lock
+        self._cycle = 0
+        self._cycle_seen = 0
+        self._cycle_skipped = 0
+        self.last_seen = 0
+        self.last_skipped = 0
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def begin_cycle(self) -> None:
+        with self._lock:
+            if self._cycle_seen:
+                self.last_seen = self._cycle_seen
+                self.last_skipped = self._cycle_skipped
+            self._cycle += 1
+            self._cycle_seen = 0
+            self._cycle_skipped = 0
+
+    def skip_ratio(self) -> float:
+        with self._lock:
+            return self.last_skipped / self.last_seen if self.last_seen else 0.0
+
+    def should_skip(self, handle: int, title: str) -> bool:
+        with self._lock:
+            self._cycle_seen += 1
+            record = self._records.peek(handle)
+            if record is None:
+                return False
+            if record.title != title:
+                self._records.pop(handle)
+                return False
+            if self._cycle >= record.next_scan:
+                return False
+            self._cycle_skipped += 1
+            self.skipped += 1
+            return True
+
+    def record(self, handle: int, title: str, found: bool, *, threshold: int, max_backoff: int) -> None:
+        with self._lock:
+            if found:
+                self._records.pop(handle)
+                return
+            record = self._records.get(handle)
+            if record is None or record.title != title:
+                record = _WindowRecord(title=title)
+                self._records.put(handle, record)
+            record.empty_scans += 1
+            if record.empty_scans >= threshold:
+                record.backoff = min(max(2, record.backoff * 2), max(1, max_backoff))
+                record.next_scan = self._cycle + record.backoff
+
+    def invalidate(self, handle: int | None) -> None:
+        """Forget one window, or every window when the handle is unknown."""
+        if handle is None:
+            self._records.clear()
+        else:
+            self._records.pop(handle)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import ModuleType
+
+import psutil
+
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import normalize_text
+
+
+@dataclass(slots=True)
+class _ProcessEntry:
+    name: str
+    create_time: float
+    checked_at: float
+
+
+class ProcessNameCache:
+    """
+    pid -> process name lookups shared by the adapters.
+    - Entries younger than revalidate_interval_s are served without a syscall.
+    - Older entries are revalidated by create_time, so a reused pid is detected and re-resolved.
+    - Names are kept for the max_entries most recently looked-up pids.
+    """
+
+    def __init__(
+        self,
+        *,
+        psutil_module: ModuleType | object = psutil,
+        max_entries: int = 512,
+        revalidate_interval_s: float = 2.0,
+        monotonic_fn=time.monotonic,
+    ) -> None:
+        self._psutil = psutil_module
+        self._revalidate_interval_s = revalidate_interval_s
+        self._monotonic_fn = monotonic_fn
+        self._entries: BoundedLRU[int, _ProcessEntry] = BoundedLRU(max_entries)
+        self._lock = self._entries.lock
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def name(self, pid: int) -> str:
+        now = self._monotonic_fn()
+        with self._lock:
+            entry = self._entries.get(pid)
+            if entry is not None and now - entry.checked_at < self._revalidate_interval_s:
+                self.hits += 1
+                return entry.name
+
+        try:
+            process = self._psutil.Process(pid)
+            create_time = process.create_time()
+            if entry is not None and create_time == entry.create_time:
+                with self._lock:
+                    entry.checked_at = now
+                    self.revalidations += 1
+                return entry.name
+            name = process.name()
+        except Exception:
+            self.forget(pid)
+            raise
+
+        with self._lock:
+            if entry is not None:
+                self.stale += 1
+            self.misses += 1
+            self._entries.put(pid, _ProcessEntry(name=name, create_time=create_time, checked_at=now))
+        return name
+
+    def forget(self, pid: int) -> None:
+        self._entries.pop(pid)
+
+
+class ProcessPresenceGate:
+    """
+    Live set of pids whose process name is allowlisted, refreshed from the process table
+    at most once per refresh interval (or sooner after invalidate()).
+    An empty set means no allowlisted process is running and UIA enumeration can be skipped.
+    """
+
+    def __init__(
+        self,
+        *,
+        psutil_module: ModuleType | object = psutil,
+        monotonic_fn=time.monotonic,
+    ) -> None:
+        self._psutil = psutil_module
+        self._monotonic_fn = monotonic_fn
+        self._lock = threading.Lock()
+        self._allowed_names: frozenset[str] = frozenset()
+        self._pids: frozenset[int] = frozenset()
+        self._refreshed_at = float("-inf")
+        self.refreshes = 0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._refreshed_at = float("-inf")
+
+    def pids(self, allowed_processes: Iterable[str], refresh_interval_s: float) -> frozenset[int]:
+        allowed_names = frozenset(normalize_text(name) for name in allowed_processes if normalize_text(name))
+        now = self._monotonic_fn()
+        with self._lock:
+            if allowed_names == self._allowed_names and now - self._refreshed_at < refresh_interval_s:
+                return self._pids
+
+        pids: set[int] = set()
+        for process in self._psutil.process_iter(["name"]):
+            try:
+                name = process.info.get("name") or ""
+            except Exception:
+                continue
+            if normalize_text(name) in allowed_names:
+                pids.add(process.pid)
+
+        with self._lock:
+            self._allowed_names = allowed_names
+            self._pids = frozenset(pids)
+            self._refreshed_at = now
+            self.refreshes += 1
+            return self._pids
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from submit_autoclicker.core.lru import BoundedLRU
+
+
+class WindowRecency:
+    """
+    Allowlisted window handles in the order they last had the foreground.
+    - note_foreground() moves a handle to the front; a change of foreground window is counted.
+    - Only the max_windows most recently focused windows are kept.
+    """
+
+    def __init__(self, max_windows: int = 64) -> None:
+        self._handles: BoundedLRU[int, bool] = BoundedLRU(max_windows)
+        self._current: int | None = None
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def note_foreground(self, handle: int) -> None:
+        with self._handles.lock:
+            if handle != self._current:
+                self._current = handle
+                self.changes += 1
+            self._handles.put(handle, True)
+
+    def recent(self, count: int) -> list[int]:
+        """Up to count handles, most recently focused first."""
+        handles = list(reversed(self._handles.keys()))
+        return handles[: max(0, count)]
+
+    def retain(self, handles: set[int]) -> None:
+        """Drop windows that are gone (called after a full sweep)."""
+        self._handles.discard_where(lambda handle: handle not in handles)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+
+try:
+    from pywinauto import Desktop
+except ImportError:  # pragma: no cover - environment dependent
+    Desktop = None  # type: ignore[assignment]
+
+
+def _uia_desktop() -> object:
+    return Desktop(backend="uia")
+
+
+class AutomationSession:
+    """
+    Long-lived UIA desktop shared by the adapters.
+    COM objects are apartment-bound, so one desktop is kept per thread. It is only
+    rebuilt after a call through it fails.
+    """
+
+    def __init__(self, logger: logging.Logger, desktop_factory: Callable[[], object] | None = None) -> None:
+        self._logger = logger
+        self._desktop_factory = desktop_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.constructions = 0
+        self.failures = 0
+
+    @property
+    def available(self) -> bool:
+        return self._desktop_factory is not None or Desktop is not None
+
+    def desktop(self) -> object:
+        desktop = getattr(self._local, "desktop", None)
+        if desktop is None:
+            factory = self._desktop_factory or _uia_desktop
+            desktop = factory()
+            self._local.desktop = desktop
+            with self._lock:
+                self.constructions += 1
+        return desktop
+
+    def invalidate(self) -> None:
+        self._local.desktop = None
+        with self._lock:
+            self.failures += 1
+
+    def windows(self) -> list[object]:
+        try:
+            return list(self.desktop().windows())
+        except Exception:
+            self._logger.exception("Failed to enumerate top-level windows. Rebuilding automation session.")
+            self.invalidate()
+            return []
+
+    def window_from_handle(self, handle: int) -> object | None:
+        """Top-level window by native handle, or None when it is already gone."""
+        try:
+            return self.desktop().window(handle=handle).wrapper_object()
+        except Exception:
+            self._logger.debug("Unable to resolve window %s.", handle, exc_info=True)
+            return None
+
+    def active_window(self) -> object | None:
+        try:
+            return self.desktop().get_active()
+        except Exception:
+            self._logger.debug("Unable to resolve active window. Rebuilding automation session.", exc_info=True)
+            self.invalidate()
+            return None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+
+BUDGET_NODES = "nodes"
+BUDGET_DEPTH = "depth"
+BUDGET_TIME = "time"
+
+CONTAINER_HINTS = ("chat", "input", "dialog", "prompt", "notification")
+
+_RANK_LIKELY = 0
+_RANK_TOOLBAR = 1
+_RANK_CONTAINER = 2
+_RANK_OTHER = 3
+_RANK_LEAF = 4
+
+_CONTAINERS = frozenset({"Group", "Pane", "Custom", "Document"})
+_LEAVES = frozenset({"Text", "Edit", "Image", "Hyperlink", "ListItem", "TreeItem", "MenuItem", "TabItem", "Separator"})
+
+
+@dataclass(frozen=True, slots=True)
+class WalkBudget:
+    """Limits for one window walk. 0 disables a limit."""
+
+    max_nodes: int = 0
+    max_depth: int = 0
+    time_budget_s: float = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_nodes or self.max_depth or self.time_budget_s)
+
+
+def _safe_children(element: object) -> list[object]:
+    try:
+        return list(getattr(element, "children")())
+    except Exception:
+        return []
+
+
+def _control_type(element: object) -> str:
+    try:
+        return str(getattr(getattr(element, "element_info"), "control_type", "") or "")
+    except Exception:
+        return ""
+
+
+def _container_rank(element: object, control_type: str) -> int:
+    if control_type == "Window":
+        return _RANK_LIKELY
+    if control_type == "ToolBar":
+        return _RANK_TOOLBAR
+    if control_type in _LEAVES:
+        return _RANK_LEAF
+    if control_type not in _CONTAINERS:
+        return _RANK_OTHER
+    try:
+        automation_id = str(getattr(getattr(element, "element_info"), "automation_id", "") or "").casefold()
+    except Exception:
+        automation_id = ""
+    if any(hint in automation_id for hint in CONTAINER_HINTS):
+        return _RANK_LIKELY
+    return _RANK_CONTAINER
+
+
+def iter_buttons_prioritized(
+    root: object,
+    budget: WalkBudget,
+    *,
+    on_exhausted: Callable[[str], None],
+    monotonic_fn: Callable[[], float] = time.monotonic,
+) -> Iterator[object]:
+    """
+    Best-first walk below root that yields Button elements.
+    Dialogs and containers whose automation id looks like a chat/input region are expanded
+    first, then toolbars, then other containers, and leaf-like elements last. The walk stops when the node
+    or time budget runs out; containers at max_depth are not expanded. on_exhausted is told
+    which limit cut the walk short, once per limit.
+    """
+    deadline = monotonic_fn() + budget.time_budget_s if budget.time_budget_s else None
+    order = itertools.count()
+    heap: list[tuple[int, int, int, object]] = [(_RANK_LIKELY, 0, next(order), root)]
+    visited = 0
+    depth_reported = False
+
+    while heap:
+        _, depth, _, node = heapq.heappop(heap)
+        if budget.max_depth and depth >= budget.max_depth:
+            if not depth_reported:
+                depth_reported = True
+                on_exhausted(BUDGET_DEPTH)
+            continue
+        if deadline is not None and monotonic_fn() >= deadline:
+            on_exhausted(BUDGET_TIME)
+            return
+
+        for child in _safe_children(node):
+            if budget.max_nodes and visited >= budget.max_nodes:
+                on_exhausted(BUDGET_NODES)
+                return
+            visited += 1
+            control_type = _control_type(child)
+            if control_type == "Button":
+                yield child
+                continue
+            heapq.heappush(heap, (_container_rank(child, control_type), depth + 1, next(order), child))
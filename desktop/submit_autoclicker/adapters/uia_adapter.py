@@ -2,83 +2,656 @@ from __future__ import annotations
 
 import ctypes
 import logging
+import threading
 import time
-from collections.abc import Iterable
-
-import psutil
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from functools import partial
 
+from submit_autoclicker.adapters.locator import (
+    LocatorHints,
+    LocatorPath,
+    LocatorStore,
+    app_key,
+    locator_path,
+    resolve_path,
+)
+from submit_autoclicker.adapters.negative_cache import NegativeWindowCache
+from submit_autoclicker.adapters.process_cache import ProcessNameCache, ProcessPresenceGate
+from submit_autoclicker.adapters.recency import WindowRecency
+from submit_autoclicker.adapters.session import AutomationSession
+from submit_autoclicker.adapters.tree_walk import WalkBudget, iter_buttons_prioritized
+from submit_autoclicker.adapters.uia_backend import (
+    NEAR_TEXT_MAX_CHARS,
+    NEAR_TEXT_MAX_NODES,
+    Condition,
+    ConditionSearch,
+    SubtreeFetcher,
+    SubtreeSnapshot,
+    UIACacheFetcher,
+    UIAConditionSearch,
+    button_name_condition,
+)
 from submit_autoclicker.config import AppConfig
-from submit_autoclicker.core.policy import AllowlistPolicy, button_text_matches
-from submit_autoclicker.models import ButtonCandidate, WindowIdentity
+from submit_autoclicker.core.events import EVENT_STRUCTURE_CHANGED, EVENT_WINDOW_OPENED, ChangeCallback
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import CompiledPolicy, PolicySlot
+from submit_autoclicker.core.scheduler import SCAN_TIER_FULL, SCAN_TIER_RECENT
+from submit_autoclicker.models import ButtonCandidate, ChangeEvent, NearTextLoader, WindowIdentity
 
 try:
-    from pywinauto import Desktop
+    import comtypes
+    from pywinauto.uia_defines import IUIA
 except ImportError:  # pragma: no cover - environment dependent
-    Desktop = None  # type: ignore[assignment]
+    comtypes = None  # type: ignore[assignment]
+    IUIA = None  # type: ignore[assignment]
+
+
+UIA_WINDOW_OPENED_EVENT_ID = 20016
+TREE_SCOPE_SUBTREE = 7
+
+
+def _create_uia_event_handler(interface_name: str, on_event: Callable[[object], None]) -> object:
+    interface = getattr(IUIA().UIA_dll, interface_name)
+
+    class _Handler(comtypes.COMObject):
+        _com_interfaces_ = [interface]
+
+        def HandleAutomationEvent(self, sender: object, event_id: int) -> None:
+            on_event(sender)
+
+        def HandleStructureChangedEvent(self, sender: object, change_type: int, runtime_id: object) -> None:
+            on_event(sender)
+
+    return _Handler()
+
+
+class UIAEventSource:
+    """
+    Change event source backed by UI Automation.
+    - Window-opened events are subscribed once on the desktop root.
+    - Structure-changed events are subscribed per allowlisted window as the adapter discovers them.
+    """
+
+    name = "uia_events"
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_watched_windows: int = 64,
+        *,
+        on_window_opened: Callable[[], None] | None = None,
+    ) -> None:
+        self._logger = logger
+        self._on_window_opened_hook = on_window_opened
+        self._max_watched_windows = max(1, max_watched_windows)
+        self._lock = threading.Lock()
+        self._callback: ChangeCallback | None = None
+        self._root_handler: object | None = None
+        self._watched: dict[int, tuple[object, object]] = {}
+
+    @property
+    def active(self) -> bool:
+        with self._lock:
+            return self._callback is not None
+
+    def start(self, callback: ChangeCallback) -> bool:
+        if IUIA is None or comtypes is None:
+            return False
+        with self._lock:
+            if self._callback is not None:
+                return True
+            try:
+                uia = IUIA()
+                handler = _create_uia_event_handler("IUIAutomationEventHandler", self._on_window_opened)
+                uia.iuia.AddAutomationEventHandler(
+                    UIA_WINDOW_OPENED_EVENT_ID,
+                    uia.root,
+                    TREE_SCOPE_SUBTREE,
+                    None,
+                    handler,
+                )
+            except Exception:
+                self._logger.warning("Failed to subscribe to UIA window-opened events.", exc_info=True)
+                return False
+            self._callback = callback
+            self._root_handler = handler
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            was_active = self._callback is not None
+            self._callback = None
+            self._root_handler = None
+            self._watched.clear()
+        if not was_active:
+            return
+        try:
+            IUIA().iuia.RemoveAllEventHandlers()
+        except Exception:
+            self._logger.debug("Failed to remove UIA event handlers.", exc_info=True)
+
+    def is_watching(self, handle: int) -> bool:
+        with self._lock:
+            return self._callback is not None and handle in self._watched
+
+    def watch_window(self, window: object, handle: int | None) -> None:
+        """Subscribe to structure changes below one allowlisted window. Must not run inside a UIA callback."""
+        if not handle:
+            return
+        with self._lock:
+            if self._callback is None or handle in self._watched:
+                return
+            if len(self._watched) >= self._max_watched_windows:
+                return
+
+        element = getattr(getattr(window, "element_info", None), "element", None)
+        if element is None:
+            return
+        try:
+            handler = _create_uia_event_handler(
+                "IUIAutomationStructureChangedEventHandler",
+                lambda sender: self._emit(EVENT_STRUCTURE_CHANGED, handle),
+            )
+            IUIA().iuia.AddStructureChangedEventHandler(element, TREE_SCOPE_SUBTREE, None, handler)
+        except Exception:
+            self._logger.debug("Failed to subscribe to structure changes for window %s.", handle, exc_info=True)
+            return
+        with self._lock:
+            self._watched[handle] = (element, handler)
+
+    def retain_windows(self, handles: set[int]) -> None:
+        """Drop structure-changed subscriptions for windows that are gone."""
+        with self._lock:
+            stale = [(handle, pair) for handle, pair in self._watched.items() if handle not in handles]
+            for handle, _ in stale:
+                del self._watched[handle]
+        for handle, (element, handler) in stale:
+            try:
+                IUIA().iuia.RemoveStructureChangedEventHandler(element, handler)
+            except Exception:
+                self._logger.debug("Failed to unsubscribe window %s.", handle, exc_info=True)
+
+    def _on_window_opened(self, sender: object) -> None:
+        try:
+            handle = int(getattr(sender, "CurrentNativeWindowHandle", 0)) or None
+        except Exception:
+            handle = None
+        if self._on_window_opened_hook is not None:
+            self._on_window_opened_hook()
+        self._emit(EVENT_WINDOW_OPENED, handle)
+
+    def _emit(self, kind: str, handle: int | None) -> None:
+        with self._lock:
+            callback = self._callback
+        if callback is not None:
+            callback(ChangeEvent(kind=kind, handle=handle))
 
 
 class UIAAdapter:
     name = "uia"
 
-    def __init__(self, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        session: AutomationSession | None = None,
+        process_name_fn: Callable[[int], str] | None = None,
+        presence_gate: ProcessPresenceGate | None = None,
+        tree_fetcher: SubtreeFetcher | None = None,
+        condition_search: ConditionSearch | None = None,
+        locator_hints: LocatorHints | None = None,
+        locator_store: LocatorStore | None = None,
+        monotonic_fn: Callable[[], float] = time.monotonic,
+        negative_cache: NegativeWindowCache | None = None,
+        foreground_fn: Callable[[], int | None] | None = None,
+        recency: WindowRecency | None = None,
+    ) -> None:
         self._logger = logger
         self._warned_missing_dep = False
+        self._session = session or AutomationSession(logger)
+        self._process_name_fn = process_name_fn or ProcessNameCache().name
+        self._presence_gate = presence_gate or ProcessPresenceGate()
+        self._tree_fetcher = tree_fetcher or UIACacheFetcher()
+        self._condition_search = condition_search or UIAConditionSearch()
+        self._button_condition: tuple[tuple[str, ...], Condition | None] = ((), None)
+        self._locator_hints = locator_hints or LocatorHints()
+        self._locator_store = locator_store
+        self._warm_start_tried: set[int] = set()
+        self._monotonic_fn = monotonic_fn
+        self._walk_exhaustions: BoundedLRU[str, Counter[str]] = BoundedLRU(64)
+        self._walk_exhausted_total = 0
+        self._negative_cache = negative_cache or NegativeWindowCache()
+        self._foreground_fn = foreground_fn or self._foreground_handle
+        self._recency = recency or WindowRecency()
+        self._scan_tier = SCAN_TIER_FULL
+        self._last_scan_tier = SCAN_TIER_FULL
+        self._windows_skipped_by_tier = 0
+        self._policy_slot = PolicySlot()
+        # A new window may belong to a process started since the last process-table refresh.
+        self.event_source = UIAEventSource(logger, on_window_opened=self._presence_gate.invalidate)
+        self._gated_scans = 0
+        self._windows_skipped_by_pid = 0
+        self._subtree_fetches = 0
+        self._condition_searches = 0
+        self._near_text_collections = 0
+
+    def bind_policy(self, policy: CompiledPolicy) -> None:
+        self._policy_slot.bind(policy)
+
+    def foreground_handle(self) -> int | None:
+        return self._foreground_fn()
+
+    def is_allowlisted_window(self, handle: int, config: AppConfig) -> bool:
+        """Whether a window (e.g. one that just opened) passes the process and title allowlists."""
+        window = self._session.window_from_handle(handle)
+        if window is None:
+            return False
+        identity = self._window_identity(window, self._safe_process_id(window))
+        return identity is not None and self._policy_slot.for_config(config).is_window_allowed(identity)
+
+    def is_watching_window(self, handle: int) -> bool:
+        """Whether changes below the window arrive as structure-changed events."""
+        return self.event_source.is_watching(handle)
+
+    def set_scan_tier(self, tier: str) -> None:
+        """Windows the next scan covers when foreground_tiering is on. Applies to one scan only."""
+        self._scan_tier = tier
+
+    def metrics(self) -> dict[str, object]:
+        return {
+            "gated_scans": self._gated_scans,
+            "windows_skipped_by_pid": self._windows_skipped_by_pid,
+            "desktop_constructions": self._session.constructions,
+            "subtree_fetches": self._subtree_fetches,
+            "condition_searches": self._condition_searches,
+            "near_text_collections": self._near_text_collections,
+            "walk_budget_exhausted": self._walk_exhausted_total,
+            "walk_budget_windows": {window: dict(reasons) for window, reasons in self._walk_exhaustions.items()},
+            "negative_cache_windows": len(self._negative_cache),
+            "negative_cache_skipped": self._negative_cache.skipped,
+            "negative_cache_skip_ratio": round(self._negative_cache.skip_ratio(), 3),
+            "scan_tier": self._last_scan_tier,
+            "windows_skipped_by_tier": self._windows_skipped_by_tier,
+            "foreground_changes": self._recency.changes,
+            "recent_windows": len(self._recency),
+            "locator_hits": self._locator_hints.hits,
+            "locator_misses": self._locator_hints.misses,
+            "locator_full_walks": self._locator_hints.full_walks,
+            "locator_warm_starts": self._locator_store.warm_starts if self._locator_store else 0,
+        }
+
+    def on_change_events(self, events: list[ChangeEvent]) -> None:
+        """A structure change below a window may have added the button it never had."""
+        for event in events:
+            if event.kind == EVENT_WINDOW_OPENED and event.handle is None:
+                continue
+            self._negative_cache.invalidate(event.handle)
 
     def scan(self, config: AppConfig) -> list[ButtonCandidate]:
-        if Desktop is None:
+        return list(self._iter_candidates(config, skip_rejected=False))
+
+    def iter_scan(self, config: AppConfig) -> Iterator[ButtonCandidate]:
+        """
+        Lazily yield candidates. Disabled buttons are dropped before near-text collection
+        when the config requires enabled buttons, and the walk stops once the caller stops pulling.
+        With suppress_repeat_clicks disabled buttons are still yielded, so the engine sees a clicked
+        button go busy and can click it again once it is re-enabled for the next prompt.
+        """
+        return self._iter_candidates(config, skip_rejected=True)
+
+    def _iter_candidates(self, config: AppConfig, *, skip_rejected: bool) -> Iterator[ButtonCandidate]:
+        if not self._session.available:
             if not self._warned_missing_dep:
                 self._logger.warning("pywinauto is not installed. UIA adapter disabled.")
                 self._warned_missing_dep = True
-            return []
+            return
+
+        policy = self._policy_slot.for_config(config)
+
+        allowed_pids = self._allowed_pids(config)
+        if allowed_pids is not None and not allowed_pids:
+            self._gated_scans += 1
+            return
+
+        if config.locator_hints and self._locator_store is not None:
+            self._locator_store.bind_button_texts(config.button_texts)
+
+        windows = self._session.windows()
+        tier_handles, foreground = self._tier_scope(config)
+        if config.negative_cache:
+            self._negative_cache.begin_cycle()
+        allowed_handles: set[int] = set()
+        allowed: Iterable[tuple[object, WindowIdentity]] = self._allowed_windows(
+            windows, config, policy, allowed_pids, tier_handles, foreground, allowed_handles
+        )
+        if self.event_source.active:
+            # The caller may stop at the first match, so subscribe every allowlisted window up front.
+            allowed = list(allowed)
+            for window, identity in allowed:
+                self.event_source.watch_window(window, identity.handle)
+            # A tiered scan only saw some of the windows, so it cannot tell which ones are gone.
+            if tier_handles is None:
+                self.event_source.retain_windows(allowed_handles)
 
-        policy = AllowlistPolicy(config.allowed_processes, config.allowed_window_title_contains)
-        candidates: list[ButtonCandidate] = []
+        for window, identity in allowed:
+            if config.negative_cache and identity.handle:
+                if self._negative_cache.should_skip(identity.handle, identity.title):
+                    continue
+                found = yield from self._iter_window_candidates(window, identity, policy, config, skip_rejected)
+                self._negative_cache.record(
+                    identity.handle,
+                    identity.title,
+                    found,
+                    threshold=config.negative_cache_threshold,
+                    max_backoff=config.negative_cache_max_backoff,
+                )
+                continue
+            yield from self._iter_window_candidates(window, identity, policy, config, skip_rejected)
 
-        desktop = Desktop(backend="uia")
-        windows = self._safe_windows(desktop.windows())
+        if tier_handles is None and config.foreground_tiering:
+            self._recency.retain(allowed_handles)
 
+    def _allowed_windows(
+        self,
+        windows: Iterable[object],
+        config: AppConfig,
+        policy: CompiledPolicy,
+        allowed_pids: frozenset[int] | None,
+        tier_handles: frozenset[int] | None,
+        foreground: int | None,
+        allowed_handles: set[int],
+    ) -> Iterator[tuple[object, WindowIdentity]]:
+        """Top-level windows in this scan's tier that pass the process gate and the window allowlist."""
         for window in windows:
-            identity = self._window_identity(window)
+            if tier_handles is not None and self._safe_handle(window) not in tier_handles:
+                self._windows_skipped_by_tier += 1
+                continue
+            process_id = self._safe_process_id(window)
+            if allowed_pids is not None and process_id not in allowed_pids:
+                self._windows_skipped_by_pid += 1
+                continue
+            identity = self._window_identity(window, process_id)
             if not identity:
                 continue
-            if not policy.is_allowed(identity):
+            if not policy.is_window_allowed(identity):
                 continue
+            if identity.handle:
+                allowed_handles.add(identity.handle)
+                if config.foreground_tiering and identity.handle == foreground:
+                    self._recency.note_foreground(identity.handle)
+            yield window, identity
 
-            for button in self._safe_descendants(window, control_type="Button"):
-                button_text = self._safe_text(button)
-                if not button_text:
-                    continue
-                if not button_text_matches(button_text, config.button_texts):
-                    continue
+    def _tier_scope(self, config: AppConfig) -> tuple[frozenset[int] | None, int | None]:
+        """
+        Handles this scan is limited to (None = every window) and the foreground handle.
+        Without a known foreground window the recent windows are scanned; with no recent windows either, all of them.
+        """
+        tier, self._scan_tier = self._scan_tier, SCAN_TIER_FULL
+        if not config.foreground_tiering:
+            return None, None
+        foreground = self._foreground_fn()
+        handles: set[int] = set()
+        if tier != SCAN_TIER_FULL:
+            if tier == SCAN_TIER_RECENT or foreground is None:
+                handles.update(self._recency.recent(config.recent_window_count))
+            if foreground is not None:
+                handles.add(foreground)
+        self._last_scan_tier = tier if handles else SCAN_TIER_FULL
+        return (frozenset(handles) if handles else None), foreground
 
-                enabled = self._safe_is_enabled(button)
-                near_text = self._collect_near_text(button)
-                click_action = self._build_click_action(
-                    button,
-                    identity,
-                    button_text,
-                    preserve_focus=config.preserve_focus,
-                    focus_restore_delay_ms=config.focus_restore_delay_ms,
-                )
-                candidates.append(
-                    ButtonCandidate(
-                        window=identity,
-                        button_text=button_text,
-                        enabled=enabled,
-                        near_text=near_text,
-                        source=self.name,
-                        click_action=click_action,
-                    )
+    def _iter_window_candidates(
+        self,
+        window: object,
+        identity: WindowIdentity,
+        policy: CompiledPolicy,
+        config: AppConfig,
+        skip_rejected: bool,
+    ) -> Generator[ButtonCandidate, None, bool]:
+        """Yield the window's candidates and return whether any button label matched."""
+        handle = identity.handle if config.locator_hints else None
+        if handle:
+            container = self._hinted_container(window, identity, config)
+            if container is not None:
+                hit: list[object] = []
+
+                def _hit(button: object) -> None:
+                    hit.append(button)
+                    self._locator_hints.record_hit()
+
+                yield from self._iter_root_candidates(
+                    container, identity, policy, config, skip_rejected, on_first_match=_hit
                 )
+                if hit:
+                    return True
+                self._locator_hints.record_miss(handle)
+
+        def _learn(button: object) -> None:
+            if handle:
+                self._remember_locator(window, identity, button)
+
+        matched = yield from self._iter_root_candidates(
+            window, identity, policy, config, skip_rejected, on_first_match=_learn
+        )
+        return matched
+
+    def _iter_root_candidates(
+        self,
+        root: object,
+        identity: WindowIdentity,
+        policy: CompiledPolicy,
+        config: AppConfig,
+        skip_rejected: bool,
+        *,
+        on_first_match: Callable[[object], None],
+    ) -> Generator[ButtonCandidate, None, bool]:
+        """
+        Candidates below root (a window or a hinted container). on_first_match sees the first
+        label match; the return value tells whether there was one.
+        """
+        snapshot = self._fetch_subtree(root) if config.batched_uia_fetch else None
+        if snapshot is not None:
+            matched = yield from self._iter_snapshot_candidates(
+                snapshot, identity, policy, config, skip_rejected, on_first_match
+            )
+            return matched
 
-        return candidates
+        matched = False
+        for button in self._find_buttons(root, identity, config):
+            button_text = self._safe_text(button)
+            if not button_text:
+                continue
+            if not policy.button_matcher.matches(button_text):
+                continue
+            if not matched:
+                matched = True
+                on_first_match(button)
+
+            enabled = self._safe_is_enabled(button)
+            if not enabled and self._skips_disabled(config, skip_rejected):
+                continue
+            near_text = partial(self._collect_near_text, button)
+            # The runtime id tells a fresh prompt's button from the one just clicked.
+            needs_id = config.incremental_scans or config.suppress_repeat_clicks
+            element_id = self._safe_runtime_id(button) if needs_id else None
+            yield self._build_candidate(button, identity, button_text, enabled, near_text, config, element_id)
+        return matched
 
-    def _safe_windows(self, windows: Iterable[object]) -> list[object]:
+    def _hinted_container(self, window: object, identity: WindowIdentity, config: AppConfig) -> object | None:
+        handle = identity.handle
+        if handle in self._locator_hints:
+            path = self._locator_hints.path_for(handle, config.locator_full_walk_every)
+        else:
+            path = self._warm_start_path(window, identity)
+        if path is None:
+            return None
         try:
-            return list(windows)
+            container = resolve_path(window, path)
         except Exception:
-            self._logger.exception("Failed to enumerate top-level windows.")
-            return []
+            self._logger.debug("Failed to follow locator hint for window %s.", handle, exc_info=True)
+            container = None
+        if container is None:
+            self._locator_hints.record_miss(handle)
+        return container
+
+    def _warm_start_path(self, window: object, identity: WindowIdentity) -> LocatorPath | None:
+        """Persisted path for this application, tried once per new window handle."""
+        if self._locator_store is None or not len(self._locator_store):
+            return None
+        if identity.handle in self._warm_start_tried:
+            return None
+        if len(self._warm_start_tried) >= 1024:
+            self._warm_start_tried.clear()
+        self._warm_start_tried.add(identity.handle)
+        try:
+            path = self._locator_store.get(app_key(identity.process_name, window))
+        except Exception:
+            self._logger.debug("Failed to read window class for locator warm start.", exc_info=True)
+            return None
+        if path is not None:
+            self._locator_hints.remember(identity.handle, path)
+        return path
+
+    def _remember_locator(self, window: object, identity: WindowIdentity, button: object) -> None:
+        try:
+            path = locator_path(identity.handle, button)
+            if path is None:
+                return
+            self._locator_hints.remember(identity.handle, path)
+            if self._locator_store is not None:
+                self._locator_store.remember(app_key(identity.process_name, window), path)
+        except Exception:
+            self._logger.debug("Failed to record locator path for window %s.", identity.handle, exc_info=True)
+
+    def _iter_snapshot_candidates(
+        self,
+        snapshot: SubtreeSnapshot,
+        identity: WindowIdentity,
+        policy: CompiledPolicy,
+        config: AppConfig,
+        skip_rejected: bool,
+        on_first_match: Callable[[object], None],
+    ) -> Generator[ButtonCandidate, None, bool]:
+        """Candidates from a cached subtree: matching and near text cost no further UIA calls."""
+        matched = False
+        for index in snapshot.find("Button"):
+            node = snapshot.nodes[index]
+            button_text = node.name.strip()
+            if not button_text:
+                continue
+            if not policy.button_matcher.matches(button_text):
+                continue
+            button = self._tree_fetcher.wrap(node.element)
+            if not matched:
+                matched = True
+                on_first_match(button)
+            if not node.enabled and self._skips_disabled(config, skip_rejected):
+                continue
+            near_text = partial(snapshot.near_text, index)
+            yield self._build_candidate(
+                button, identity, button_text, node.enabled, near_text, config, node.runtime_id
+            )
+        return matched
+
+    @staticmethod
+    def _skips_disabled(config: AppConfig, skip_rejected: bool) -> bool:
+        return skip_rejected and config.require_button_enabled and not config.suppress_repeat_clicks
+
+    def _build_candidate(
+        self,
+        button: object,
+        identity: WindowIdentity,
+        button_text: str,
+        enabled: bool,
+        near_text: NearTextLoader,
+        config: AppConfig,
+        element_id: tuple[int, ...] | None = None,
+    ) -> ButtonCandidate:
+        click_action = self._build_click_action(
+            button,
+            identity,
+            button_text,
+            preserve_focus=config.preserve_focus,
+            focus_restore_delay_ms=config.focus_restore_delay_ms,
+        )
+        return ButtonCandidate(
+            window=identity,
+            button_text=button_text,
+            enabled=enabled,
+            near_text=near_text,
+            source=self.name,
+            click_action=click_action,
+            element_id=element_id,
+            verify_action=partial(self._click_took_effect, button),
+        )
+
+    def _fetch_subtree(self, window: object) -> SubtreeSnapshot | None:
+        """One-round-trip snapshot of the window, or None to fall back to the per-element walk."""
+        if not self._tree_fetcher.available:
+            return None
+        try:
+            snapshot = self._tree_fetcher.fetch_subtree(window)
+        except Exception:
+            self._logger.debug("Batched subtree fetch failed. Walking the window element by element.", exc_info=True)
+            return None
+        self._subtree_fetches += 1
+        return snapshot
+
+    def _find_buttons(self, window: object, identity: WindowIdentity, config: AppConfig) -> Iterable[object]:
+        """
+        Buttons of one window: a budgeted best-first walk when limits are configured, otherwise
+        one descendants query, name-filtered inside UIA when possible. Callers still apply the matcher.
+        """
+        budget = WalkBudget(
+            max_nodes=config.walk_node_budget,
+            max_depth=config.walk_max_depth,
+            time_budget_s=config.walk_time_budget_ms / 1000.0,
+        )
+        if budget.enabled:
+            return iter_buttons_prioritized(
+                window,
+                budget,
+                on_exhausted=partial(self._record_walk_exhausted, identity),
+                monotonic_fn=self._monotonic_fn,
+            )
+        if config.uia_name_conditions and self._condition_search.available:
+            condition = self._name_condition(config.button_texts)
+            if condition is not None:
+                try:
+                    found = self._condition_search.find_all(window, condition)
+                except Exception:
+                    self._logger.debug("Conditional button search failed. Walking all buttons.", exc_info=True)
+                else:
+                    self._condition_searches += 1
+                    return found
+        return self._safe_descendants(window, control_type="Button")
+
+    def _record_walk_exhausted(self, identity: WindowIdentity, reason: str) -> None:
+        key = f"{identity.title} ({identity.handle:#x})" if identity.handle else identity.title
+        reasons = self._walk_exhaustions.get(key)
+        if reasons is None:
+            reasons = Counter()
+            self._walk_exhaustions.put(key, reasons)
+        reasons[reason] += 1
+        self._walk_exhausted_total += 1
+
+    def _name_condition(self, button_texts: list[str]) -> Condition | None:
+        key = tuple(button_texts)
+        cached_key, condition = self._button_condition
+        if cached_key != key:
+            condition = button_name_condition(button_texts)
+            self._button_condition = (key, condition)
+        return condition
+
+    def _allowed_pids(self, config: AppConfig) -> frozenset[int] | None:
+        """Pids of running allowlisted processes, or None when the gate does not apply."""
+        if config.process_gate_refresh_ms <= 0 or not config.allowed_processes:
+            return None
+        try:
+            return self._presence_gate.pids(config.allowed_processes, config.process_gate_refresh_ms / 1000.0)
+        except Exception:
+            self._logger.debug("Process table refresh failed. Scanning without the presence gate.", exc_info=True)
+            return None
 
     def _safe_descendants(self, window: object, **kwargs: object) -> list[object]:
         try:
@@ -112,37 +685,85 @@ class UIAAdapter:
         except Exception:
             return False
 
-    def _window_identity(self, window: object) -> WindowIdentity | None:
+    def _safe_handle(self, window: object) -> int:
+        try:
+            return int(getattr(window, "handle", 0))
+        except Exception:
+            return 0
+
+    def _safe_runtime_id(self, control: object) -> tuple[int, ...] | None:
+        try:
+            runtime_id = tuple(int(part) for part in getattr(control, "element_info").runtime_id)
+        except Exception:
+            return None
+        return runtime_id or None
+
+    def _safe_process_id(self, window: object) -> int | None:
+        try:
+            return int(getattr(window, "process_id")())
+        except Exception:
+            return None
+
+    def _window_identity(self, window: object, process_id: int | None) -> WindowIdentity | None:
         try:
+            if process_id is None:
+                return None
             title = self._safe_text(window) or "<untitled>"
-            process_id = int(getattr(window, "process_id")())
             handle = int(getattr(window, "handle", 0))
-            process_name = psutil.Process(process_id).name()
+            process_name = self._process_name_fn(process_id)
             return WindowIdentity(title=title, process_name=process_name, handle=handle)
         except Exception:
             self._logger.debug("Failed to extract window identity.", exc_info=True)
             return None
 
     def _collect_near_text(self, button: object) -> str:
-        snippets: list[str] = []
+        """
+        Text around a button: a breadth-first walk below its parent that stops after
+        NEAR_TEXT_MAX_NODES nodes or NEAR_TEXT_MAX_CHARS characters, whichever comes first.
+        """
+        self._near_text_collections += 1
         try:
             parent = getattr(button, "parent")()
         except Exception:
             parent = None
+        if parent is None:
+            return ""
 
-        if parent is not None:
-            siblings = self._safe_descendants(parent)
-            for sibling in siblings[:30]:
-                if sibling is button:
-                    continue
-                text = self._safe_text(sibling)
+        snippets: list[str] = []
+        chars = 0
+        visited = 0
+        queue = deque([parent])
+        while queue:
+            for child in self._safe_children(queue.popleft()):
+                if visited >= NEAR_TEXT_MAX_NODES:
+                    return " | ".join(snippets)
+                visited += 1
+                queue.append(child)
+                text = self._safe_text(child)
                 if text:
                     snippets.append(text)
-                if len(" ".join(snippets)) > 600:
-                    break
-
+                    chars += len(text) + 1
+                    if chars > NEAR_TEXT_MAX_CHARS:
+                        return " | ".join(snippets)
         return " | ".join(snippets)
 
+    def _safe_children(self, element: object) -> list[object]:
+        try:
+            return list(getattr(element, "children")())
+        except Exception:
+            self._logger.debug("Failed to enumerate children.", exc_info=True)
+            return []
+
+    def _click_took_effect(self, button: object) -> bool:
+        """Re-query only the clicked button: a click took effect once it is gone, hidden or disabled."""
+        try:
+            if not getattr(button, "is_enabled")():
+                return True
+            return not getattr(button, "is_visible")()
+        except Exception:
+            # The element no longer exists (UIA_E_ELEMENTNOTAVAILABLE).
+            return True
+
     def _foreground_handle(self) -> int | None:
         try:
             handle = int(ctypes.windll.user32.GetForegroundWindow())
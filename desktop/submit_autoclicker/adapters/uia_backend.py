@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Protocol, Union
+
+try:
+    from pywinauto.controls.uiawrapper import UIAWrapper
+    from pywinauto.uia_defines import IUIA
+    from pywinauto.uia_element_info import UIAElementInfo
+except ImportError:  # pragma: no cover - environment dependent
+    IUIA = None  # type: ignore[assignment]
+    UIAElementInfo = None  # type: ignore[assignment]
+    UIAWrapper = None  # type: ignore[assignment]
+
+
+UIA_RUNTIME_ID_PROPERTY_ID = 30000
+UIA_CONTROL_TYPE_PROPERTY_ID = 30003
+UIA_NAME_PROPERTY_ID = 30005
+UIA_IS_ENABLED_PROPERTY_ID = 30010
+TREE_SCOPE_DESCENDANTS = 4
+TREE_SCOPE_SUBTREE = 7
+PROPERTY_CONDITION_FLAGS_IGNORE_CASE = 1
+PROPERTY_CONDITION_FLAGS_MATCH_SUBSTRING = 2
+AUTOMATION_ELEMENT_MODE_FULL = 1
+
+NEAR_TEXT_MAX_NODES = 30
+NEAR_TEXT_MAX_CHARS = 600
+
+
+@dataclass(slots=True)
+class ElementSnapshot:
+    """Cached properties of one element. `element` is the backend's live handle, only touched to act on it."""
+
+    element: object
+    name: str
+    control_type: str
+    enabled: bool
+    parent: int | None
+    runtime_id: tuple[int, ...] | None = None
+
+
+class SubtreeSnapshot:
+    """Elements of one window subtree in pre-order, with parent links as indexes into `nodes`."""
+
+    def __init__(self, nodes: list[ElementSnapshot]) -> None:
+        self.nodes = nodes
+        self._children: dict[int, list[int]] = {}
+        for index, node in enumerate(nodes):
+            if node.parent is not None:
+                self._children.setdefault(node.parent, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def find(self, control_type: str) -> Iterator[int]:
+        for index, node in enumerate(self.nodes):
+            if index and node.control_type == control_type:
+                yield index
+
+    def near_text(self, index: int) -> str:
+        """Same bounded breadth-first walk as the live adapter, starting below the button's parent."""
+        parent = self.nodes[index].parent
+        if parent is None:
+            return ""
+        snippets: list[str] = []
+        chars = 0
+        visited = 0
+        queue = deque([parent])
+        while queue:
+            for child in self._children.get(queue.popleft(), []):
+                if visited >= NEAR_TEXT_MAX_NODES:
+                    return " | ".join(snippets)
+                visited += 1
+                queue.append(child)
+                text = self.nodes[child].name.strip()
+                if text:
+                    snippets.append(text)
+                    chars += len(text) + 1
+                    if chars > NEAR_TEXT_MAX_CHARS:
+                        return " | ".join(snippets)
+        return " | ".join(snippets)
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyCondition:
+    """`property` is "control_type" or "name"; name comparisons may ignore case and/or match a substring."""
+
+    property: str
+    value: str
+    ignore_case: bool = False
+    substring: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class AndCondition:
+    conditions: tuple[Condition, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class OrCondition:
+    conditions: tuple[Condition, ...]
+
+
+Condition = Union[PropertyCondition, AndCondition, OrCondition]
+
+
+def button_name_condition(button_texts: list[str]) -> Condition | None:
+    """
+    ControlType=Button AND Name contains (ignoring case) the first word of any configured label.
+    That is a superset of button_text_matches: a label equal to a pattern, or the pattern plus a
+    delimiter, always contains the pattern's first word. The Python matcher still runs on every
+    element returned, which covers the exact prefix-plus-delimiter rule the condition cannot express.
+    Returns None when a pattern cannot be pushed down safely (casefold differs from lower-casing).
+    Labels that only match through full case folding (e.g. "ß" against "ss") are not returned.
+    """
+    words: list[str] = []
+    for text in button_texts:
+        parts = text.split()
+        if not parts:
+            continue
+        word = parts[0]
+        if word.casefold() != word.lower():
+            return None
+        if word.lower() not in words:
+            words.append(word.lower())
+    if not words:
+        return None
+    names = tuple(PropertyCondition("name", word, ignore_case=True, substring=True) for word in words)
+    name_condition: Condition = names[0] if len(names) == 1 else OrCondition(names)
+    return AndCondition((PropertyCondition("control_type", "Button"), name_condition))
+
+
+class ConditionSearch(Protocol):
+    """Provider-side filtered search: only elements satisfying the condition cross the process boundary."""
+
+    @property
+    def available(self) -> bool:
+        ...
+
+    def find_all(self, window: object, condition: Condition) -> list[object]:
+        ...
+
+
+class SubtreeFetcher(Protocol):
+    """Fetches a window's whole subtree with the properties the scan needs in one round trip."""
+
+    @property
+    def available(self) -> bool:
+        ...
+
+    def fetch_subtree(self, window: object) -> SubtreeSnapshot:
+        ...
+
+    def wrap(self, element: object) -> object:
+        """Control wrapper (invoke/click_input/parent) for a snapshot element."""
+        ...
+
+
+def _runtime_id(value: object) -> tuple[int, ...] | None:
+    try:
+        runtime_id = tuple(int(part) for part in value)  # type: ignore[union-attr]
+    except Exception:
+        return None
+    return runtime_id or None
+
+
+class UIACacheFetcher:
+    """
+    SubtreeFetcher backed by an IUIAutomationCacheRequest.
+    BuildUpdatedCache brings back Name, IsEnabled, ControlType and RuntimeId for every element
+    below the window in a single cross-process call; children are then read from the cache.
+    """
+
+    def __init__(self) -> None:
+        # COM objects are apartment-bound, so the cache request is built once per scanning thread.
+        self._local = threading.local()
+
+    @property
+    def available(self) -> bool:
+        return IUIA is not None
+
+    def fetch_subtree(self, window: object) -> SubtreeSnapshot:
+        request, control_type_names = self._cache_request()
+        root = getattr(window, "element_info").element.BuildUpdatedCache(request)
+        nodes: list[ElementSnapshot] = []
+        stack: list[tuple[object, int | None]] = [(root, None)]
+        while stack:
+            element, parent = stack.pop()
+            index = len(nodes)
+            nodes.append(
+                ElementSnapshot(
+                    element=element,
+                    name=str(element.CachedName or ""),
+                    control_type=control_type_names.get(int(element.CachedControlType), ""),
+                    enabled=bool(element.CachedIsEnabled),
+                    parent=parent,
+                    runtime_id=_runtime_id(element.GetCachedPropertyValue(UIA_RUNTIME_ID_PROPERTY_ID)),
+                )
+            )
+            children = element.GetCachedChildren()
+            if children is None:
+                continue
+            for position in reversed(range(children.Length)):
+                stack.append((children.GetElement(position), index))
+        return SubtreeSnapshot(nodes)
+
+    def wrap(self, element: object) -> object:
+        return UIAWrapper(UIAElementInfo(element))
+
+    def _cache_request(self) -> tuple[object, dict[int, str]]:
+        cached = getattr(self._local, "request", None)
+        if cached is None:
+            uia = IUIA()
+            request = uia.iuia.CreateCacheRequest()
+            for property_id in (
+                UIA_NAME_PROPERTY_ID,
+                UIA_IS_ENABLED_PROPERTY_ID,
+                UIA_CONTROL_TYPE_PROPERTY_ID,
+                UIA_RUNTIME_ID_PROPERTY_ID,
+            ):
+                request.AddProperty(property_id)
+            request.TreeScope = TREE_SCOPE_SUBTREE
+            # Raw view, to match what descendants() walks.
+            request.TreeFilter = uia.true_condition
+            request.AutomationElementMode = AUTOMATION_ELEMENT_MODE_FULL
+            cached = (request, dict(uia.known_control_type_ids))
+            self._local.request = cached
+        return cached
+
+
+class UIAConditionSearch:
+    """
+    ConditionSearch backed by IUIAutomation property conditions and FindAll(TreeScope_Descendants).
+    Substring matching needs PropertyConditionFlags_MatchSubstring (Windows 10 1809+); where it is
+    rejected the search reports itself unavailable and the adapter keeps filtering in Python.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._supported = True
+
+    @property
+    def available(self) -> bool:
+        return IUIA is not None and self._supported
+
+    def find_all(self, window: object, condition: Condition) -> list[object]:
+        try:
+            native = self._native_condition(condition)
+        except Exception:
+            self._supported = False
+            raise
+        found = getattr(window, "element_info").element.FindAll(TREE_SCOPE_DESCENDANTS, native)
+        if found is None:
+            return []
+        return [UIAWrapper(UIAElementInfo(found.GetElement(index))) for index in range(found.Length)]
+
+    def _native_condition(self, condition: Condition) -> object:
+        cache: dict[Condition, object] | None = getattr(self._local, "conditions", None)
+        if cache is None:
+            cache = self._local.conditions = {}
+        native = cache.get(condition)
+        if native is None:
+            native = cache[condition] = self._build(IUIA(), condition)
+        return native
+
+    def _build(self, uia: object, condition: Condition) -> object:
+        if isinstance(condition, PropertyCondition):
+            if condition.property == "control_type":
+                return uia.iuia.CreatePropertyCondition(
+                    UIA_CONTROL_TYPE_PROPERTY_ID, uia.known_control_types[condition.value]
+                )
+            flags = 0
+            if condition.ignore_case:
+                flags |= PROPERTY_CONDITION_FLAGS_IGNORE_CASE
+            if condition.substring:
+                flags |= PROPERTY_CONDITION_FLAGS_MATCH_SUBSTRING
+            return uia.iuia.CreatePropertyConditionEx(UIA_NAME_PROPERTY_ID, condition.value, flags)
+
+        children = [self._build(uia, child) for child in condition.conditions]
+        combine = uia.iuia.CreateAndCondition if isinstance(condition, AndCondition) else uia.iuia.CreateOrCondition
+        native = children[0]
+        for child in children[1:]:
+            native = combine(native, child)
+        return native
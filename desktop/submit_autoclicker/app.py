@@ -5,6 +5,9 @@ import subprocess
 from pathlib import Path
 
 from submit_autoclicker.adapters.image_adapter import ImageFallbackAdapter
+from submit_autoclicker.adapters.locator import LOCATOR_CACHE_FILENAME, LocatorStore
+from submit_autoclicker.adapters.process_cache import ProcessNameCache
+from submit_autoclicker.adapters.session import AutomationSession
 from submit_autoclicker.adapters.uia_adapter import UIAAdapter
 from submit_autoclicker.config import AppConfig, default_config_path, load_config
 from submit_autoclicker.core.engine import ClickEngine
@@ -19,12 +22,28 @@ class DesktopAutoClickerApp:
         self._config = load_config(self._config_path)
         self._logger = setup_logging(self._config.log_dir, self._config.log_level)
 
-        self._uia_adapter = UIAAdapter(self._logger)
-        self._image_adapter = ImageFallbackAdapter(self._logger)
+        self._process_names = ProcessNameCache()
+        self._session = AutomationSession(self._logger)
+        self._locator_cache_path = self._config_path.parent / LOCATOR_CACHE_FILENAME
+        self._locator_store = LocatorStore.load(self._locator_cache_path, self._config.button_texts, self._logger)
+        self._locator_store.autosave(self._locator_cache_path, self._logger)
+        self._uia_adapter = UIAAdapter(
+            self._logger,
+            session=self._session,
+            process_name_fn=self._process_names.name,
+            locator_store=self._locator_store,
+        )
+        self._image_adapter = ImageFallbackAdapter(
+            self._logger,
+            session=self._session,
+            process_name_fn=self._process_names.name,
+        )
         self._engine = ClickEngine(
             config=self._config,
             providers=[self._uia_adapter, self._image_adapter],
             logger=self._logger,
+            event_sources=[self._uia_adapter.event_source],
+            foreground_fn=self._uia_adapter.foreground_handle,
         )
         self._hotkey = GlobalHotkeyController(
             hotkey=self._config.hotkey_pause_resume,
@@ -66,6 +85,7 @@ class DesktopAutoClickerApp:
         self._stopped = True
         self._hotkey.stop()
         self._engine.stop()
+        self._locator_store.flush()
         self._logger.info("Submit Auto-Clicker shutdown complete.")
 
     def reload_config(self) -> None:
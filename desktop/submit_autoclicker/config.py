@@ -4,6 +4,7 @@ import os
 import re
 import shutil
 import ast
+import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,8 @@ except ModuleNotFoundError:  # pragma: no cover - py310 fallback
 
 APP_DIR_NAME = "SubmitAutoClicker"
 
+_logger = logging.getLogger("submit_autoclicker.config")
+
 
 @dataclass(slots=True)
 class AppConfig:
@@ -26,6 +29,55 @@ class AppConfig:
     button_texts: list[str] = field(default_factory=lambda: ["Submit", "Continue", "Apply", "Yes"])
     poll_interval_ms: int = 350
     click_cooldown_ms: int = 5000
+    per_target_cooldown: bool = False
+    global_click_interval_ms: int = 0
+    cooldown_max_targets: int = 256
+    click_rate_limit: bool = False
+    click_burst: int = 3
+    click_refill_per_s: float = 0.2
+    process_click_burst: int = 0
+    process_click_refill_per_s: float = 0.2
+    suppress_repeat_clicks: bool = False
+    recent_click_ttl_ms: int = 60000
+    recent_clicks_max: int = 256
+    rank_candidates: bool = False
+    score_exact_match: float = 2.0
+    score_foreground: float = 4.0
+    score_provider: float = 1.0
+    score_wait_per_s: float = 0.5
+    async_clicks: bool = False
+    click_timeout_ms: int = 3000
+    click_queue_size: int = 8
+    verify_clicks: bool = False
+    verify_delay_ms: int = 150
+    verify_retries: int = 2
+    event_driven_scans: bool = False
+    safety_sweep_interval_ms: int = 5000
+    event_debounce_ms: int = 50
+    adaptive_polling: bool = False
+    idle_backoff_max_ms: int = 5000
+    idle_backoff_factor: float = 1.5
+    burst_interval_ms: int = 100
+    burst_window_ms: int = 15000
+    concurrent_provider_scans: bool = False
+    provider_timeout_ms: int = 2000
+    process_gate_refresh_ms: int = 2000
+    batched_uia_fetch: bool = False
+    uia_name_conditions: bool = False
+    locator_hints: bool = False
+    locator_full_walk_every: int = 10
+    walk_node_budget: int = 0
+    walk_max_depth: int = 0
+    walk_time_budget_ms: int = 0
+    negative_cache: bool = False
+    negative_cache_threshold: int = 3
+    negative_cache_max_backoff: int = 32
+    foreground_tiering: bool = False
+    recent_window_every: int = 3
+    recent_window_count: int = 4
+    full_sweep_every: int = 20
+    incremental_scans: bool = False
+    incremental_revalidate_every: int = 10
     require_button_enabled: bool = True
     require_near_text_contains: list[str] = field(default_factory=list)
     allow_focus: bool = False
@@ -112,6 +164,55 @@ def render_default_config() -> str:
         f"button_texts = {default.button_texts!r}\n\n"
         f"poll_interval_ms = {default.poll_interval_ms}\n"
         f"click_cooldown_ms = {default.click_cooldown_ms}\n"
+        f"per_target_cooldown = {str(default.per_target_cooldown).lower()}\n"
+        f"global_click_interval_ms = {default.global_click_interval_ms}\n"
+        f"cooldown_max_targets = {default.cooldown_max_targets}\n"
+        f"click_rate_limit = {str(default.click_rate_limit).lower()}\n"
+        f"click_burst = {default.click_burst}\n"
+        f"click_refill_per_s = {default.click_refill_per_s}\n"
+        f"process_click_burst = {default.process_click_burst}\n"
+        f"process_click_refill_per_s = {default.process_click_refill_per_s}\n"
+        f"suppress_repeat_clicks = {str(default.suppress_repeat_clicks).lower()}\n"
+        f"recent_click_ttl_ms = {default.recent_click_ttl_ms}\n"
+        f"recent_clicks_max = {default.recent_clicks_max}\n"
+        f"rank_candidates = {str(default.rank_candidates).lower()}\n"
+        f"score_exact_match = {default.score_exact_match}\n"
+        f"score_foreground = {default.score_foreground}\n"
+        f"score_provider = {default.score_provider}\n"
+        f"score_wait_per_s = {default.score_wait_per_s}\n"
+        f"async_clicks = {str(default.async_clicks).lower()}\n"
+        f"click_timeout_ms = {default.click_timeout_ms}\n"
+        f"click_queue_size = {default.click_queue_size}\n"
+        f"verify_clicks = {str(default.verify_clicks).lower()}\n"
+        f"verify_delay_ms = {default.verify_delay_ms}\n"
+        f"verify_retries = {default.verify_retries}\n"
+        f"event_driven_scans = {str(default.event_driven_scans).lower()}\n"
+        f"safety_sweep_interval_ms = {default.safety_sweep_interval_ms}\n"
+        f"event_debounce_ms = {default.event_debounce_ms}\n"
+        f"adaptive_polling = {str(default.adaptive_polling).lower()}\n"
+        f"idle_backoff_max_ms = {default.idle_backoff_max_ms}\n"
+        f"idle_backoff_factor = {default.idle_backoff_factor}\n"
+        f"burst_interval_ms = {default.burst_interval_ms}\n"
+        f"burst_window_ms = {default.burst_window_ms}\n"
+        f"concurrent_provider_scans = {str(default.concurrent_provider_scans).lower()}\n"
+        f"provider_timeout_ms = {default.provider_timeout_ms}\n"
+        f"process_gate_refresh_ms = {default.process_gate_refresh_ms}\n"
+        f"batched_uia_fetch = {str(default.batched_uia_fetch).lower()}\n"
+        f"uia_name_conditions = {str(default.uia_name_conditions).lower()}\n"
+        f"locator_hints = {str(default.locator_hints).lower()}\n"
+        f"locator_full_walk_every = {default.locator_full_walk_every}\n"
+        f"walk_node_budget = {default.walk_node_budget}\n"
+        f"walk_max_depth = {default.walk_max_depth}\n"
+        f"walk_time_budget_ms = {default.walk_time_budget_ms}\n"
+        f"negative_cache = {str(default.negative_cache).lower()}\n"
+        f"negative_cache_threshold = {default.negative_cache_threshold}\n"
+        f"negative_cache_max_backoff = {default.negative_cache_max_backoff}\n"
+        f"foreground_tiering = {str(default.foreground_tiering).lower()}\n"
+        f"recent_window_every = {default.recent_window_every}\n"
+        f"recent_window_count = {default.recent_window_count}\n"
+        f"full_sweep_every = {default.full_sweep_every}\n"
+        f"incremental_scans = {str(default.incremental_scans).lower()}\n"
+        f"incremental_revalidate_every = {default.incremental_revalidate_every}\n"
         f"require_button_enabled = {str(default.require_button_enabled).lower()}\n"
         "require_near_text_contains = []\n\n"
         f"allow_focus = {str(default.allow_focus).lower()}\n"
@@ -187,6 +288,55 @@ def load_config(path: Path | None = None) -> AppConfig:
         ),
         poll_interval_ms=_coerce_int(raw.get("poll_interval_ms"), 350, 50, 10_000),
         click_cooldown_ms=_coerce_int(raw.get("click_cooldown_ms"), 5000, 0, 300_000),
+        per_target_cooldown=_coerce_bool(raw.get("per_target_cooldown"), False),
+        global_click_interval_ms=_coerce_int(raw.get("global_click_interval_ms"), 0, 0, 300_000),
+        cooldown_max_targets=_coerce_int(raw.get("cooldown_max_targets"), 256, 1, 10_000),
+        click_rate_limit=_coerce_bool(raw.get("click_rate_limit"), False),
+        click_burst=_coerce_int(raw.get("click_burst"), 3, 1, 1000),
+        click_refill_per_s=_coerce_float(raw.get("click_refill_per_s"), 0.2, 0.001, 100.0),
+        process_click_burst=_coerce_int(raw.get("process_click_burst"), 0, 0, 1000),
+        process_click_refill_per_s=_coerce_float(raw.get("process_click_refill_per_s"), 0.2, 0.001, 100.0),
+        suppress_repeat_clicks=_coerce_bool(raw.get("suppress_repeat_clicks"), False),
+        recent_click_ttl_ms=_coerce_int(raw.get("recent_click_ttl_ms"), 60_000, 0, 3_600_000),
+        recent_clicks_max=_coerce_int(raw.get("recent_clicks_max"), 256, 1, 10_000),
+        rank_candidates=_coerce_bool(raw.get("rank_candidates"), False),
+        score_exact_match=_coerce_float(raw.get("score_exact_match"), 2.0, 0.0, 1000.0),
+        score_foreground=_coerce_float(raw.get("score_foreground"), 4.0, 0.0, 1000.0),
+        score_provider=_coerce_float(raw.get("score_provider"), 1.0, 0.0, 1000.0),
+        score_wait_per_s=_coerce_float(raw.get("score_wait_per_s"), 0.5, 0.01, 1000.0),
+        async_clicks=_coerce_bool(raw.get("async_clicks"), False),
+        click_timeout_ms=_coerce_int(raw.get("click_timeout_ms"), 3000, 100, 60_000),
+        click_queue_size=_coerce_int(raw.get("click_queue_size"), 8, 1, 256),
+        verify_clicks=_coerce_bool(raw.get("verify_clicks"), False),
+        verify_delay_ms=_coerce_int(raw.get("verify_delay_ms"), 150, 0, 5000),
+        verify_retries=_coerce_int(raw.get("verify_retries"), 2, 0, 10),
+        event_driven_scans=_coerce_bool(raw.get("event_driven_scans"), False),
+        safety_sweep_interval_ms=_coerce_int(raw.get("safety_sweep_interval_ms"), 5000, 250, 600_000),
+        event_debounce_ms=_coerce_int(raw.get("event_debounce_ms"), 50, 0, 2000),
+        adaptive_polling=_coerce_bool(raw.get("adaptive_polling"), False),
+        idle_backoff_max_ms=_coerce_int(raw.get("idle_backoff_max_ms"), 5000, 50, 600_000),
+        idle_backoff_factor=_coerce_float(raw.get("idle_backoff_factor"), 1.5, 1.0, 10.0),
+        burst_interval_ms=_coerce_int(raw.get("burst_interval_ms"), 100, 20, 10_000),
+        burst_window_ms=_coerce_int(raw.get("burst_window_ms"), 15000, 0, 600_000),
+        concurrent_provider_scans=_coerce_bool(raw.get("concurrent_provider_scans"), False),
+        provider_timeout_ms=_coerce_int(raw.get("provider_timeout_ms"), 2000, 50, 60_000),
+        process_gate_refresh_ms=_coerce_int(raw.get("process_gate_refresh_ms"), 2000, 0, 60_000),
+        batched_uia_fetch=_coerce_bool(raw.get("batched_uia_fetch"), False),
+        uia_name_conditions=_coerce_bool(raw.get("uia_name_conditions"), False),
+        locator_hints=_coerce_bool(raw.get("locator_hints"), False),
+        locator_full_walk_every=_coerce_int(raw.get("locator_full_walk_every"), 10, 1, 10_000),
+        walk_node_budget=_coerce_int(raw.get("walk_node_budget"), 0, 0, 1_000_000),
+        walk_max_depth=_coerce_int(raw.get("walk_max_depth"), 0, 0, 1000),
+        walk_time_budget_ms=_coerce_int(raw.get("walk_time_budget_ms"), 0, 0, 60_000),
+        negative_cache=_coerce_bool(raw.get("negative_cache"), False),
+        negative_cache_threshold=_coerce_int(raw.get("negative_cache_threshold"), 3, 1, 1000),
+        negative_cache_max_backoff=_coerce_int(raw.get("negative_cache_max_backoff"), 32, 1, 10_000),
+        foreground_tiering=_coerce_bool(raw.get("foreground_tiering"), False),
+        recent_window_every=_coerce_int(raw.get("recent_window_every"), 3, 1, 1000),
+        recent_window_count=_coerce_int(raw.get("recent_window_count"), 4, 1, 64),
+        full_sweep_every=_coerce_int(raw.get("full_sweep_every"), 20, 1, 10_000),
+        incremental_scans=_coerce_bool(raw.get("incremental_scans"), False),
+        incremental_revalidate_every=_coerce_int(raw.get("incremental_revalidate_every"), 10, 1, 10_000),
         require_button_enabled=_coerce_bool(raw.get("require_button_enabled"), True),
         require_near_text_contains=_coerce_optional_list_of_strings(raw.get("require_near_text_contains")),
         allow_focus=_coerce_bool(raw.get("allow_focus"), False),
@@ -201,4 +351,6 @@ def load_config(path: Path | None = None) -> AppConfig:
         log_dir=default_log_dir(),
         config_path=config_path,
     )
+    if cfg.uia_name_conditions and (cfg.walk_node_budget or cfg.walk_max_depth or cfg.walk_time_budget_ms):
+        _logger.warning("Walk budgets are set, so uia_name_conditions is not used for the button search.")
     return cfg
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import normalize_text
+from submit_autoclicker.models import ButtonCandidate
+
+
+TargetKey = tuple[str, int | str, str]
+InstanceKey = tuple[str, int | str, object, str | None]
+
+
+def target_key(candidate: ButtonCandidate) -> TargetKey:
+    """Window handle (title when no handle is known) plus the button's normalized label."""
+    window = candidate.window
+    window_part: int | str = window.handle if window.handle else window.title
+    return (normalize_text(window.process_name), window_part, normalize_text(candidate.button_text))
+
+
+def window_key(candidate: ButtonCandidate) -> tuple[str, int | str]:
+    return target_key(candidate)[:2]
+
+
+def instance_key(candidate: ButtonCandidate) -> InstanceKey:
+    """
+    One button instance within its window. The element's runtime id identifies it on its own, so
+    text changing around a clicked button does not make it clickable again. Without a runtime id
+    the key falls back to the button's label plus a hash of its near text, so the same button under
+    a new prompt is a new instance.
+    """
+    window = candidate.window
+    window_part: int | str = window.handle if window.handle else window.title
+    if candidate.element_id is not None:
+        return (candidate.source, window_part, candidate.element_id, None)
+    near_text = hashlib.sha1(normalize_text(candidate.near_text).encode("utf-8")).hexdigest()[:16]
+    return (candidate.source, window_part, normalize_text(candidate.button_text), near_text)
+
+
+class RecentClicks:
+    """
+    Button instances clicked within the last recent_click_ttl_ms, at most recent_clicks_max of them.
+    Lets a fresh prompt be clicked right away while the button that was just clicked, still visible,
+    is not clicked twice. rearm() forgets an instance once it was seen disabled after its click, so
+    the same element re-enabled for the next prompt is clickable again before the TTL runs out.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self._clicked: BoundedLRU[InstanceKey, float] = BoundedLRU(config.recent_clicks_max)
+        self.suppressed = 0
+        self.rearmed = 0
+        self.configure(config)
+
+    def configure(self, config: AppConfig) -> None:
+        with self._clicked.lock:
+            self._ttl_s = max(0, config.recent_click_ttl_ms) / 1000.0
+            self._clicked.resize(config.recent_clicks_max)
+
+    def __len__(self) -> int:
+        return len(self._clicked)
+
+    def was_clicked(self, key: InstanceKey, now: float) -> bool:
+        with self._clicked.lock:
+            clicked_at = self._clicked.peek(key)
+            if clicked_at is None:
+                return False
+            if now - clicked_at < self._ttl_s:
+                self.suppressed += 1
+                return True
+            self._clicked.pop(key)
+            return False
+
+    def record(self, key: InstanceKey, now: float) -> None:
+        self._clicked.put(key, now)
+
+    def release(self, key: InstanceKey) -> None:
+        self._clicked.pop(key)
+
+    def rearm(self, key: InstanceKey) -> None:
+        with self._clicked.lock:
+            if self._clicked.pop(key) is not None:
+                self.rearmed += 1
+
+
+class TargetCooldowns:
+    """
+    Cooldown per click target, tracked for the cooldown_max_targets most recent targets.
+    An optional global minimum interval caps the overall click rate across targets.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self._last_action: BoundedLRU[TargetKey, float] = BoundedLRU(config.cooldown_max_targets)
+        self._last_global_action = float("-inf")
+        self.configure(config)
+
+    def configure(self, config: AppConfig) -> None:
+        with self._last_action.lock:
+            self._cooldown_s = max(0, config.click_cooldown_ms) / 1000.0
+            self._global_interval_s = max(0, config.global_click_interval_ms) / 1000.0
+            self._last_action.resize(config.cooldown_max_targets)
+
+    def __len__(self) -> int:
+        return len(self._last_action)
+
+    def is_cooling(self, key: TargetKey, now: float) -> bool:
+        with self._last_action.lock:
+            last_action = self._last_action.peek(key)
+            if last_action is None:
+                return False
+            if now - last_action < self._cooldown_s:
+                return True
+            self._last_action.pop(key)
+            return False
+
+    def global_ready(self, now: float) -> bool:
+        with self._last_action.lock:
+            return now - self._last_global_action >= self._global_interval_s
+
+    def record(self, key: TargetKey, now: float) -> None:
+        with self._last_action.lock:
+            self._last_action.put(key, now)
+            self._last_global_action = now
+
+    def release(self, key: TargetKey) -> None:
+        self._last_action.pop(key)
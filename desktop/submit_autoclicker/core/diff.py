@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.models import ButtonCandidate
+
+
+DiffKey = tuple[str, int | None, tuple[int, ...]]
+CandidateState = tuple[str, str, str, bool]
+
+
+def candidate_state(candidate: ButtonCandidate) -> CandidateState:
+    """What the policy looks at, apart from near text: window title and process, label and enabled flag."""
+    return (candidate.window.title, candidate.window.process_name, candidate.button_text, candidate.enabled)
+
+
+@dataclass(slots=True)
+class _Rejection:
+    state: CandidateState
+    reuses: int = 0
+
+
+class CandidateDiff:
+    """
+    Policy rejections per element between scans, keyed by (source, window handle, UIA runtime id).
+    - Only rejections are reused. An accepted candidate is evaluated every scan, so a reused decision
+      can never skip a filter (require_near_text_contains included) on the way to a click.
+    - Only rejections in watched windows are kept, and invalidate() drops a window's rejections on a
+      change event, so a button that became acceptable is usually re-evaluated on the next scan.
+    - A kept rejection is reused while the candidate's state is unchanged; new elements and state
+      changes (e.g. a button turning enabled) are evaluated. Every revalidate_every-th reuse is evaluated again.
+    - Candidates without a runtime id are always evaluated. At most max_entries rejections are kept.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self._rejections: BoundedLRU[DiffKey, _Rejection] = BoundedLRU(max_entries)
+        self._lock = self._rejections.lock
+        # Bumped on every invalidation, so a decision evaluated across one is not stored.
+        self._generation = 0
+        self.unchanged = 0
+        self.evaluated = 0
+
+    def __len__(self) -> int:
+        return len(self._rejections)
+
+    def decide(
+        self,
+        candidate: ButtonCandidate,
+        evaluate: Callable[[ButtonCandidate], bool],
+        *,
+        watched: bool,
+        revalidate_every: int,
+    ) -> bool:
+        if candidate.element_id is None or not watched:
+            with self._lock:
+                self.evaluated += 1
+            return evaluate(candidate)
+
+        key = (candidate.source, candidate.window.handle, candidate.element_id)
+        state = candidate_state(candidate)
+        with self._lock:
+            rejection = self._rejections.get(key)
+            if rejection is not None and rejection.state == state and rejection.reuses < revalidate_every:
+                rejection.reuses += 1
+                self.unchanged += 1
+                return False
+            self.evaluated += 1
+            generation = self._generation
+
+        accepted = evaluate(candidate)
+        with self._lock:
+            if accepted:
+                self._rejections.pop(key)
+            elif generation == self._generation:
+                self._rejections.put(key, _Rejection(state=state))
+        return accepted
+
+    def invalidate(self, handle: int | None) -> None:
+        """Forget one window's rejections, or all of them when the handle is unknown."""
+        with self._lock:
+            self._generation += 1
+            if handle is None:
+                self._rejections.clear()
+                return
+            self._rejections.discard_where(lambda key: key[1] == handle)
+
+    def clear(self) -> None:
+        self.invalidate(None)
@@ -3,12 +3,39 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import Protocol
 
 from submit_autoclicker.config import AppConfig
-from submit_autoclicker.core.policy import AllowlistPolicy, button_text_matches, near_text_matches
-from submit_autoclicker.models import ButtonCandidate, RuntimeState
+from submit_autoclicker.core.cooldown import (
+    InstanceKey,
+    RecentClicks,
+    TargetCooldowns,
+    TargetKey,
+    instance_key,
+    target_key,
+    window_key,
+)
+from submit_autoclicker.core.diff import CandidateDiff
+from submit_autoclicker.core.executor import (
+    CLICK_FAILED,
+    CLICK_SUCCEEDED,
+    CLICK_TIMED_OUT,
+    CLICK_UNVERIFIED,
+    ClickExecutor,
+    ClickOutcome,
+)
+from submit_autoclicker.core.events import EVENT_WINDOW_OPENED, ChangeEventSource, ScanTrigger
+from submit_autoclicker.core.policy import CompiledPolicy
+from submit_autoclicker.core.ranking import CandidateRanker, ScoreWeights
+from submit_autoclicker.core.rate_limit import ClickRateLimiter
+from submit_autoclicker.core.scan_pool import ProviderScanPool
+from submit_autoclicker.core.scheduler import SCAN_TIER_FULL, AdaptivePollScheduler, ScanTierSchedule
+from submit_autoclicker.models import ButtonCandidate, ChangeEvent, RuntimeState
+
+
+CandidateFilter = Callable[[ButtonCandidate], bool]
 
 
 class CandidateProvider(Protocol):
@@ -18,6 +45,11 @@ class CandidateProvider(Protocol):
         """Return button candidates discovered by this provider."""
 
 
+class StreamingCandidateProvider(CandidateProvider, Protocol):
+    def iter_scan(self, config: AppConfig) -> Iterator[ButtonCandidate]:
+        """Yield candidates lazily. The engine stops pulling at the first acceptable one."""
+
+
 class ClickEngine:
     def __init__(
         self,
@@ -27,34 +59,70 @@ class ClickEngine:
         *,
         monotonic_fn=time.monotonic,
         wallclock_fn=time.time,
+        event_sources: Sequence[ChangeEventSource] = (),
+        foreground_fn: Callable[[], int | None] | None = None,
     ) -> None:
         self._config = config
         self._providers = list(providers)
+        self._event_sources = list(event_sources)
         self._logger = logger
         self._state = RuntimeState(dry_run=config.dry_run)
-        self._policy = AllowlistPolicy(config.allowed_processes, config.allowed_window_title_contains)
+        self._policy = CompiledPolicy(config)
+        self._bind_policy(self._policy)
         self._monotonic_fn = monotonic_fn
         self._wallclock_fn = wallclock_fn
+        self._foreground_fn = foreground_fn
 
         self._lock = threading.RLock()
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._last_action_monotonic = float("-inf")
 
+        self._trigger = ScanTrigger()
+        self._active_event_sources: list[ChangeEventSource] = []
+        self._event_wakeups = 0
+        self._last_event_scan_monotonic = float("-inf")
+        self._safety_sweeps = 0
+        self._scheduler = AdaptivePollScheduler(config)
+        self._tiers = ScanTierSchedule()
+        self._diff = CandidateDiff()
+        self._dropped_events_seen = 0
+        self._scan_pool = ProviderScanPool()
+        self._cooldowns = TargetCooldowns(config)
+        self._recent_clicks = RecentClicks(config)
+        self._ranker = CandidateRanker()
+        self._rate_limiter = ClickRateLimiter(config)
+        self._clicks_rate_limited = 0
+        self._scans_rate_limited = 0
+        self._click_executor = ClickExecutor(
+            logger,
+            max_queue=config.click_queue_size,
+            timeout_s=config.click_timeout_ms / 1000.0,
+        )
+        self._provider_timeouts: dict[str, int] = {}
+        # Scans that skipped a provider because its previous scan had not returned yet.
+        self._provider_busy_skips: dict[str, int] = {}
+
     def start(self) -> None:
         with self._lock:
             if self._thread and self._thread.is_alive():
                 return
             self._stop_event.clear()
+            self._trigger.reset()
             self._thread = threading.Thread(target=self._run, name="submit-autoclicker-loop", daemon=True)
             self._thread.start()
+            self._sync_event_sources()
 
     def stop(self, timeout: float = 2.0) -> None:
         self._stop_event.set()
+        self._trigger.interrupt()
         with self._lock:
             thread = self._thread
+            self._sync_event_sources()
         if thread:
             thread.join(timeout=timeout)
+        self._scan_pool.shutdown()
+        self._click_executor.stop()
 
     def _run(self) -> None:
         self._logger.info("Click engine started.")
@@ -63,10 +131,151 @@ class ClickEngine:
                 self.run_once()
             except Exception:
                 self._logger.exception("Unexpected engine loop error.")
-            poll_seconds = self._snapshot_config().poll_interval_ms / 1000.0
-            self._stop_event.wait(timeout=poll_seconds)
+            self._wait_for_next_scan()
         self._logger.info("Click engine stopped.")
 
+    def _wait_for_next_scan(self) -> None:
+        config = self._snapshot_config()
+        with self._lock:
+            event_driven = bool(self._active_event_sources)
+
+        interval_ms = self._next_interval_ms(config, event_driven)
+        events = self._trigger.wait(timeout=interval_ms / 1000.0)
+        if self._stop_event.is_set():
+            return
+        if not events:
+            if event_driven:
+                with self._lock:
+                    self._safety_sweeps += 1
+            return
+
+        # Let a burst of UI changes settle so it is handled by a single scan, and keep
+        # event-woken scans at least one poll interval apart while events keep coming.
+        now = self._monotonic_fn()
+        with self._lock:
+            spacing_s = self._event_spacing_ms(config, now) / 1000.0
+            settle_s = max(config.event_debounce_ms / 1000.0, self._last_event_scan_monotonic + spacing_s - now)
+        if settle_s > 0:
+            self._stop_event.wait(timeout=settle_s)
+            events.extend(self._trigger.drain())
+            if self._stop_event.is_set():
+                return
+        wants_opened = config.adaptive_polling or config.foreground_tiering
+        allowlisted_opened = wants_opened and self._opened_allowlisted_window(events, config)
+        with self._lock:
+            self._event_wakeups += 1
+            self._last_event_scan_monotonic = self._monotonic_fn()
+            if allowlisted_opened:
+                self._scheduler.note_activity(self._monotonic_fn())
+                # A new window has never had the foreground, so only a full sweep would reach it.
+                self._tiers.request_full_sweep()
+        self._invalidate_decisions(events)
+        self._dispatch_events(events)
+        self._logger.debug("Scan woken by %s change event(s).", len(events))
+
+    def _opened_allowlisted_window(self, events: list[ChangeEvent], config: AppConfig) -> bool:
+        """
+        Whether a window-opened event is for an allowlisted window. Providers answer through an
+        optional is_allowlisted_window hook; without one, any opened window counts.
+        """
+        handles = [event.handle for event in events if event.kind == EVENT_WINDOW_OPENED]
+        if not handles:
+            return False
+        checks = [getattr(provider, "is_allowlisted_window", None) for provider in self._providers]
+        checks = [check for check in checks if callable(check)]
+        if not checks:
+            return True
+        for handle in handles:
+            if handle is None:
+                continue
+            for check in checks:
+                try:
+                    if check(handle, config):
+                        return True
+                except Exception:
+                    self._logger.debug("Failed to check window %s against the allowlist.", handle, exc_info=True)
+        return False
+
+    def _invalidate_decisions(self, events: list[ChangeEvent]) -> None:
+        """Drop reused policy decisions for windows that changed, or all of them if events were lost."""
+        dropped = self._trigger.dropped
+        if dropped != self._dropped_events_seen:
+            self._dropped_events_seen = dropped
+            self._diff.clear()
+            return
+        for event in events:
+            if event.kind == EVENT_WINDOW_OPENED and event.handle is None:
+                continue
+            self._diff.invalidate(event.handle)
+
+    def _dispatch_events(self, events: list[ChangeEvent]) -> None:
+        """Hand change events to providers that keep per-window state (optional on_change_events hook)."""
+        for provider in self._providers:
+            on_change_events = getattr(provider, "on_change_events", None)
+            if callable(on_change_events):
+                try:
+                    on_change_events(events)
+                except Exception:
+                    self._logger.debug("Provider '%s' failed to handle change events.", provider.name, exc_info=True)
+
+    def _dispatch_scan_tier(self, tier: str) -> None:
+        """Tell providers which windows the coming scan covers (optional set_scan_tier hook)."""
+        for provider in self._providers:
+            set_scan_tier = getattr(provider, "set_scan_tier", None)
+            if callable(set_scan_tier):
+                try:
+                    set_scan_tier(tier)
+                except Exception:
+                    self._logger.debug("Provider '%s' failed to set its scan tier.", provider.name, exc_info=True)
+
+    def _next_interval_ms(self, config: AppConfig, event_driven: bool) -> int:
+        now = self._monotonic_fn()
+        with self._lock:
+            in_burst = self._scheduler.in_burst(now)
+            adaptive_interval_ms = self._scheduler.interval_ms(now)
+
+        if config.adaptive_polling and in_burst:
+            return adaptive_interval_ms
+        # With a live event source the timed wake-up is only a safety-net sweep.
+        if event_driven:
+            return config.safety_sweep_interval_ms
+        if config.adaptive_polling:
+            return adaptive_interval_ms
+        return config.poll_interval_ms
+
+    def _event_spacing_ms(self, config: AppConfig, now: float) -> int:
+        """Minimum time between two event-woken scans; call with the lock held."""
+        if config.adaptive_polling and self._scheduler.in_burst(now):
+            return config.burst_interval_ms
+        return config.poll_interval_ms
+
+    def _sync_event_sources(self) -> None:
+        with self._lock:
+            running = bool(self._thread and self._thread.is_alive()) and not self._stop_event.is_set()
+            wanted = running and self._config.event_driven_scans
+
+            if wanted and not self._active_event_sources:
+                for source in self._event_sources:
+                    try:
+                        started = source.start(self._trigger.notify)
+                    except Exception:
+                        self._logger.exception("Change event source '%s' failed to start.", source.name)
+                        started = False
+                    if started:
+                        self._active_event_sources.append(source)
+                        self._logger.info("Change event source '%s' active.", source.name)
+                    else:
+                        self._logger.info("Change event source '%s' unavailable. Using polling.", source.name)
+            elif not wanted and self._active_event_sources:
+                for source in self._active_event_sources:
+                    try:
+                        source.stop()
+                    except Exception:
+                        self._logger.debug("Change event source '%s' failed to stop.", source.name, exc_info=True)
+                self._active_event_sources.clear()
+                # Without events nothing tells a reused decision is stale.
+                self._diff.clear()
+
     def _snapshot_config(self) -> AppConfig:
         with self._lock:
             return self._config
@@ -88,69 +297,451 @@ class ClickEngine:
             return False
 
         now = self._monotonic_fn()
-        cooldown_seconds = max(0, config.click_cooldown_ms) / 1000.0
-        if now - self._last_action_monotonic < cooldown_seconds:
+        if config.per_target_cooldown:
+            if not self._cooldowns.global_ready(now):
+                return False
+        else:
+            cooldown_seconds = max(0, config.click_cooldown_ms) / 1000.0
+            with self._lock:
+                last_action = self._last_action_monotonic
+            if now - last_action < cooldown_seconds:
+                return False
+        if config.click_rate_limit and not self._rate_limiter.global_ready(now):
+            with self._lock:
+                self._scans_rate_limited += 1
             return False
 
-        selected_candidate: ButtonCandidate | None = None
-        selected_provider_name = ""
+        with self._lock:
+            policy = self._policy
+            tier = self._tiers.next_tier(config)
+        if config.foreground_tiering:
+            self._dispatch_scan_tier(tier)
+        selections = self._select_candidates(config, policy, now, full_scan=tier == SCAN_TIER_FULL)
 
-        for provider in self._providers:
-            try:
-                candidates = provider.scan(config)
-            except Exception:
-                self._logger.exception("Provider '%s' scan failed.", provider.name)
-                continue
+        with self._lock:
+            self._scheduler.record_scan(found=bool(selections), now=now)
 
-            for candidate in candidates:
-                if not self._policy.is_allowed(candidate.window):
-                    continue
-                if config.require_button_enabled and not candidate.enabled:
-                    continue
-                if not button_text_matches(candidate.button_text, config.button_texts):
-                    continue
-                if not near_text_matches(candidate.near_text, config.require_near_text_contains):
-                    continue
-                selected_candidate = candidate
-                selected_provider_name = provider.name
+        acted = False
+        for candidate, provider_name in selections:
+            if config.per_target_cooldown and not self._cooldowns.global_ready(now):
                 break
-            if selected_candidate:
-                break
-
-        if not selected_candidate:
-            return False
+            # Earlier clicks in this scan may have used up the tokens.
+            if config.click_rate_limit and not self._rate_limiter.allows(candidate.window.process_name, now):
+                self._note_rate_limited()
+                continue
+            acted = self._act_on(candidate, provider_name, config, state.dry_run, now) or acted
+        return acted
 
+    def _act_on(
+        self,
+        candidate: ButtonCandidate,
+        provider_name: str,
+        config: AppConfig,
+        dry_run: bool,
+        now: float,
+    ) -> bool:
         match_summary = (
-            f"provider={selected_provider_name} "
-            f"process={selected_candidate.window.process_name} "
-            f"title={selected_candidate.window.title!r} "
-            f"button={selected_candidate.button_text!r}"
+            f"provider={provider_name} "
+            f"process={candidate.window.process_name} "
+            f"title={candidate.window.title!r} "
+            f"button={candidate.button_text!r}"
         )
 
         with self._lock:
             self._state.last_match = match_summary
 
-        if state.dry_run:
-            self._last_action_monotonic = now
+        if dry_run:
+            self._record_action(candidate, config, now)
             self._logger.info("Dry-run: matched candidate. %s", match_summary)
             return True
 
+        if config.async_clicks:
+            return self._enqueue_click(candidate, config, now, match_summary)
+
         try:
-            clicked = selected_candidate.click_action(config.allow_focus)
+            status = self._perform_click(candidate, config, config.allow_focus)
         except Exception:
             self._logger.exception("Click action failed unexpectedly. %s", match_summary)
-            clicked = False
+            status = CLICK_FAILED
 
-        if clicked:
-            self._last_action_monotonic = now
+        if status != CLICK_FAILED:
+            # An unverified click still went through: it holds the cooldown so the button is not hammered.
+            self._record_action(candidate, config, now)
             with self._lock:
                 self._state.last_click_ts = self._wallclock_fn()
-            self._logger.info("Clicked candidate. %s", match_summary)
+                if status == CLICK_SUCCEEDED:
+                    self._state.clicks_succeeded += 1
+            if status == CLICK_SUCCEEDED:
+                self._logger.info("Clicked candidate. %s", match_summary)
+            else:
+                self._logger.warning("Clicked candidate but the button is still clickable. %s", match_summary)
             return True
 
+        with self._lock:
+            self._state.clicks_failed += 1
         self._logger.warning("Candidate matched but click did not execute. %s", match_summary)
         return False
 
+    def _perform_click(self, candidate: ButtonCandidate, config: AppConfig, allow_focus: bool) -> str:
+        """
+        Run the click action. With verify_clicks, re-query the button after verify_delay_ms and click
+        again (the delay doubling each time) until the click took effect or verify_retries run out.
+        Returns CLICK_FAILED only when no click went through; CLICK_UNVERIFIED when clicks went
+        through but the button stayed clickable.
+        """
+        if not candidate.click_action(allow_focus):
+            return CLICK_FAILED
+        verify = candidate.verify_action if config.verify_clicks else None
+        if verify is None:
+            return CLICK_SUCCEEDED
+
+        delay_s = config.verify_delay_ms / 1000.0
+        for attempt in range(config.verify_retries + 1):
+            if attempt:
+                with self._lock:
+                    self._state.click_retries += 1
+                if not candidate.click_action(allow_focus):
+                    break
+            self._stop_event.wait(timeout=delay_s * (2**attempt))
+            if verify():
+                with self._lock:
+                    self._state.clicks_verified += 1
+                return CLICK_SUCCEEDED
+        with self._lock:
+            self._state.clicks_unverified += 1
+        return CLICK_UNVERIFIED
+
+    def _enqueue_click(self, candidate: ButtonCandidate, config: AppConfig, now: float, match_summary: str) -> bool:
+        key = target_key(candidate)
+        instance = instance_key(candidate) if config.suppress_repeat_clicks else None
+        allow_focus = config.allow_focus
+        with self._lock:
+            previous_action = self._last_action_monotonic
+            # Reserve the cooldown up front so the next scan does not queue other targets past it.
+            self._record_action(candidate, config, now)
+
+        def _on_done(outcome: ClickOutcome) -> None:
+            self._on_click_done(outcome, config, previous_action, now, match_summary, instance)
+
+        if self._click_executor.submit(key, lambda: self._perform_click(candidate, config, allow_focus), _on_done):
+            self._logger.debug("Queued click. %s", match_summary)
+            return True
+
+        self._release_action(key, config, previous_action, now, instance)
+        self._logger.debug("Click already queued or queue full. %s", match_summary)
+        return False
+
+    def _on_click_done(
+        self,
+        outcome: ClickOutcome,
+        config: AppConfig,
+        previous_action: float,
+        reserved_at: float,
+        match_summary: str,
+        instance: InstanceKey | None = None,
+    ) -> None:
+        if outcome.late:
+            self._on_late_click_done(outcome, config, previous_action, reserved_at, match_summary, instance)
+            return
+        with self._lock:
+            if outcome.status == CLICK_SUCCEEDED:
+                self._state.last_click_ts = self._wallclock_fn()
+                self._state.clicks_succeeded += 1
+            elif outcome.status == CLICK_UNVERIFIED:
+                self._state.last_click_ts = self._wallclock_fn()
+            elif outcome.status == CLICK_TIMED_OUT:
+                self._state.clicks_timed_out += 1
+            else:
+                self._state.clicks_failed += 1
+
+        if outcome.status == CLICK_SUCCEEDED:
+            self._logger.info("Clicked candidate. %s", match_summary)
+        elif outcome.status == CLICK_UNVERIFIED:
+            # The click went through, so the reservation stands.
+            self._logger.warning("Clicked candidate but the button is still clickable. %s", match_summary)
+        elif outcome.status == CLICK_TIMED_OUT:
+            self._logger.warning(
+                "Click did not finish within %s ms. %s",
+                config.click_timeout_ms,
+                match_summary,
+            )
+        else:
+            self._release_action(outcome.key, config, previous_action, reserved_at, instance)
+            self._logger.warning("Candidate matched but click did not execute. %s", match_summary)
+
+    def _on_late_click_done(
+        self,
+        outcome: ClickOutcome,
+        config: AppConfig,
+        previous_action: float,
+        reserved_at: float,
+        match_summary: str,
+        instance: InstanceKey | None,
+    ) -> None:
+        """A timed-out click returned: keep its reservation if it went through, release it otherwise."""
+        if outcome.status in (CLICK_SUCCEEDED, CLICK_UNVERIFIED):
+            with self._lock:
+                self._state.last_click_ts = self._wallclock_fn()
+            self._logger.info("Timed-out click finished. %s", match_summary)
+            return
+        self._release_action(outcome.key, config, previous_action, reserved_at, instance)
+        self._logger.warning("Timed-out click did not execute. %s", match_summary)
+
+    def _record_action(self, candidate: ButtonCandidate, config: AppConfig, now: float) -> None:
+        with self._lock:
+            if config.rank_candidates:
+                self._ranker.note_served(candidate)
+            if config.click_rate_limit:
+                self._rate_limiter.consume(candidate.window.process_name, now)
+            if config.suppress_repeat_clicks:
+                self._recent_clicks.record(instance_key(candidate), now)
+            if config.per_target_cooldown:
+                self._cooldowns.record(target_key(candidate), now)
+            else:
+                self._last_action_monotonic = now
+
+    def _release_action(
+        self,
+        key: TargetKey,
+        config: AppConfig,
+        previous_action: float,
+        reserved_at: float,
+        instance: InstanceKey | None = None,
+    ) -> None:
+        with self._lock:
+            if instance is not None:
+                self._recent_clicks.release(instance)
+            if config.click_rate_limit:
+                self._rate_limiter.refund(key[0])
+            if config.per_target_cooldown:
+                self._cooldowns.release(key)
+            elif self._last_action_monotonic == reserved_at:
+                self._last_action_monotonic = previous_action
+
+    def _provider_metrics(self) -> dict[str, dict[str, object]]:
+        metrics: dict[str, dict[str, object]] = {}
+        for provider in self._providers:
+            provider_metrics = getattr(provider, "metrics", None)
+            if callable(provider_metrics):
+                try:
+                    metrics[provider.name] = provider_metrics()
+                except Exception:
+                    self._logger.debug("Provider '%s' metrics failed.", provider.name, exc_info=True)
+        return metrics
+
+    def _bind_policy(self, policy: CompiledPolicy) -> None:
+        """Share one policy (and its decision cache) with every provider that accepts it."""
+        for provider in self._providers:
+            bind_policy = getattr(provider, "bind_policy", None)
+            if callable(bind_policy):
+                bind_policy(policy)
+
+    def _select_candidates(
+        self,
+        config: AppConfig,
+        policy: CompiledPolicy,
+        now: float,
+        full_scan: bool = True,
+    ) -> list[tuple[ButtonCandidate, str]]:
+        """
+        Single-target mode returns at most one candidate.
+        Per-target mode returns one candidate per window whose target is not cooling down.
+        With suppress_repeat_clicks, button instances clicked recently are skipped in both modes.
+        With rank_candidates, every provider is scanned in full and the best-scoring candidates win.
+        """
+        limit = None if config.per_target_cooldown or config.rank_candidates else 1
+        accept = self._candidate_filter(config, now)
+
+        if config.concurrent_provider_scans:
+            found = self._select_concurrently(config, policy, accept, limit)
+        else:
+            found = self._select_sequentially(config, policy, accept, limit)
+        if config.rank_candidates:
+            found = self._ranker.rank(
+                found,
+                policy=policy,
+                weights=ScoreWeights.from_config(config),
+                provider_names=[provider.name for provider in self._providers],
+                foreground=self._foreground_handle() if config.score_foreground else None,
+                now=now,
+                full_scan=full_scan,
+            )
+
+        selections: list[tuple[ButtonCandidate, str]] = []
+        served_windows: set[tuple[str, int | str]] = set()
+        for candidate, provider_name in found:
+            key = window_key(candidate)
+            if key in served_windows:
+                continue
+            served_windows.add(key)
+            selections.append((candidate, provider_name))
+            if not config.per_target_cooldown:
+                break
+        return selections
+
+    def _foreground_handle(self) -> int | None:
+        if self._foreground_fn is None:
+            return None
+        try:
+            return self._foreground_fn()
+        except Exception:
+            self._logger.debug("Failed to read the foreground window.", exc_info=True)
+            return None
+
+    def _candidate_filter(self, config: AppConfig, now: float) -> CandidateFilter | None:
+        limit_processes = config.click_rate_limit and config.process_click_burst > 0
+        if not config.per_target_cooldown and not config.suppress_repeat_clicks and not limit_processes:
+            return None
+
+        def accept(candidate: ButtonCandidate) -> bool:
+            if config.per_target_cooldown and self._cooldowns.is_cooling(target_key(candidate), now):
+                return False
+            if config.suppress_repeat_clicks and self._recent_clicks.was_clicked(instance_key(candidate), now):
+                return False
+            # Checked last, so only a candidate that would otherwise be clicked counts as rate limited.
+            if limit_processes and not self._rate_limiter.allows(candidate.window.process_name, now):
+                self._note_rate_limited()
+                return False
+            return True
+
+        return accept
+
+    def _note_rate_limited(self) -> None:
+        with self._lock:
+            self._clicks_rate_limited += 1
+
+    def _select_sequentially(
+        self,
+        config: AppConfig,
+        policy: CompiledPolicy,
+        accept: CandidateFilter | None,
+        limit: int | None,
+    ) -> list[tuple[ButtonCandidate, str]]:
+        found: list[tuple[ButtonCandidate, str]] = []
+        for provider in self._providers:
+            remaining = None if limit is None else limit - len(found)
+            candidates = self._scan_provider(provider, config, policy, accept, remaining)
+            found.extend((candidate, provider.name) for candidate in candidates)
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def _select_concurrently(
+        self,
+        config: AppConfig,
+        policy: CompiledPolicy,
+        accept: CandidateFilter | None,
+        limit: int | None,
+    ) -> list[tuple[ButtonCandidate, str]]:
+        deadline = time.monotonic() + config.provider_timeout_ms / 1000.0
+        futures: dict[Future, CandidateProvider] = {}
+        for provider in self._providers:
+            future = self._scan_pool.submit(
+                provider.name,
+                lambda provider=provider: self._scan_provider(provider, config, policy, accept, limit),
+            )
+            if future is None:
+                with self._lock:
+                    self._provider_busy_skips[provider.name] = self._provider_busy_skips.get(provider.name, 0) + 1
+                self._logger.debug("Provider '%s' is still busy with a previous scan.", provider.name)
+                continue
+            futures[future] = provider
+
+        # In single-target mode the first acceptable candidate wins; slower providers keep
+        # running but their results are dropped. Otherwise wait for every provider until the deadline.
+        found: list[tuple[ButtonCandidate, str]] = []
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future, provider in futures.items():
+                if future in done:
+                    found.extend((candidate, provider.name) for candidate in future.result())
+            if limit is not None and len(found) >= limit:
+                return found[:limit]
+
+        for future in pending:
+            provider = futures[future]
+            with self._lock:
+                self._provider_timeouts[provider.name] = self._provider_timeouts.get(provider.name, 0) + 1
+            self._logger.warning(
+                "Provider '%s' missed its %s ms scan deadline.",
+                provider.name,
+                config.provider_timeout_ms,
+            )
+        order = {provider.name: index for index, provider in enumerate(self._providers)}
+        found.sort(key=lambda item: order[item[1]])
+        return found
+
+    def _scan_provider(
+        self,
+        provider: CandidateProvider,
+        config: AppConfig,
+        policy: CompiledPolicy,
+        accept: CandidateFilter | None = None,
+        limit: int | None = 1,
+    ) -> list[ButtonCandidate]:
+        iter_scan = getattr(provider, "iter_scan", None)
+        candidates: Iterable[ButtonCandidate] = ()
+        accepted: list[ButtonCandidate] = []
+        try:
+            candidates = iter_scan(config) if callable(iter_scan) else provider.scan(config)
+            for candidate in candidates:
+                # A clicked button seen disabled has taken the click; re-enabled, it is the next prompt.
+                if config.suppress_repeat_clicks and not candidate.enabled and candidate.element_id is not None:
+                    self._recent_clicks.rearm(instance_key(candidate))
+                if not self._passes_policy(provider, policy, candidate, config):
+                    continue
+                if accept is not None and not accept(candidate):
+                    continue
+                accepted.append(candidate)
+                if limit is not None and len(accepted) >= limit:
+                    break
+        except Exception:
+            self._logger.exception("Provider '%s' scan failed.", provider.name)
+        finally:
+            # Stop a streaming provider's walk as soon as we are done pulling.
+            close = getattr(candidates, "close", None)
+            if callable(close):
+                close()
+        return accepted
+
+    def _passes_policy(
+        self,
+        provider: CandidateProvider,
+        policy: CompiledPolicy,
+        candidate: ButtonCandidate,
+        config: AppConfig,
+    ) -> bool:
+        if not config.incremental_scans:
+            return policy.accepts(candidate)
+        return self._diff.decide(
+            candidate,
+            policy.accepts,
+            watched=self._is_watched(provider, candidate),
+            revalidate_every=config.incremental_revalidate_every,
+        )
+
+    def _is_watched(self, provider: CandidateProvider, candidate: ButtonCandidate) -> bool:
+        """
+        Whether change events cover the candidate's window: an event source is active and the
+        provider reports the window as watched (optional is_watching_window hook).
+        """
+        handle = candidate.window.handle
+        is_watching_window = getattr(provider, "is_watching_window", None)
+        if not handle or not callable(is_watching_window):
+            return False
+        with self._lock:
+            if not self._active_event_sources:
+                return False
+        try:
+            return bool(is_watching_window(handle))
+        except Exception:
+            self._logger.debug("Provider '%s' failed to report watched windows.", provider.name, exc_info=True)
+            return False
+
     def toggle_paused(self) -> bool:
         with self._lock:
             self._state.paused = not self._state.paused
@@ -174,7 +765,15 @@ class ClickEngine:
                 last_match=self._state.last_match,
             )
             self._config = config
-            self._policy = AllowlistPolicy(config.allowed_processes, config.allowed_window_title_contains)
+            self._policy = CompiledPolicy(config)
+            self._bind_policy(self._policy)
+            self._scheduler.configure(config)
+            self._tiers.request_full_sweep()
+            self._diff.clear()
+            self._cooldowns.configure(config)
+            self._recent_clicks.configure(config)
+            self._rate_limiter.configure(config)
+            self._click_executor.configure(timeout_s=config.click_timeout_ms / 1000.0)
             if keep_runtime_toggles:
                 self._state.paused = previous_state.paused
                 self._state.dry_run = previous_state.dry_run
@@ -183,9 +782,12 @@ class ClickEngine:
             else:
                 self._state.dry_run = config.dry_run
                 self._state.paused = False
+            self._sync_event_sources()
 
-    def status(self) -> dict[str, str | bool | float | None]:
+    def status(self) -> dict[str, object]:
+        click_tokens, process_click_tokens = self._rate_limiter.remaining(self._monotonic_fn())
         with self._lock:
+            event_driven = bool(self._active_event_sources)
             return {
                 "paused": self._state.paused,
                 "dry_run": self._state.dry_run,
@@ -193,4 +795,36 @@ class ClickEngine:
                 "last_match": self._state.last_match,
                 "poll_interval_ms": self._config.poll_interval_ms,
                 "click_cooldown_ms": self._config.click_cooldown_ms,
+                "current_interval_ms": self._next_interval_ms(self._config, event_driven),
+                "event_driven": event_driven,
+                "event_wakeups": self._event_wakeups,
+                "events_coalesced": self._trigger.coalesced,
+                "safety_sweeps": self._safety_sweeps,
+                "scan_tiers": dict(self._tiers.counts),
+                "provider_timeouts": dict(self._provider_timeouts),
+                "provider_busy_skips": dict(self._provider_busy_skips),
+                "cooldown_targets": len(self._cooldowns),
+                "recent_clicks": len(self._recent_clicks),
+                "windows_waiting": len(self._ranker),
+                "click_tokens": click_tokens,
+                "process_click_tokens": process_click_tokens,
+                "clicks_rate_limited": self._clicks_rate_limited,
+                "scans_rate_limited": self._scans_rate_limited,
+                "repeat_clicks_suppressed": self._recent_clicks.suppressed,
+                "repeat_clicks_rearmed": self._recent_clicks.rearmed,
+                "policy_version": self._policy.version,
+                "policy_cache_hits": self._policy.decisions.hits,
+                "policy_cache_misses": self._policy.decisions.misses,
+                "policy_cache_hit_rate": self._policy.decisions.hit_rate(),
+                "diff_entries": len(self._diff),
+                "diff_unchanged": self._diff.unchanged,
+                "diff_evaluated": self._diff.evaluated,
+                "provider_metrics": self._provider_metrics(),
+                "clicks_succeeded": self._state.clicks_succeeded,
+                "clicks_failed": self._state.clicks_failed,
+                "clicks_timed_out": self._state.clicks_timed_out,
+                "clicks_verified": self._state.clicks_verified,
+                "clicks_unverified": self._state.clicks_unverified,
+                "click_retries": self._state.click_retries,
+                "clicks_pending": self._click_executor.pending_count(),
             }
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Protocol
+
+from submit_autoclicker.models import ChangeEvent
+
+
+ChangeCallback = Callable[[ChangeEvent], None]
+
+EVENT_STRUCTURE_CHANGED = "structure_changed"
+EVENT_WINDOW_OPENED = "window_opened"
+
+
+class ChangeEventSource(Protocol):
+    name: str
+
+    def start(self, callback: ChangeCallback) -> bool:
+        """Begin delivering change events. Return False if the source is unavailable."""
+
+    def stop(self) -> None:
+        """Stop delivering change events."""
+
+
+class ScanTrigger:
+    """
+    Wake-up signal for the engine loop.
+    Events are coalesced by (kind, handle) so a burst of UI changes results in one scan.
+    Events that do not fit in max_pending are counted in dropped (and in coalesced).
+    """
+
+    def __init__(self, max_pending: int = 256) -> None:
+        self._condition = threading.Condition()
+        self._pending: dict[tuple[str, int | None], ChangeEvent] = {}
+        self._max_pending = max(1, max_pending)
+        self._interrupted = False
+        self.received = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def notify(self, event: ChangeEvent) -> None:
+        with self._condition:
+            self.received += 1
+            key = (event.kind, event.handle)
+            if key in self._pending:
+                self.coalesced += 1
+            elif len(self._pending) >= self._max_pending:
+                self.coalesced += 1
+                self.dropped += 1
+            else:
+                self._pending[key] = event
+            self._condition.notify_all()
+
+    def interrupt(self) -> None:
+        with self._condition:
+            self._interrupted = True
+            self._condition.notify_all()
+
+    def reset(self) -> None:
+        with self._condition:
+            self._interrupted = False
+            self._pending.clear()
+
+    def wait(self, timeout: float) -> list[ChangeEvent]:
+        with self._condition:
+            self._condition.wait_for(lambda: bool(self._pending) or self._interrupted, timeout=timeout)
+            return self._drain_locked()
+
+    def drain(self) -> list[ChangeEvent]:
+        with self._condition:
+            return self._drain_locked()
+
+    def _drain_locked(self) -> list[ChangeEvent]:
+        events = list(self._pending.values())
+        self._pending.clear()
+        return events
+
+
+class FakeEventSource:
+    """In-process event source for tests and platforms without UI Automation."""
+
+    name = "fake"
+
+    def __init__(self, available: bool = True) -> None:
+        self._available = available
+        self._callback: ChangeCallback | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        with self._lock:
+            return self._callback is not None
+
+    def start(self, callback: ChangeCallback) -> bool:
+        if not self._available:
+            return False
+        with self._lock:
+            self._callback = callback
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            self._callback = None
+
+    def emit(self, kind: str = EVENT_STRUCTURE_CHANGED, handle: int | None = None) -> bool:
+        with self._lock:
+            callback = self._callback
+        if callback is None:
+            return False
+        callback(ChangeEvent(kind=kind, handle=handle))
+        return True
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+CLICK_SUCCEEDED = "succeeded"
+CLICK_FAILED = "failed"
+CLICK_TIMED_OUT = "timed_out"
+# The click went through but the button was still clickable afterwards (verify_clicks).
+CLICK_UNVERIFIED = "unverified"
+
+
+@dataclass(frozen=True, slots=True)
+class ClickOutcome:
+    key: Hashable
+    status: str
+    # The real result of a click that was already reported as timed out.
+    late: bool = False
+
+    @property
+    def clicked(self) -> bool:
+        return self.status == CLICK_SUCCEEDED
+
+
+# A job returns whether the click went through, or one of the CLICK_* statuses.
+ClickJob = Callable[[], "bool | str"]
+ClickCallback = Callable[[ClickOutcome], None]
+
+
+class ClickExecutor:
+    """
+    Runs click actions off the scan thread.
+    - Clicks execute one at a time from a bounded queue.
+    - Each click gets click_timeout seconds; a late click is reported as timed out, and the next
+      queued click waits until it really returns. Its real result is then reported as a late outcome.
+    - A target stays pending until its click really returns, so it cannot be queued twice.
+    """
+
+    def __init__(self, logger: logging.Logger, *, max_queue: int = 8, timeout_s: float = 3.0) -> None:
+        self._logger = logger
+        self._timeout_s = timeout_s
+        self._queue: queue.Queue[tuple[Hashable, ClickJob, ClickCallback] | None] = queue.Queue(
+            maxsize=max(1, max_queue)
+        )
+        self._lock = threading.Lock()
+        self._pending: set[Hashable] = set()
+        self._thread: threading.Thread | None = None
+
+    def configure(self, *, timeout_s: float) -> None:
+        with self._lock:
+            self._timeout_s = timeout_s
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def is_pending(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._pending
+
+    def submit(self, key: Hashable, job: ClickJob, on_done: ClickCallback) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return False
+            try:
+                self._queue.put_nowait((key, job, on_done))
+            except queue.Full:
+                self._logger.warning("Click queue is full. Dropping click for %s.", key)
+                return False
+            self._pending.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="submit-autoclicker-clicks", daemon=True)
+                self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            key, job, on_done = item
+            runner, result = self._execute(key, job)
+            if not runner.is_alive():
+                self._report(on_done, ClickOutcome(key=key, status=_status(result)))
+                continue
+            self._report(on_done, ClickOutcome(key=key, status=CLICK_TIMED_OUT))
+            # Two clicks at once would fight over the foreground window.
+            self._logger.warning("Waiting for the timed-out click for %s before the next one.", key)
+            runner.join()
+            self._report(on_done, ClickOutcome(key=key, status=_status(result), late=True))
+
+    def _report(self, on_done: ClickCallback, outcome: ClickOutcome) -> None:
+        try:
+            on_done(outcome)
+        except Exception:
+            self._logger.exception("Click result callback failed.")
+
+    def _execute(self, key: Hashable, job: ClickJob) -> tuple[threading.Thread, list[bool | str]]:
+        """Start the job and wait up to the timeout; the runner is still alive if it timed out."""
+        result: list[bool | str] = []
+
+        def _runner() -> None:
+            try:
+                result.append(job())
+            except Exception:
+                self._logger.exception("Click action failed unexpectedly.")
+                result.append(False)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        runner = threading.Thread(target=_runner, name="submit-autoclicker-click", daemon=True)
+        runner.start()
+        with self._lock:
+            timeout_s = self._timeout_s
+        runner.join(timeout=timeout_s)
+        return runner, result
+
+
+def _status(result: list[bool | str]) -> str:
+    if result and isinstance(result[0], str):
+        return result[0]
+    return CLICK_SUCCEEDED if result and result[0] else CLICK_FAILED
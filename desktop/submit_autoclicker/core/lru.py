@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class BoundedLRU(Generic[K, V]):
+    """
+    Map bounded to max_entries that evicts the least recently used entry first.
+    - get(), put() and setdefault() count as a use; peek() and pop() do not.
+    - None is not a value: get() returns it for a missing key.
+    - Every method takes the map's re-entrant lock. Callers that need several calls (or their own
+      counters) to be atomic hold `lock` around them.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.lock = threading.RLock()
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._max_entries = max(1, max_entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def resize(self, max_entries: int) -> None:
+        with self.lock:
+            self._max_entries = max(1, max_entries)
+            self._evict()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self.lock:
+            return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        with self.lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def peek(self, key: K) -> V | None:
+        with self.lock:
+            return self._entries.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        with self.lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def setdefault(self, key: K, value: V) -> V:
+        with self.lock:
+            current = self._entries.get(key)
+            if current is None:
+                self.put(key, value)
+                return value
+            self._entries.move_to_end(key)
+            return current
+
+    def pop(self, key: K) -> V | None:
+        with self.lock:
+            return self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every key the predicate accepts; returns how many were removed."""
+        with self.lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._entries.clear()
+
+    def keys(self) -> list[K]:
+        """Keys from least to most recently used."""
+        with self.lock:
+            return list(self._entries)
+
+    def items(self) -> list[tuple[K, V]]:
+        """Entries from least to most recently used."""
+        with self.lock:
+            return list(self._entries.items())
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
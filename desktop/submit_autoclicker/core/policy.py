@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import itertools
 import re
+from collections import deque
+from collections.abc import Iterable
 
-from submit_autoclicker.models import WindowIdentity
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.models import ButtonCandidate, WindowIdentity
+
+
+_TERMINAL = ""
+_policy_versions = itertools.count(1)
 
 
 def normalize_text(value: str) -> str:
@@ -33,6 +42,41 @@ def button_text_matches(candidate_text: str, configured_patterns: list[str]) ->
     return False
 
 
+class ButtonTextMatcher:
+    """
+    Compiled form of button_text_matches.
+    Normalized patterns are stored in a trie so a label is checked against every pattern
+    in one pass: a pattern matches when it covers the whole label or is followed by a
+    non-alphanumeric delimiter.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._root: dict[str, dict] = {}
+        for pattern in patterns:
+            normalized = normalize_text(pattern)
+            if not normalized:
+                continue
+            node = self._root
+            for char in normalized:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = {}
+
+    def matches(self, candidate_text: str) -> bool:
+        normalized = normalize_text(candidate_text)
+        if not normalized:
+            return False
+
+        node = self._root
+        for char in normalized:
+            if _TERMINAL in node and not char.isalnum():
+                return True
+            next_node = node.get(char)
+            if next_node is None:
+                return False
+            node = next_node
+        return _TERMINAL in node
+
+
 def near_text_matches(near_text: str, required_near_patterns: list[str]) -> bool:
     if not required_near_patterns:
         return True
@@ -47,23 +91,188 @@ def near_text_matches(near_text: str, required_near_patterns: list[str]) -> bool
     )
 
 
+class MultiSubstringMatcher:
+    """
+    Aho-Corasick automaton over normalized needles.
+    contains_any() answers "does any needle occur in this text" in one linear scan,
+    however many needles are configured. Input text must already be normalized.
+    """
+
+    def __init__(self, needles: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[bool] = [False]
+        self.needle_count = 0
+
+        for needle in {normalize_text(item) for item in needles}:
+            if not needle:
+                continue
+            self.needle_count += 1
+            state = 0
+            for char in needle:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(False)
+                state = next_state
+            self._output[state] = True
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] or self._output[self._fail[next_state]]
+
+    def contains_any(self, normalized_text: str) -> bool:
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for char in normalized_text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
+
+
+class NearTextMatcher:
+    """Compiled form of near_text_matches."""
+
+    def __init__(self, required_near_patterns: Iterable[str]) -> None:
+        patterns = list(required_near_patterns)
+        self.required = bool(patterns)
+        self._matcher = MultiSubstringMatcher(patterns)
+
+    def matches(self, near_text: str) -> bool:
+        if not self.required:
+            return True
+        normalized_near_text = normalize_text(near_text)
+        if not normalized_near_text:
+            return False
+        return self._matcher.contains_any(normalized_near_text)
+
+
 class AllowlistPolicy:
     def __init__(self, allowed_processes: list[str], allowed_title_contains: list[str]) -> None:
         self._allowed_processes = {normalize_text(item) for item in allowed_processes if normalize_text(item)}
-        self._allowed_title_contains = [
-            normalize_text(item) for item in allowed_title_contains if normalize_text(item)
-        ]
+        self._allowed_title_contains = MultiSubstringMatcher(allowed_title_contains)
 
     def is_allowed(self, window: WindowIdentity) -> bool:
         process_name = normalize_text(window.process_name)
-        title = normalize_text(window.title)
 
         if self._allowed_processes and process_name not in self._allowed_processes:
             return False
 
-        if self._allowed_title_contains and not any(
-            needle in title for needle in self._allowed_title_contains
+        if self._allowed_title_contains.needle_count and not self._allowed_title_contains.contains_any(
+            normalize_text(window.title)
         ):
             return False
 
         return True
+
+
+class PolicyDecisionCache:
+    """Bounded LRU of allowlist decisions keyed by raw (title, process_name)."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._decisions: BoundedLRU[tuple[str, str], bool] = BoundedLRU(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._decisions)
+
+    def get(self, key: tuple[str, str]) -> bool | None:
+        with self._decisions.lock:
+            decision = self._decisions.get(key)
+            if decision is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return decision
+
+    def put(self, key: tuple[str, str], decision: bool) -> None:
+        self._decisions.put(key, decision)
+
+    def hit_rate(self) -> float:
+        with self._decisions.lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+
+class CompiledPolicy:
+    """
+    Allowlist and text matchers compiled once per config.
+    Each instance carries a fresh version and its own decision cache, so swapping the
+    policy on config reload also drops every cached allowlist decision.
+    """
+
+    def __init__(self, config: AppConfig, decision_cache_size: int = 1024) -> None:
+        self.config = config
+        self.version = next(_policy_versions)
+        self.allowlist = AllowlistPolicy(config.allowed_processes, config.allowed_window_title_contains)
+        self.button_matcher = ButtonTextMatcher(config.button_texts)
+        self.exact_labels = frozenset(normalize_text(text) for text in config.button_texts if normalize_text(text))
+        self.near_text_matcher = NearTextMatcher(config.require_near_text_contains)
+        self.require_button_enabled = config.require_button_enabled
+        self.decisions = PolicyDecisionCache(decision_cache_size)
+
+    def is_window_allowed(self, window: WindowIdentity) -> bool:
+        key = (window.title, window.process_name)
+        decision = self.decisions.get(key)
+        if decision is None:
+            decision = self.allowlist.is_allowed(window)
+            self.decisions.put(key, decision)
+        return decision
+
+    def is_exact_label(self, button_text: str) -> bool:
+        """The label equals a configured pattern, rather than extending one with a delimiter."""
+        return normalize_text(button_text) in self.exact_labels
+
+    def accepts(self, candidate: ButtonCandidate) -> bool:
+        if not self.is_window_allowed(candidate.window):
+            return False
+        if self.require_button_enabled and not candidate.enabled:
+            return False
+        if not self.button_matcher.matches(candidate.button_text):
+            return False
+        if not self.near_text_matcher.required:
+            return True
+        return self.near_text_matcher.matches(candidate.near_text)
+
+
+class PolicySlot:
+    """
+    Policy holder for providers: the engine-bound policy when its config matches,
+    otherwise a local policy compiled for the config being scanned.
+    Only bind() replaces the bound policy, so a scan with an older config never splits the
+    engine's shared decision cache. The local policy is kept apart and reused while its config is.
+    """
+
+    def __init__(self) -> None:
+        self._policy: CompiledPolicy | None = None
+        self._local: CompiledPolicy | None = None
+
+    def bind(self, policy: CompiledPolicy) -> None:
+        self._policy = policy
+        self._local = None
+
+    def for_config(self, config: AppConfig) -> CompiledPolicy:
+        policy = self._policy
+        if policy is not None and policy.config is config:
+            return policy
+        local = self._local
+        if local is None or local.config is not config:
+            local = CompiledPolicy(config)
+            self._local = local
+        return local
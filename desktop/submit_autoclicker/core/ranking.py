@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.cooldown import window_key
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import CompiledPolicy
+from submit_autoclicker.models import ButtonCandidate
+
+
+Selection = tuple[ButtonCandidate, str]
+WindowKey = tuple[str, int | str]
+
+
+@dataclass(frozen=True, slots=True)
+class ScoreWeights:
+    exact_match: float
+    foreground: float
+    provider: float
+    wait_per_s: float
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> ScoreWeights:
+        return cls(
+            exact_match=config.score_exact_match,
+            foreground=config.score_foreground,
+            provider=config.score_provider,
+            wait_per_s=config.score_wait_per_s,
+        )
+
+
+class CandidateRanker:
+    """
+    Orders candidates from every provider by score, best first.
+    - Score: exact label match, foreground window, provider position, and seconds the window
+      has been waiting since it first had an acceptable candidate without being served.
+    - The waiting term grows without bound, so any window eventually outranks the others (no starvation).
+    - A window stops waiting once a scan that covers every window finds no candidate in it.
+    - Waiting times are kept for the max_windows most recently seen windows.
+    """
+
+    def __init__(self, max_windows: int = 1024) -> None:
+        self._waiting_since: BoundedLRU[WindowKey, float] = BoundedLRU(max_windows)
+
+    def __len__(self) -> int:
+        return len(self._waiting_since)
+
+    def rank(
+        self,
+        found: Sequence[Selection],
+        *,
+        policy: CompiledPolicy,
+        weights: ScoreWeights,
+        provider_names: Sequence[str],
+        foreground: int | None,
+        now: float,
+        full_scan: bool = True,
+    ) -> list[Selection]:
+        positions = {name: index for index, name in enumerate(provider_names)}
+        last_position = max(len(provider_names) - 1, 0)
+        order = itertools.count()
+        heap: list[tuple[float, int, ButtonCandidate, str]] = []
+        with self._waiting_since.lock:
+            if full_scan:
+                # A window left out of a partial scan may still be waiting; one left out of a full scan is not.
+                present = {window_key(candidate) for candidate, _ in found}
+                self._waiting_since.discard_where(lambda key: key not in present)
+            for candidate, provider_name in found:
+                key = window_key(candidate)
+                waiting_since = self._waiting_since.setdefault(key, now)
+                score = weights.wait_per_s * (now - waiting_since)
+                if policy.is_exact_label(candidate.button_text):
+                    score += weights.exact_match
+                if foreground is not None and candidate.window.handle == foreground:
+                    score += weights.foreground
+                score += weights.provider * (last_position - positions.get(provider_name, last_position))
+                heap.append((-score, next(order), candidate, provider_name))
+        heapq.heapify(heap)
+        return [heapq.heappop(heap)[2:] for _ in range(len(heap))]
+
+    def note_served(self, candidate: ButtonCandidate) -> None:
+        self._waiting_since.pop(window_key(candidate))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.lru import BoundedLRU
+from submit_autoclicker.core.policy import normalize_text
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """Holds up to capacity tokens and regains refill_per_s tokens per second. Full when created."""
+
+    capacity: float
+    refill_per_s: float
+    tokens: float
+    updated_at: float
+
+    def refill(self, now: float) -> float:
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_s)
+        self.updated_at = max(self.updated_at, now)
+        return self.tokens
+
+
+class ClickRateLimiter:
+    """
+    Token buckets for clicks: one global bucket, plus one per process when process_click_burst > 0.
+    - A click needs a whole token in every bucket it falls under, and takes one from each.
+    - Bursts up to the bucket size go through at once; after that clicks follow the refill rate.
+    - Buckets are kept for the max_processes most recently clicked processes.
+    """
+
+    def __init__(self, config: AppConfig, *, max_processes: int = 64) -> None:
+        self._processes: BoundedLRU[str, TokenBucket] = BoundedLRU(max_processes)
+        # The bucket map's lock also guards the global bucket and the limits.
+        self._lock = self._processes.lock
+        self._global: TokenBucket | None = None
+        self._limits: tuple[int, float, int, float] | None = None
+        self.configure(config)
+
+    def configure(self, config: AppConfig) -> None:
+        limits = (
+            config.click_burst,
+            config.click_refill_per_s,
+            config.process_click_burst,
+            config.process_click_refill_per_s,
+        )
+        with self._lock:
+            if limits == self._limits:
+                return
+            self._limits = limits
+            self._burst, self._refill_per_s, self._process_burst, self._process_refill_per_s = limits
+            # Changed limits start from full buckets, like at startup. An unchanged reload keeps the levels.
+            self._global = None
+            self._processes.clear()
+
+    def global_ready(self, now: float) -> bool:
+        with self._lock:
+            return self._global is None or self._global.refill(now) >= 1.0
+
+    def allows(self, process_name: str, now: float) -> bool:
+        with self._lock:
+            return all(bucket.refill(now) >= 1.0 for bucket in self._buckets(process_name, now))
+
+    def consume(self, process_name: str, now: float) -> None:
+        with self._lock:
+            for bucket in self._buckets(process_name, now):
+                bucket.refill(now)
+                bucket.tokens = max(0.0, bucket.tokens - 1.0)
+
+    def refund(self, process_name: str) -> None:
+        """Give a reserved token back when the click did not happen."""
+        with self._lock:
+            for bucket in self._buckets(process_name, None):
+                bucket.tokens = min(bucket.capacity, bucket.tokens + 1.0)
+
+    def remaining(self, now: float) -> tuple[float, dict[str, float]]:
+        """Tokens left in the global bucket and in each tracked process bucket."""
+        with self._lock:
+            global_tokens = self._global.refill(now) if self._global is not None else float(self._burst)
+            per_process = {name: round(bucket.refill(now), 2) for name, bucket in self._processes.items()}
+            return round(global_tokens, 2), per_process
+
+    def _buckets(self, process_name: str, now: float | None) -> list[TokenBucket]:
+        if self._global is None:
+            self._global = self._new_bucket(self._burst, self._refill_per_s, now)
+        buckets = [self._global]
+        if self._process_burst <= 0:
+            return buckets
+        key = normalize_text(process_name)
+        bucket = self._processes.get(key)
+        if bucket is None:
+            bucket = self._new_bucket(self._process_burst, self._process_refill_per_s, now)
+            self._processes.put(key, bucket)
+        buckets.append(bucket)
+        return buckets
+
+    @staticmethod
+    def _new_bucket(capacity: int, refill_per_s: float, now: float | None) -> TokenBucket:
+        started = now if now is not None else float("-inf")
+        return TokenBucket(
+            capacity=float(capacity),
+            refill_per_s=refill_per_s,
+            tokens=float(capacity),
+            updated_at=started,
+        )
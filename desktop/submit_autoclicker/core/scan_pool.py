@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+
+class _ProviderWorker:
+    def __init__(self, name: str) -> None:
+        self._jobs: queue.SimpleQueue[tuple[Future, Callable[[], object]] | None] = queue.SimpleQueue()
+        self.inflight: Future | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"submit-autoclicker-scan-{name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, fn: Callable[[], T]) -> Future:
+        future: Future = Future()
+        self.inflight = future
+        self._jobs.put((future, fn))
+        return future
+
+    def shutdown(self) -> None:
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn())
+            except BaseException as exc:
+                future.set_exception(exc)
+
+
+class ProviderScanPool:
+    """
+    One daemon worker per provider.
+    A provider whose previous scan is still running (e.g. a hung COM call) is not
+    resubmitted, so a stuck provider can pin at most one thread and never blocks shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._workers: dict[str, _ProviderWorker] = {}
+
+    def submit(self, name: str, fn: Callable[[], T]) -> Future | None:
+        with self._lock:
+            worker = self._workers.get(name)
+            if worker is None:
+                worker = _ProviderWorker(name)
+                self._workers[name] = worker
+            if worker.inflight is not None and not worker.inflight.done():
+                return None
+            return worker.submit(fn)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.shutdown()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from submit_autoclicker.config import AppConfig
+
+
+class AdaptivePollScheduler:
+    """
+    Poll interval that backs off while scans come up empty.
+    - Each idle scan multiplies the interval by idle_backoff_factor, up to idle_backoff_max_ms.
+    - Any activity (match, click, new allowlisted window) snaps to burst_interval_ms for burst_window_ms.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self._base_ms = config.poll_interval_ms
+        self._max_ms = config.idle_backoff_max_ms
+        self._factor = config.idle_backoff_factor
+        self._burst_ms = config.burst_interval_ms
+        self._burst_window_s = config.burst_window_ms / 1000.0
+        self._burst_until = float("-inf")
+        self._idle_streak = 0
+
+    def configure(self, config: AppConfig) -> None:
+        self._base_ms = config.poll_interval_ms
+        self._max_ms = config.idle_backoff_max_ms
+        self._factor = config.idle_backoff_factor
+        self._burst_ms = config.burst_interval_ms
+        self._burst_window_s = config.burst_window_ms / 1000.0
+
+    def in_burst(self, now: float) -> bool:
+        return now < self._burst_until
+
+    def note_activity(self, now: float) -> None:
+        self._burst_until = now + self._burst_window_s
+        self._idle_streak = 0
+
+    def record_scan(self, found: bool, now: float) -> None:
+        if found:
+            self.note_activity(now)
+        elif not self.in_burst(now):
+            self._idle_streak += 1
+
+    def interval_ms(self, now: float) -> int:
+        if self.in_burst(now):
+            return self._burst_ms
+        ceiling = max(self._base_ms, self._max_ms)
+        # Cap the exponent so long idle periods cannot overflow the float.
+        interval = self._base_ms * (self._factor ** min(self._idle_streak, 64))
+        return int(min(ceiling, interval))
+
+
+SCAN_TIER_FOREGROUND = "foreground"
+SCAN_TIER_RECENT = "recent"
+SCAN_TIER_FULL = "full"
+
+
+class ScanTierSchedule:
+    """
+    Which windows each scan covers when foreground_tiering is on.
+    - Every scan covers the foreground window.
+    - Every recent_window_every-th scan adds the recently focused windows.
+    - Every full_sweep_every-th scan, the first scan, and the scan after request_full_sweep() cover everything.
+    """
+
+    def __init__(self) -> None:
+        self._tick = 0
+        self._full_pending = True
+        self.counts: dict[str, int] = {SCAN_TIER_FOREGROUND: 0, SCAN_TIER_RECENT: 0, SCAN_TIER_FULL: 0}
+
+    def request_full_sweep(self) -> None:
+        self._full_pending = True
+
+    def next_tier(self, config: AppConfig) -> str:
+        if not config.foreground_tiering:
+            return SCAN_TIER_FULL
+        self._tick += 1
+        if self._full_pending or self._tick % config.full_sweep_every == 0:
+            self._full_pending = False
+            self._tick = 0
+            tier = SCAN_TIER_FULL
+        elif self._tick % config.recent_window_every == 0:
+            tier = SCAN_TIER_RECENT
+        else:
+            tier = SCAN_TIER_FOREGROUND
+        self.counts[tier] += 1
+        return tier
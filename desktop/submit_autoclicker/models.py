@@ -5,6 +5,8 @@ from typing import Callable
 
 
 ClickAction = Callable[[bool], bool]
+VerifyAction = Callable[[], bool]
+NearTextLoader = Callable[[], str]
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,14 +16,62 @@ class WindowIdentity:
     handle: int | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, init=False)
 class ButtonCandidate:
+    """
+    near_text may be passed as a loader instead of a string. It then runs on first access
+    and the result is kept, so context nobody asks for is never collected.
+    element_id is the backend's identity for the button (UIA runtime id) when the provider reads it.
+    verify_action, when the provider has one, re-queries the button after a click and returns True
+    once the click took effect (the button is gone, hidden or disabled).
+    """
+
     window: WindowIdentity
     button_text: str
     enabled: bool
-    near_text: str
     source: str
     click_action: ClickAction
+    element_id: tuple[int, ...] | None
+    verify_action: VerifyAction | None
+    _near_text: str | None
+    _near_text_loader: NearTextLoader | None
+
+    def __init__(
+        self,
+        window: WindowIdentity,
+        button_text: str,
+        enabled: bool,
+        near_text: str | NearTextLoader,
+        source: str,
+        click_action: ClickAction,
+        element_id: tuple[int, ...] | None = None,
+        verify_action: VerifyAction | None = None,
+    ) -> None:
+        self.window = window
+        self.button_text = button_text
+        self.enabled = enabled
+        self.source = source
+        self.click_action = click_action
+        self.element_id = element_id
+        self.verify_action = verify_action
+        if callable(near_text):
+            self._near_text = None
+            self._near_text_loader = near_text
+        else:
+            self._near_text = near_text
+            self._near_text_loader = None
+
+    @property
+    def near_text(self) -> str:
+        if self._near_text is None:
+            loader = self._near_text_loader
+            self._near_text_loader = None
+            self._near_text = loader() if loader is not None else ""
+        return self._near_text
+
+    @property
+    def near_text_loaded(self) -> bool:
+        return self._near_text is not None
 
 
 @dataclass(slots=True)
@@ -30,4 +80,15 @@ class RuntimeState:
     dry_run: bool = True
     last_click_ts: float | None = None
     last_match: str | None = None
+    clicks_succeeded: int = 0
+    clicks_failed: int = 0
+    clicks_timed_out: int = 0
+    clicks_verified: int = 0
+    clicks_unverified: int = 0
+    click_retries: int = 0
+
 
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    kind: str
+    handle: int | None = None
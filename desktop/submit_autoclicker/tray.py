@@ -13,7 +13,7 @@ except ImportError:  # pragma: no cover - environment dependent
     ImageDraw = None  # type: ignore[assignment]
 
 
-StatusProvider = Callable[[], dict[str, str | bool | float | None]]
+StatusProvider = Callable[[], dict[str, object]]
 SimpleAction = Callable[[], None]
 ToggleAction = Callable[[], bool]
 
@@ -120,7 +120,7 @@ class TrayController:
         self._icon.title = self._build_title(status)
         self._icon.update_menu()
 
-    def _build_icon(self, status: dict[str, str | bool | float | None]):
+    def _build_icon(self, status: dict[str, object]):
         paused = bool(status.get("paused", False))
         dry_run = bool(status.get("dry_run", True))
 
@@ -139,7 +139,7 @@ class TrayController:
             draw.ellipse((44, 44, 62, 62), fill=(230, 180, 0, 255))
         return image
 
-    def _build_title(self, status: dict[str, str | bool | float | None]) -> str:
+    def _build_title(self, status: dict[str, object]) -> str:
         paused = bool(status.get("paused", False))
         dry_run = bool(status.get("dry_run", True))
         runtime = "PAUSED" if paused else "ACTIVE"
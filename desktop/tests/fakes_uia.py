@@ -0,0 +1,427 @@
+"""
+In-process stand-ins for the pywinauto UIA wrapper API and the psutil process table.
+Every wrapper call is counted as one element read so scan strategies can be
+compared on any platform. Shared by the tests and tools/bench_scan.py.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import Counter
+from collections.abc import Iterator
+
+from submit_autoclicker.adapters.uia_backend import (
+    AndCondition,
+    Condition,
+    ElementSnapshot,
+    OrCondition,
+    PropertyCondition,
+    SubtreeSnapshot,
+)
+
+
+_runtime_ids = itertools.count(1)
+
+
+class ReadCounter:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    def add(self, operation: str, count: int = 1) -> None:
+        self.calls[operation] += count
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+
+class FakeElementInfo:
+    def __init__(self, element: FakeElement) -> None:
+        self._element = element
+
+    @property
+    def name(self) -> str:
+        self._element.counter.add("name")
+        return self._element.name
+
+    @property
+    def control_type(self) -> str:
+        self._element.counter.add("control_type")
+        return self._element.control_type
+
+    @property
+    def automation_id(self) -> str:
+        self._element.counter.add("automation_id")
+        return self._element.automation_id
+
+    @property
+    def class_name(self) -> str:
+        self._element.counter.add("class_name")
+        return self._element.class_name
+
+    @property
+    def handle(self) -> int:
+        self._element.counter.add("handle")
+        return self._element.handle
+
+    @property
+    def runtime_id(self) -> tuple[int, ...]:
+        self._element.counter.add("runtime_id")
+        return self._element.runtime_id
+
+
+class FakeRect:
+    def __init__(self, left: int, top: int, right: int, bottom: int) -> None:
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+
+    def width(self) -> int:
+        return self.right - self.left
+
+    def height(self) -> int:
+        return self.bottom - self.top
+
+
+class FakeElement:
+    def __init__(
+        self,
+        counter: ReadCounter,
+        *,
+        name: str = "",
+        control_type: str = "Pane",
+        enabled: bool = True,
+        automation_id: str = "",
+        class_name: str = "",
+        process_id: int = 0,
+        handle: int = 0,
+        children: list[FakeElement] | None = None,
+    ) -> None:
+        self.counter = counter
+        self.name = name
+        self.control_type = control_type
+        self.enabled = enabled
+        self.visible = True
+        self.detached = False
+        self.automation_id = automation_id
+        self.class_name = class_name
+        self.handle = handle
+        self.runtime_id = (42, next(_runtime_ids))
+        self.rect = FakeRect(0, 0, 1280, 800)
+        self.invocations = 0
+        self._process_id = process_id
+        self._parent: FakeElement | None = None
+        self._children: list[FakeElement] = []
+        for child in children or []:
+            self.add_child(child)
+
+    def __eq__(self, other: object) -> bool:
+        # pywinauto compares wrappers with IUIAutomation::CompareElements, one cross-process call each.
+        self.counter.add("compare_elements")
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def add_child(self, child: FakeElement) -> FakeElement:
+        child._parent = self
+        self._children.append(child)
+        return child
+
+    def remove_child(self, child: FakeElement) -> None:
+        self._children.remove(child)
+        child._parent = None
+
+    @property
+    def element_info(self) -> FakeElementInfo:
+        return FakeElementInfo(self)
+
+    def window_text(self) -> str:
+        self.counter.add("window_text")
+        return self.name
+
+    def is_enabled(self) -> bool:
+        self.counter.add("is_enabled")
+        if self.detached:
+            raise RuntimeError("Element not available.")
+        return self.enabled
+
+    def is_visible(self) -> bool:
+        self.counter.add("is_visible")
+        if self.detached:
+            raise RuntimeError("Element not available.")
+        return self.visible
+
+    def process_id(self) -> int:
+        self.counter.add("process_id")
+        return self._process_id
+
+    def rectangle(self) -> FakeRect:
+        self.counter.add("rectangle")
+        return self.rect
+
+    def parent(self) -> FakeElement | None:
+        self.counter.add("parent")
+        return self._parent
+
+    def children(self, **kwargs: object) -> list[FakeElement]:
+        self.counter.add("children")
+        return [child for child in self._children if _matches(child, kwargs)]
+
+    def descendants(self, **kwargs: object) -> list[FakeElement]:
+        self.counter.add("descendants")
+        found = [node for node in self.iter_subtree() if node is not self and _matches(node, kwargs)]
+        self.counter.add("descendant_nodes", len(found))
+        return found
+
+    def invoke(self) -> None:
+        self.counter.add("invoke")
+        self.invocations += 1
+
+    def click_input(self) -> None:
+        self.counter.add("click_input")
+        self.invocations += 1
+
+    def iter_subtree(self) -> Iterator[FakeElement]:
+        """Uncounted traversal for fixture setup and assertions."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._children))
+
+
+def _matches(element: FakeElement, criteria: dict[str, object]) -> bool:
+    control_type = criteria.get("control_type")
+    return control_type is None or element.control_type == control_type
+
+
+class FakeDesktop:
+    def __init__(self, counter: ReadCounter, windows: list[FakeElement] | None = None) -> None:
+        self.counter = counter
+        self.top_level: list[FakeElement] = list(windows or [])
+        self.active: FakeElement | None = None
+        self.broken = False
+
+    def windows(self) -> list[FakeElement]:
+        self.counter.add("windows")
+        if self.broken:
+            raise RuntimeError("Automation connection lost.")
+        return list(self.top_level)
+
+    def get_active(self) -> FakeElement:
+        self.counter.add("get_active")
+        if self.active is None:
+            raise RuntimeError("No active window.")
+        return self.active
+
+    def window(self, *, handle: int) -> FakeWindowSpecification:
+        return FakeWindowSpecification(self, handle)
+
+
+class FakeWindowSpecification:
+    """Stands in for Desktop.window(handle=...): resolving it is one lookup by handle."""
+
+    def __init__(self, desktop: FakeDesktop, handle: int) -> None:
+        self._desktop = desktop
+        self._handle = handle
+
+    def wrapper_object(self) -> FakeElement:
+        self._desktop.counter.add("window_from_handle")
+        for window in self._desktop.top_level:
+            if window.handle == self._handle:
+                return window
+        raise RuntimeError(f"No window with handle {self._handle}.")
+
+
+class FakeDesktopFactory:
+    """Stands in for Desktop(backend="uia"): every call builds a new view over one shared tree and is counted."""
+
+    def __init__(self, template: FakeDesktop) -> None:
+        self.template = template
+        self.created: list[FakeDesktop] = []
+
+    @property
+    def constructions(self) -> int:
+        return len(self.created)
+
+    def __call__(self) -> FakeDesktop:
+        desktop = FakeDesktop(self.template.counter)
+        desktop.top_level = self.template.top_level
+        desktop.active = self.template.active
+        self.created.append(desktop)
+        return desktop
+
+
+class FakeSubtreeFetcher:
+    """SubtreeFetcher over the fake tree. Each fetch is one round trip, however large the subtree."""
+
+    available = True
+
+    def __init__(self, counter: ReadCounter) -> None:
+        self.counter = counter
+        self.round_trips = 0
+
+    def fetch_subtree(self, window: FakeElement) -> SubtreeSnapshot:
+        self.counter.add("build_cache")
+        self.round_trips += 1
+        nodes: list[ElementSnapshot] = []
+        stack: list[tuple[FakeElement, int | None]] = [(window, None)]
+        while stack:
+            element, parent = stack.pop()
+            index = len(nodes)
+            nodes.append(
+                ElementSnapshot(
+                    element=element,
+                    name=element.name,
+                    control_type=element.control_type,
+                    enabled=element.enabled,
+                    parent=parent,
+                    runtime_id=element.runtime_id,
+                )
+            )
+            stack.extend((child, index) for child in reversed(element._children))
+        return SubtreeSnapshot(nodes)
+
+    def wrap(self, element: FakeElement) -> FakeElement:
+        return element
+
+
+def evaluate_condition(element: FakeElement, condition: Condition) -> bool:
+    """Evaluate a search condition the way UIA does: Name compared raw, optionally ignoring case."""
+    if isinstance(condition, AndCondition):
+        return all(evaluate_condition(element, child) for child in condition.conditions)
+    if isinstance(condition, OrCondition):
+        return any(evaluate_condition(element, child) for child in condition.conditions)
+    if isinstance(condition, PropertyCondition):
+        if condition.property == "control_type":
+            return element.control_type == condition.value
+        actual, expected = element.name, condition.value
+        if condition.ignore_case:
+            actual, expected = actual.lower(), expected.lower()
+        return expected in actual if condition.substring else actual == expected
+    raise TypeError(f"Unsupported condition: {condition!r}")
+
+
+class FakeConditionSearch:
+    """ConditionSearch over the fake tree. Conditions are evaluated provider-side, so only hits are counted."""
+
+    available = True
+
+    def __init__(self, counter: ReadCounter) -> None:
+        self.counter = counter
+
+    def find_all(self, window: FakeElement, condition: Condition) -> list[FakeElement]:
+        self.counter.add("find_all")
+        found = [node for node in window.iter_subtree() if node is not window and evaluate_condition(node, condition)]
+        self.counter.add("descendant_nodes", len(found))
+        return found
+
+
+class FakeNoSuchProcess(Exception):
+    pass
+
+
+class FakeProcessTable:
+    """Minimal psutil replacement: Process(pid).name()/create_time() and process_iter()."""
+
+    NoSuchProcess = FakeNoSuchProcess
+
+    def __init__(self, processes: dict[int, tuple[str, float]] | None = None) -> None:
+        self.table: dict[int, tuple[str, float]] = dict(processes or {})
+        self.calls: Counter[str] = Counter()
+        table = self
+
+        class Process:
+            def __init__(self, pid: int) -> None:
+                table.calls["process"] += 1
+                if pid not in table.table:
+                    raise FakeNoSuchProcess(pid)
+                self.pid = pid
+                self.info: dict[str, object] = {}
+
+            def name(self) -> str:
+                table.calls["name"] += 1
+                return table.table[self.pid][0]
+
+            def create_time(self) -> float:
+                table.calls["create_time"] += 1
+                return table.table[self.pid][1]
+
+        self.Process = Process
+
+    def process_iter(self, attrs: list[str] | None = None) -> Iterator[object]:
+        self.calls["process_iter"] += 1
+        for pid, (name, _) in list(self.table.items()):
+            process = self.Process(pid)
+            process.info = {"name": name}
+            yield process
+
+
+def build_synthetic_desktop(
+    *,
+    window_count: int = 50,
+    buttons_per_window: int = 40,
+    enabled_submit_windows: tuple[int, ...] = (10,),
+    process_id: int = 4242,
+    submit_text: str = "Submit ⏎",
+) -> FakeDesktop:
+    """
+    Desktop with `window_count` VS Code windows. Every window has a chat panel holding
+    a Submit button, but only windows in `enabled_submit_windows` have it enabled.
+    """
+    counter = ReadCounter()
+    windows: list[FakeElement] = []
+    for index in range(window_count):
+        toolbar = FakeElement(
+            counter,
+            name="Editor actions",
+            control_type="ToolBar",
+            class_name="monaco-toolbar",
+            children=[
+                FakeElement(counter, name=f"Action {button}", control_type="Button")
+                for button in range(buttons_per_window)
+            ],
+        )
+        chat_input = FakeElement(
+            counter,
+            name="Chat input",
+            control_type="Group",
+            automation_id="chat-input",
+            class_name="interactive-input-part",
+            children=[
+                FakeElement(counter, name="Do you want to make these changes?", control_type="Text"),
+                FakeElement(counter, name="Attach context", control_type="Button"),
+                FakeElement(
+                    counter,
+                    name=submit_text,
+                    control_type="Button",
+                    enabled=index in enabled_submit_windows,
+                    automation_id="chat-submit",
+                ),
+            ],
+        )
+        panel = FakeElement(
+            counter,
+            name="Codex",
+            control_type="Pane",
+            automation_id="workbench.panel.chat",
+            class_name="pane-body",
+            children=[chat_input],
+        )
+        windows.append(
+            FakeElement(
+                counter,
+                name=f"proj{index} - Visual Studio Code",
+                control_type="Window",
+                class_name="Chrome_WidgetWin_1",
+                process_id=process_id,
+                handle=0x1000 + index,
+                children=[toolbar, panel],
+            )
+        )
+    return FakeDesktop(counter, windows)
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from submit_autoclicker.core.policy import AllowlistPolicy, button_text_matches, near_text_matches
+import random
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.policy import (
+    AllowlistPolicy,
+    ButtonTextMatcher,
+    CompiledPolicy,
+    MultiSubstringMatcher,
+    NearTextMatcher,
+    PolicyDecisionCache,
+    PolicySlot,
+    button_text_matches,
+    near_text_matches,
+    normalize_text,
+)
 from submit_autoclicker.models import WindowIdentity
 
 
@@ -37,3 +51,104 @@ def test_near_text_matching_respects_optional_requirement() -> None:
         is True
     )
     assert near_text_matches("Dialog without marker", ["make these changes"]) is False
+
+
+def test_button_text_matcher_mirrors_function_examples() -> None:
+    matcher = ButtonTextMatcher(["submit", "Yes"])
+
+    assert matcher.matches("  Submit  ") is True
+    assert matcher.matches("Submit Changes") is True
+    assert matcher.matches("Yes, and don't ask again") is True
+    assert matcher.matches("Submitted") is False
+    assert matcher.matches("Create submit auto-clicker") is False
+    assert matcher.matches("") is False
+    assert ButtonTextMatcher([]).matches("Submit") is False
+    assert ButtonTextMatcher(["  ", ""]).matches("Submit") is False
+
+
+def _random_text(rng: random.Random, alphabet: str, max_length: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+def test_button_text_matcher_is_equivalent_to_function() -> None:
+    rng = random.Random(20240611)
+    alphabet = "abSsYy \t\n,.-⏎↩ßẞ1é"
+    for _ in range(3000):
+        patterns = [_random_text(rng, alphabet, 4) for _ in range(rng.randint(0, 4))]
+        matcher = ButtonTextMatcher(patterns)
+        for _ in range(5):
+            if patterns and rng.random() < 0.5:
+                label = rng.choice(patterns) + _random_text(rng, alphabet, 3)
+            else:
+                label = _random_text(rng, alphabet, 6)
+            assert matcher.matches(label) == button_text_matches(label, patterns), (label, patterns)
+
+
+def test_multi_substring_matcher_handles_overlapping_needles() -> None:
+    matcher = MultiSubstringMatcher(["he", "she", "his", "hers", "  Visual   Studio Code "])
+
+    assert matcher.contains_any("ushers") is True
+    assert matcher.contains_any("ahishe") is True
+    assert matcher.contains_any("proj - visual studio code") is True
+    assert matcher.contains_any("hx sx") is False
+    assert MultiSubstringMatcher([]).contains_any("anything") is False
+
+
+def test_multi_substring_matcher_is_equivalent_to_naive_scan() -> None:
+    rng = random.Random(8)
+    alphabet = "abcab -"
+    for _ in range(2000):
+        needles = [_random_text(rng, alphabet, 4) for _ in range(rng.randint(0, 6))]
+        normalized_needles = [normalize_text(needle) for needle in needles if normalize_text(needle)]
+        matcher = MultiSubstringMatcher(needles)
+        text = normalize_text(_random_text(rng, alphabet, 12))
+        assert matcher.contains_any(text) == any(needle in text for needle in normalized_needles), (needles, text)
+
+
+def test_near_text_matcher_is_equivalent_to_function() -> None:
+    rng = random.Random(9)
+    alphabet = "Do yuMAKE \t?"
+    for _ in range(2000):
+        patterns = [_random_text(rng, alphabet, 3) for _ in range(rng.randint(0, 3))]
+        near_text = _random_text(rng, alphabet, 10)
+        assert NearTextMatcher(patterns).matches(near_text) == near_text_matches(near_text, patterns)
+
+
+def test_policy_decision_cache_is_bounded_lru() -> None:
+    cache = PolicyDecisionCache(max_entries=2)
+    cache.put(("a", "Code.exe"), True)
+    cache.put(("b", "Code.exe"), False)
+    assert cache.get(("a", "Code.exe")) is True
+    cache.put(("c", "Code.exe"), True)
+
+    assert len(cache) == 2
+    assert cache.get(("b", "Code.exe")) is None
+    assert cache.get(("a", "Code.exe")) is True
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_compiled_policy_caches_window_decisions() -> None:
+    policy = CompiledPolicy(
+        AppConfig(allowed_processes=["Code.exe"], allowed_window_title_contains=["Visual Studio Code"])
+    )
+    allowed = WindowIdentity(title="proj - Visual Studio Code", process_name="Code.exe")
+    denied = WindowIdentity(title="Calculator", process_name="Code.exe")
+
+    assert policy.is_window_allowed(allowed) is True
+    assert policy.is_window_allowed(denied) is False
+    assert policy.is_window_allowed(allowed) is True
+    assert policy.decisions.hit_rate() == 1 / 3
+    assert CompiledPolicy(policy.config).version > policy.version
+
+
+def test_policy_slot_keeps_the_bound_policy_across_stale_configs() -> None:
+    slot = PolicySlot()
+    bound = CompiledPolicy(AppConfig(allowed_processes=["Code.exe"]))
+    slot.bind(bound)
+    stale_config = AppConfig(allowed_processes=["Code.exe"])
+
+    stale = slot.for_config(stale_config)
+    assert stale is not bound
+    assert slot.for_config(stale_config) is stale
+    # The stale scan did not replace the shared policy.
+    assert slot.for_config(bound.config) is bound
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
+import pytest
+
 from submit_autoclicker.config import load_config
 
 
@@ -82,3 +85,37 @@ def test_load_config_clamps_and_fallbacks_invalid_values(tmp_path: Path) -> None
     assert config.image_fallback_confidence == 1.0
     assert config.allowed_processes == ["Code.exe"]
     assert config.button_texts == ["Submit", "Continue", "Apply", "Yes"]
+
+
+def test_load_config_clamps_click_rate_limit(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "click_rate_limit = true",
+                "click_burst = 0",
+                "click_refill_per_s = 'fast'",
+                "process_click_burst = -3",
+                "process_click_refill_per_s = 1000",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    config = load_config(config_path)
+
+    assert config.click_rate_limit is True
+    assert config.click_burst == 1
+    assert config.click_refill_per_s == 0.2
+    assert config.process_click_burst == 0
+    assert config.process_click_refill_per_s == 100.0
+
+
+def test_load_config_warns_when_walk_budgets_override_name_conditions(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("uia_name_conditions = true\nwalk_node_budget = 500\n", encoding="utf-8")
+
+    with caplog.at_level(logging.WARNING, logger="submit_autoclicker.config"):
+        config = load_config(config_path)
+
+    assert config.uia_name_conditions is True
+    assert "uia_name_conditions is not used" in caplog.text
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.cooldown import RecentClicks, TargetCooldowns, instance_key, target_key
+from submit_autoclicker.models import ButtonCandidate, WindowIdentity
+
+
+def _candidate(handle: int | None, button_text: str = "Submit", title: str = "Visual Studio Code") -> ButtonCandidate:
+    return ButtonCandidate(
+        window=WindowIdentity(title=title, process_name="Code.exe", handle=handle),
+        button_text=button_text,
+        enabled=True,
+        near_text="",
+        source="fake",
+        click_action=lambda allow_focus: True,
+    )
+
+
+def test_target_key_uses_handle_and_normalized_label() -> None:
+    assert target_key(_candidate(7, "  Submit ")) == target_key(_candidate(7, "submit"))
+    assert target_key(_candidate(7)) != target_key(_candidate(8))
+    assert target_key(_candidate(None, title="A")) != target_key(_candidate(None, title="B"))
+
+
+def test_cooldown_is_tracked_per_target() -> None:
+    cooldowns = TargetCooldowns(AppConfig(click_cooldown_ms=1000))
+    first = target_key(_candidate(1))
+    second = target_key(_candidate(2))
+
+    cooldowns.record(first, now=0.0)
+
+    assert cooldowns.is_cooling(first, now=0.5) is True
+    assert cooldowns.is_cooling(second, now=0.5) is False
+    assert cooldowns.is_cooling(first, now=1.0) is False
+    assert len(cooldowns) == 0
+
+
+def test_cooldown_map_evicts_least_recent_targets() -> None:
+    cooldowns = TargetCooldowns(AppConfig(click_cooldown_ms=60_000, cooldown_max_targets=2))
+    keys = [target_key(_candidate(handle)) for handle in range(3)]
+    for offset, key in enumerate(keys):
+        cooldowns.record(key, now=float(offset))
+
+    assert len(cooldowns) == 2
+    assert cooldowns.is_cooling(keys[0], now=3.0) is False
+    assert cooldowns.is_cooling(keys[2], now=3.0) is True
+
+
+def test_global_interval_caps_click_rate() -> None:
+    cooldowns = TargetCooldowns(AppConfig(click_cooldown_ms=0, global_click_interval_ms=500))
+    assert cooldowns.global_ready(now=0.0) is True
+    cooldowns.record(target_key(_candidate(1)), now=0.0)
+    assert cooldowns.global_ready(now=0.4) is False
+    assert cooldowns.global_ready(now=0.5) is True
+
+
+def test_instance_key_falls_back_to_label_and_tracks_near_text() -> None:
+    first = _candidate(7, "Submit")
+    assert instance_key(first) == instance_key(_candidate(7, " submit "))
+    assert instance_key(first) != instance_key(_candidate(8, "Submit"))
+
+    recent = RecentClicks(AppConfig(recent_click_ttl_ms=1000, recent_clicks_max=1))
+    recent.record(instance_key(first), now=0.0)
+    assert recent.was_clicked(instance_key(first), now=0.5) is True
+    assert recent.was_clicked(instance_key(first), now=1.0) is False
+    recent.record(instance_key(first), now=2.0)
+    recent.record(instance_key(_candidate(8)), now=2.0)
+    assert len(recent) == 1
+    assert recent.suppressed == 1
+
+
+def test_instance_key_uses_runtime_id_alone_when_known() -> None:
+    first = _candidate(7)
+    first.element_id = (42, 1)
+    reworded = ButtonCandidate(
+        window=first.window,
+        button_text="Submit",
+        enabled=True,
+        near_text="Applying changes...",
+        source="fake",
+        click_action=first.click_action,
+        element_id=(42, 1),
+    )
+    assert instance_key(first) == instance_key(reworded)
+
+    reworded.element_id = (42, 2)
+    assert instance_key(first) != instance_key(reworded)
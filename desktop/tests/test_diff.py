@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from submit_autoclicker.core.diff import CandidateDiff
+from submit_autoclicker.models import ButtonCandidate, WindowIdentity
+
+
+def _candidate(
+    handle: int = 1,
+    element_id: tuple[int, ...] | None = (42, 1),
+    *,
+    enabled: bool = True,
+    title: str = "Visual Studio Code",
+) -> ButtonCandidate:
+    return ButtonCandidate(
+        window=WindowIdentity(title=title, process_name="Code.exe", handle=handle),
+        button_text="Submit",
+        enabled=enabled,
+        near_text="",
+        source="fake",
+        click_action=lambda allow_focus: True,
+        element_id=element_id,
+    )
+
+
+class CountingPolicy:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def accepts(self, candidate: ButtonCandidate) -> bool:
+        self.calls += 1
+        return candidate.enabled
+
+
+def test_unchanged_rejections_are_reused_until_state_changes() -> None:
+    diff = CandidateDiff()
+    policy = CountingPolicy()
+
+    def decide(candidate: ButtonCandidate) -> bool:
+        return diff.decide(candidate, policy.accepts, watched=True, revalidate_every=100)
+
+    assert decide(_candidate(enabled=False)) is False
+    assert decide(_candidate(enabled=False)) is False
+    assert policy.calls == 1
+
+    # The button turned enabled: evaluated, and accepts are never reused.
+    assert decide(_candidate(enabled=True)) is True
+    assert decide(_candidate(enabled=True)) is True
+    assert policy.calls == 3
+    assert len(diff) == 0
+    assert (diff.unchanged, diff.evaluated) == (1, 3)
+
+
+def test_unwatched_windows_and_candidates_without_runtime_id_are_always_evaluated() -> None:
+    diff = CandidateDiff()
+    policy = CountingPolicy()
+
+    for _ in range(3):
+        diff.decide(_candidate(), policy.accepts, watched=False, revalidate_every=100)
+        diff.decide(_candidate(element_id=None), policy.accepts, watched=True, revalidate_every=100)
+    assert policy.calls == 6
+    assert len(diff) == 0
+
+
+def test_decisions_are_revalidated_and_invalidated_per_window() -> None:
+    diff = CandidateDiff()
+    policy = CountingPolicy()
+
+    for _ in range(5):
+        diff.decide(_candidate(enabled=False), policy.accepts, watched=True, revalidate_every=2)
+    assert policy.calls == 2
+
+    diff.decide(_candidate(handle=2, enabled=False), policy.accepts, watched=True, revalidate_every=2)
+    diff.invalidate(1)
+    assert len(diff) == 1
+    diff.decide(_candidate(enabled=False), policy.accepts, watched=True, revalidate_every=2)
+    assert policy.calls == 4
+
+    diff.invalidate(None)
+    assert len(diff) == 0
+
+
+def test_decision_evaluated_across_an_invalidation_is_not_kept() -> None:
+    diff = CandidateDiff()
+
+    def evaluate(candidate: ButtonCandidate) -> bool:
+        # A change event for the window lands while the decision is being made.
+        diff.invalidate(candidate.window.handle)
+        return False
+
+    assert diff.decide(_candidate(), evaluate, watched=True, revalidate_every=100) is False
+    assert len(diff) == 0
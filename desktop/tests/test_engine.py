@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 
 from submit_autoclicker.config import AppConfig
 from submit_autoclicker.core.engine import ClickEngine
@@ -124,3 +126,497 @@ def test_engine_respects_cooldown() -> None:
     assert engine.run_once() is True
     assert clicked["count"] == 2
 
+
+def test_engine_reports_adaptive_interval_in_status() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.adaptive_polling = True
+    config.idle_backoff_max_ms = 400
+    config.idle_backoff_factor = 2.0
+    config.burst_interval_ms = 20
+    config.burst_window_ms = 1000
+    provider = FakeProvider([])
+    engine = ClickEngine(
+        config=config,
+        providers=[provider],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.status()["current_interval_ms"] == 100
+    engine.run_once()
+    engine.run_once()
+    engine.run_once()
+    assert engine.status()["current_interval_ms"] == 400
+
+    provider._candidates = [_build_candidate(clicked)]
+    assert engine.run_once() is True
+    assert engine.status()["current_interval_ms"] == 20
+
+    clock.advance(1.0)
+    assert engine.status()["current_interval_ms"] == 100
+
+
+class BlockingProvider:
+    def __init__(self, name: str, candidates: list[ButtonCandidate]) -> None:
+        self.name = name
+        self.release = threading.Event()
+        self.calls = 0
+        self._candidates = candidates
+
+    def scan(self, config: AppConfig) -> list[ButtonCandidate]:
+        self.calls += 1
+        self.release.wait(timeout=5.0)
+        return list(self._candidates)
+
+
+def test_concurrent_scan_prefers_first_acceptable_result() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.concurrent_provider_scans = True
+    config.provider_timeout_ms = 2000
+    slow = BlockingProvider("slow", [_build_candidate(clicked)])
+    engine = ClickEngine(
+        config=config,
+        providers=[slow, FakeProvider([_build_candidate(clicked)])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+    try:
+        started = time.monotonic()
+        assert engine.run_once() is True
+        assert time.monotonic() - started < 1.0
+        assert clicked["count"] == 1
+        assert "provider=fake" in str(engine.status()["last_match"])
+    finally:
+        slow.release.set()
+        engine.stop()
+
+
+def test_concurrent_scan_counts_provider_timeouts() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.concurrent_provider_scans = True
+    config.provider_timeout_ms = 50
+    hung = BlockingProvider("hung", [_build_candidate(clicked)])
+    engine = ClickEngine(
+        config=config,
+        providers=[hung],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+    try:
+        assert engine.run_once() is False
+        assert engine.status()["provider_timeouts"] == {"hung": 1}
+        assert engine.status()["provider_busy_skips"] == {}
+
+        # The hung scan is still running, so it is not resubmitted.
+        assert engine.run_once() is False
+        assert hung.calls == 1
+        status = engine.status()
+        assert status["provider_timeouts"] == {"hung": 1}
+        assert status["provider_busy_skips"] == {"hung": 1}
+        assert clicked["count"] == 0
+    finally:
+        hung.release.set()
+        engine.stop()
+
+
+def _build_window_candidate(clicked: dict[str, int], handle: int) -> ButtonCandidate:
+    candidate = _build_candidate(clicked)
+    candidate.window = WindowIdentity(title="Visual Studio Code", process_name="Code.exe", handle=handle)
+    return candidate
+
+
+def test_per_target_cooldown_serves_several_windows_per_scan() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=8000)
+    config.per_target_cooldown = True
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([_build_window_candidate(clicked, handle) for handle in (1, 2, 3)])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    assert clicked["count"] == 3
+    assert engine.status()["cooldown_targets"] == 3
+
+    assert engine.run_once() is False
+    assert clicked["count"] == 3
+
+    clock.advance(8.0)
+    assert engine.run_once() is True
+    assert clicked["count"] == 6
+
+
+def test_per_target_cooldown_respects_global_rate_ceiling() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=8000)
+    config.per_target_cooldown = True
+    config.global_click_interval_ms = 1000
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([_build_window_candidate(clicked, handle) for handle in (1, 2)])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    assert clicked["count"] == 1
+    assert engine.run_once() is False
+
+    clock.advance(1.0)
+    assert engine.run_once() is True
+    assert clicked["count"] == 2
+
+
+def test_async_clicks_do_not_block_the_scan() -> None:
+    release = threading.Event()
+    finished = threading.Event()
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.async_clicks = True
+
+    def slow_click(allow_focus: bool) -> bool:
+        release.wait(5.0)
+        finished.set()
+        return True
+
+    candidate = _build_candidate({"count": 0})
+    candidate.click_action = slow_click
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([candidate])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+    try:
+        assert engine.run_once() is True
+        assert engine.status()["clicks_pending"] == 1
+        # Same target is still queued, so the next scan does not enqueue it again.
+        assert engine.run_once() is False
+
+        release.set()
+        assert finished.wait(2.0)
+        deadline = time.monotonic() + 2.0
+        while engine.status()["clicks_succeeded"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        status = engine.status()
+        assert status["clicks_succeeded"] == 1
+        assert status["clicks_pending"] == 0
+        assert status["last_click_ts"] == 0.0
+    finally:
+        release.set()
+        engine.stop()
+
+
+def test_async_click_that_fails_after_timing_out_releases_its_cooldown() -> None:
+    release = threading.Event()
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=5000)
+    config.async_clicks = True
+    config.click_timeout_ms = 20
+
+    def hung_click(allow_focus: bool) -> bool:
+        release.wait(5.0)
+        return False
+
+    candidate = _build_candidate({"count": 0})
+    candidate.click_action = hung_click
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([candidate])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+    try:
+        assert engine.run_once() is True
+        deadline = time.monotonic() + 2.0
+        while engine.status()["clicks_timed_out"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert engine.status()["clicks_timed_out"] == 1
+        # The timed-out click still holds the cooldown.
+        assert engine.run_once() is False
+
+        release.set()
+        deadline = time.monotonic() + 2.0
+        requeued = False
+        while not requeued and time.monotonic() < deadline:
+            requeued = engine.run_once()
+            time.sleep(0.005)
+        # The late failure gave the cooldown back, so the button is clicked again.
+        assert requeued is True
+    finally:
+        release.set()
+        engine.stop()
+
+
+def test_repeat_suppression_clicks_each_button_instance_once_with_zero_cooldown() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.suppress_repeat_clicks = True
+    config.recent_click_ttl_ms = 10_000
+    candidate = _build_candidate(clicked)
+    candidate.element_id = (42, 7)
+    provider = FakeProvider([candidate])
+    engine = ClickEngine(
+        config=config,
+        providers=[provider],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    # The same button is still on screen: not clicked again despite the zero cooldown.
+    assert engine.run_once() is False
+    assert clicked["count"] == 1
+    assert engine.status()["repeat_clicks_suppressed"] == 1
+
+    # A fresh prompt (new element) is clicked immediately.
+    fresh = _build_candidate(clicked)
+    fresh.element_id = (42, 8)
+    provider._candidates = [candidate, fresh]
+    assert engine.run_once() is True
+    assert clicked["count"] == 2
+
+    # Text around a clicked button usually changes right after the click: same element, no second click.
+    reworded = ButtonCandidate(
+        window=fresh.window,
+        button_text=fresh.button_text,
+        enabled=True,
+        near_text="Applying changes...",
+        source=fresh.source,
+        click_action=fresh.click_action,
+        element_id=(42, 8),
+    )
+    provider._candidates = [reworded]
+    assert engine.run_once() is False
+    assert clicked["count"] == 2
+
+    clock.advance(10.0)
+    provider._candidates = [candidate]
+    assert engine.run_once() is True
+    assert clicked["count"] == 3
+
+
+def test_repeat_suppression_keys_on_runtime_id_without_loading_near_text() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.suppress_repeat_clicks = True
+    prompts = iter(["Do you want to make these changes?", "Applying changes..."])
+    loads = {"count": 0}
+
+    def load_near_text() -> str:
+        loads["count"] += 1
+        return next(prompts)
+
+    def build() -> ButtonCandidate:
+        return ButtonCandidate(
+            window=WindowIdentity(title="Visual Studio Code", process_name="Code.exe", handle=5),
+            button_text="Submit",
+            enabled=True,
+            near_text=load_near_text,
+            source="fake",
+            click_action=_build_candidate(clicked).click_action,
+            element_id=(42, 1),
+        )
+
+    provider = FakeProvider([build()])
+    engine = ClickEngine(
+        config=config,
+        providers=[provider],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    provider._candidates = [build()]
+    assert engine.run_once() is False
+    assert clicked["count"] == 1
+    # No near-text requirement, so the repeat check never had to collect it.
+    assert loads["count"] == 0
+
+
+def test_click_verification_retries_until_the_button_reacts() -> None:
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.verify_clicks = True
+    config.verify_delay_ms = 0
+    config.verify_retries = 2
+    clicked = {"count": 0}
+    candidate = _build_candidate(clicked)
+    # The first click is swallowed; the button only reacts to the second one.
+    candidate.verify_action = lambda: clicked["count"] >= 2
+    provider = FakeProvider([candidate])
+    engine = ClickEngine(
+        config=config,
+        providers=[provider],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    status = engine.status()
+    assert (status["clicks_succeeded"], status["clicks_verified"], status["click_retries"]) == (1, 1, 1)
+
+    # Clicks that went through but never took effect are unverified, not failed.
+    stuck = _build_candidate(clicked)
+    stuck.verify_action = lambda: False
+    provider._candidates = [stuck]
+    assert engine.run_once() is True
+    status = engine.status()
+    assert (status["clicks_failed"], status["clicks_unverified"], status["click_retries"]) == (0, 1, 3)
+    assert status["clicks_succeeded"] == 1
+    assert clicked["count"] == 5
+
+
+def test_unverified_click_holds_the_cooldown() -> None:
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=5000)
+    config.verify_clicks = True
+    config.verify_delay_ms = 0
+    config.verify_retries = 2
+    clicked = {"count": 0}
+    candidate = _build_candidate(clicked)
+    candidate.verify_action = lambda: False
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([candidate])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    assert clicked["count"] == 3
+    clock.advance(1.0)
+    assert engine.run_once() is False
+    assert clicked["count"] == 3
+
+
+def test_ranking_picks_the_best_candidate_across_providers() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=True, cooldown_ms=0)
+    config.rank_candidates = True
+    first = FakeProvider([_build_window_candidate(clicked, handle) for handle in (1, 2)])
+    second = FakeProvider([_build_window_candidate(clicked, 3)])
+    second.name = "second"
+    engine = ClickEngine(
+        config=config,
+        providers=[first, second],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+        foreground_fn=lambda: 3,
+    )
+
+    assert engine.run_once() is True
+    # The foreground window wins even though its provider runs last.
+    assert "provider=second" in engine.status()["last_match"]
+    assert engine.status()["windows_waiting"] == 2
+
+
+def test_click_rate_limit_allows_bursts_and_reports_tokens() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.click_rate_limit = True
+    config.click_burst = 2
+    config.click_refill_per_s = 1.0
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([_build_candidate(clicked)])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    assert engine.run_once() is True
+    assert engine.run_once() is False
+    assert clicked["count"] == 2
+    status = engine.status()
+    # The third scan was skipped outright, so no candidate was held back.
+    assert (status["click_tokens"], status["clicks_rate_limited"], status["scans_rate_limited"]) == (0.0, 0, 1)
+
+    clock.advance(1.0)
+    assert engine.run_once() is True
+    assert clicked["count"] == 3
+
+
+def test_rate_limited_candidates_are_counted_once_per_scan() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.per_target_cooldown = True
+    config.click_rate_limit = True
+    config.click_burst = 10
+    config.process_click_burst = 1
+    config.process_click_refill_per_s = 0.1
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([_build_window_candidate(clicked, handle) for handle in (1, 2, 3)])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    assert clicked["count"] == 1
+    assert engine.status()["clicks_rate_limited"] == 2
+
+    clock.advance(1.0)
+    assert engine.run_once() is False
+    assert engine.status()["clicks_rate_limited"] == 5
+
+
+def test_repeat_suppression_rearms_a_button_seen_disabled_after_its_click() -> None:
+    clicked = {"count": 0}
+    clock = FakeClock()
+    config = _build_config(dry_run=False, cooldown_ms=0)
+    config.suppress_repeat_clicks = True
+    config.recent_click_ttl_ms = 60_000
+    candidate = _build_window_candidate(clicked, 5)
+    candidate.element_id = (42, 1)
+    engine = ClickEngine(
+        config=config,
+        providers=[FakeProvider([candidate])],
+        logger=_logger(),
+        monotonic_fn=clock.now,
+        wallclock_fn=clock.now,
+    )
+
+    assert engine.run_once() is True
+    # Still enabled right after the click: the same prompt, not clicked again.
+    assert engine.run_once() is False
+
+    # The button goes busy while the prompt is handled...
+    candidate.enabled = False
+    clock.advance(2.0)
+    assert engine.run_once() is False
+    # ...and the same element is re-enabled for the next prompt, well within the TTL.
+    candidate.enabled = True
+    clock.advance(8.0)
+    assert engine.run_once() is True
+    assert clicked["count"] == 2
+    assert engine.status()["repeat_clicks_rearmed"] == 1
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.engine import ClickEngine
+from submit_autoclicker.core.events import EVENT_WINDOW_OPENED, FakeEventSource, ScanTrigger
+from submit_autoclicker.models import ButtonCandidate, ChangeEvent, WindowIdentity
+
+
+class CountingProvider:
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.scans = 0
+        self.scan_times: list[float] = []
+        self.scanned = threading.Event()
+
+    def scan(self, config: AppConfig) -> list[ButtonCandidate]:
+        self.scans += 1
+        self.scan_times.append(time.monotonic())
+        self.scanned.set()
+        return []
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("submit_autoclicker_test")
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def _build_config(*, event_driven: bool, debounce_ms: int = 50, poll_interval_ms: int = 10_000) -> AppConfig:
+    return AppConfig(
+        allowed_processes=["Code.exe"],
+        allowed_window_title_contains=["Visual Studio Code"],
+        button_texts=["Submit"],
+        poll_interval_ms=poll_interval_ms,
+        event_driven_scans=event_driven,
+        safety_sweep_interval_ms=10_000,
+        event_debounce_ms=debounce_ms,
+    )
+
+
+def _wait_for_scans(provider: CountingProvider, count: int, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if provider.scans >= count:
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_scan_trigger_coalesces_duplicate_events() -> None:
+    trigger = ScanTrigger()
+    for _ in range(5):
+        trigger.notify(ChangeEvent(kind="structure_changed", handle=1))
+    trigger.notify(ChangeEvent(kind="structure_changed", handle=2))
+
+    events = trigger.wait(timeout=0)
+
+    assert sorted(event.handle for event in events) == [1, 2]
+    assert trigger.received == 6
+    assert trigger.coalesced == 4
+    assert trigger.wait(timeout=0) == []
+
+
+def test_scan_trigger_counts_events_dropped_when_full() -> None:
+    trigger = ScanTrigger(max_pending=1)
+    trigger.notify(ChangeEvent(kind="structure_changed", handle=1))
+    trigger.notify(ChangeEvent(kind="structure_changed", handle=1))
+    trigger.notify(ChangeEvent(kind="structure_changed", handle=2))
+
+    assert [event.handle for event in trigger.drain()] == [1]
+    assert (trigger.coalesced, trigger.dropped) == (2, 1)
+
+
+def test_scan_trigger_interrupt_wakes_waiter() -> None:
+    trigger = ScanTrigger()
+    threading.Timer(0.05, trigger.interrupt).start()
+
+    started = time.monotonic()
+    assert trigger.wait(timeout=5.0) == []
+    assert time.monotonic() - started < 2.0
+
+
+def test_event_wakes_engine_before_safety_sweep() -> None:
+    provider = CountingProvider()
+    source = FakeEventSource()
+    engine = ClickEngine(
+        config=_build_config(event_driven=True),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[source],
+    )
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        assert source.started is True
+        assert engine.status()["event_driven"] is True
+
+        assert source.emit(EVENT_WINDOW_OPENED, handle=42) is True
+        assert _wait_for_scans(provider, 2)
+        assert engine.status()["event_wakeups"] == 1
+    finally:
+        engine.stop()
+
+    assert source.started is False
+
+
+def test_event_burst_is_coalesced_into_one_scan() -> None:
+    provider = CountingProvider()
+    source = FakeEventSource()
+    engine = ClickEngine(
+        config=_build_config(event_driven=True, debounce_ms=200),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[source],
+    )
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        for handle in range(20):
+            source.emit(handle=handle % 3)
+        assert _wait_for_scans(provider, 2)
+        time.sleep(0.3)
+        assert provider.scans == 2
+        assert engine.status()["event_wakeups"] == 1
+    finally:
+        engine.stop()
+
+
+def test_event_woken_scans_keep_the_poll_interval_apart() -> None:
+    provider = CountingProvider()
+    source = FakeEventSource()
+    engine = ClickEngine(
+        config=_build_config(event_driven=True, debounce_ms=0, poll_interval_ms=300),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[source],
+    )
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        source.emit(handle=1)
+        assert _wait_for_scans(provider, 2)
+        source.emit(handle=2)
+        assert _wait_for_scans(provider, 3)
+    finally:
+        engine.stop()
+
+    # The first event is served right away, the next one waits out the poll interval.
+    assert provider.scan_times[2] - provider.scan_times[1] >= 0.25
+
+
+def test_event_sources_follow_config_toggle() -> None:
+    provider = CountingProvider()
+    source = FakeEventSource()
+    engine = ClickEngine(
+        config=_build_config(event_driven=False),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[source],
+    )
+    engine.start()
+    try:
+        assert source.started is False
+        engine.update_config(_build_config(event_driven=True))
+        assert source.started is True
+        engine.update_config(_build_config(event_driven=False))
+        assert source.started is False
+    finally:
+        engine.stop()
+
+
+def test_unavailable_event_source_falls_back_to_polling() -> None:
+    provider = CountingProvider()
+    engine = ClickEngine(
+        config=_build_config(event_driven=True),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[FakeEventSource(available=False)],
+    )
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        assert engine.status()["event_driven"] is False
+    finally:
+        engine.stop()
+
+
+class EventAwareProvider(CountingProvider):
+    name = "event_aware"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[ChangeEvent] = []
+        self.events_before_scan: list[int] = []
+
+    def on_change_events(self, events: list[ChangeEvent]) -> None:
+        self.events.extend(events)
+
+    def scan(self, config: AppConfig) -> list[ButtonCandidate]:
+        self.events_before_scan.append(len(self.events))
+        return super().scan(config)
+
+
+def test_engine_dispatches_change_events_to_providers_before_scanning() -> None:
+    provider = EventAwareProvider()
+    source = FakeEventSource()
+    engine = ClickEngine(
+        config=_build_config(event_driven=True, debounce_ms=0),
+        providers=[provider],
+        logger=_logger(),
+        event_sources=[source],
+    )
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        assert source.emit(handle=7) is True
+        assert _wait_for_scans(provider, 2)
+    finally:
+        engine.stop()
+
+    assert [event.handle for event in provider.events] == [7]
+    assert provider.events_before_scan[:2] == [0, 1]
+
+
+class WatchingProvider(CountingProvider):
+    """One button in window 1 whose near text is counted each time the policy reads it."""
+
+    name = "watching"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.near_text_reads = 0
+
+    def is_watching_window(self, handle: int) -> bool:
+        return handle == 1
+
+    def _near_text(self) -> str:
+        self.near_text_reads += 1
+        return "Unrelated dialog"
+
+    def scan(self, config: AppConfig) -> list[ButtonCandidate]:
+        super().scan(config)
+        return [
+            ButtonCandidate(
+                window=WindowIdentity(title="Visual Studio Code", process_name="Code.exe", handle=1),
+                button_text="Submit",
+                enabled=True,
+                near_text=self._near_text,
+                source="fake",
+                click_action=lambda allow_focus: True,
+                element_id=(42, 1),
+            )
+        ]
+
+
+def test_incremental_scans_reuse_decisions_until_the_window_changes() -> None:
+    provider = WatchingProvider()
+    source = FakeEventSource()
+    config = _build_config(event_driven=True, debounce_ms=0, poll_interval_ms=10)
+    config.require_near_text_contains = ["make these changes"]
+    config.incremental_scans = True
+    engine = ClickEngine(config=config, providers=[provider], logger=_logger(), event_sources=[source])
+    engine.start()
+    try:
+        assert _wait_for_scans(provider, 1)
+        # A change in another window keeps the rejected decision for window 1.
+        assert source.emit(handle=2) is True
+        assert _wait_for_scans(provider, 2)
+        assert provider.near_text_reads == 1
+
+        assert source.emit(handle=1) is True
+        assert _wait_for_scans(provider, 3)
+        assert provider.near_text_reads == 2
+        status = engine.status()
+        assert (status["diff_unchanged"], status["diff_evaluated"]) == (1, 2)
+    finally:
+        engine.stop()
+
+
+def test_incremental_scans_evaluate_every_candidate_without_events() -> None:
+    provider = WatchingProvider()
+    config = _build_config(event_driven=False)
+    config.require_near_text_contains = ["make these changes"]
+    config.incremental_scans = True
+    engine = ClickEngine(config=config, providers=[provider], logger=_logger())
+
+    for _ in range(3):
+        assert engine.run_once() is False
+    # Polling alone cannot tell that near text changed, so nothing is reused.
+    assert provider.near_text_reads == 3
+    assert engine.status()["diff_unchanged"] == 0
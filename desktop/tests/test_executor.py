@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+from submit_autoclicker.core.executor import (
+    CLICK_FAILED,
+    CLICK_SUCCEEDED,
+    CLICK_TIMED_OUT,
+    ClickExecutor,
+    ClickOutcome,
+)
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("submit_autoclicker_test")
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+class OutcomeRecorder:
+    def __init__(self) -> None:
+        self.outcomes: list[ClickOutcome] = []
+        self.done = threading.Event()
+
+    def __call__(self, outcome: ClickOutcome) -> None:
+        self.outcomes.append(outcome)
+        self.done.set()
+
+
+def test_executor_reports_success_and_failure() -> None:
+    executor = ClickExecutor(_logger())
+    succeeded = OutcomeRecorder()
+    failed = OutcomeRecorder()
+    try:
+        assert executor.submit("a", lambda: True, succeeded) is True
+        assert executor.submit("b", lambda: False, failed) is True
+        assert succeeded.done.wait(2.0) and failed.done.wait(2.0)
+    finally:
+        executor.stop()
+
+    assert succeeded.outcomes == [ClickOutcome(key="a", status=CLICK_SUCCEEDED)]
+    assert failed.outcomes == [ClickOutcome(key="b", status=CLICK_FAILED)]
+
+
+def test_executor_suppresses_duplicate_targets_until_click_returns() -> None:
+    executor = ClickExecutor(_logger(), timeout_s=0.05)
+    release = threading.Event()
+    recorder = OutcomeRecorder()
+    try:
+        assert executor.submit("target", lambda: release.wait(5.0), recorder) is True
+        assert executor.submit("target", lambda: True, recorder) is False
+
+        assert recorder.done.wait(2.0)
+        assert recorder.outcomes[0].status == CLICK_TIMED_OUT
+        # The timed-out click is still running, so the target stays pending.
+        assert executor.is_pending("target") is True
+        assert executor.submit("target", lambda: True, recorder) is False
+    finally:
+        release.set()
+        executor.stop()
+
+
+def test_executor_does_not_overlap_a_timed_out_click_with_the_next_one() -> None:
+    executor = ClickExecutor(_logger(), timeout_s=0.05)
+    release = threading.Event()
+    running: set[str] = set()
+    overlaps: list[set[str]] = []
+    lock = threading.Lock()
+    first = OutcomeRecorder()
+    second = OutcomeRecorder()
+
+    def _click(name: str, wait_for: threading.Event | None) -> bool:
+        with lock:
+            running.add(name)
+            if len(running) > 1:
+                overlaps.append(set(running))
+        if wait_for is not None:
+            wait_for.wait(5.0)
+        with lock:
+            running.discard(name)
+        return True
+
+    try:
+        assert executor.submit("A", lambda: _click("A", release), first) is True
+        assert executor.submit("B", lambda: _click("B", None), second) is True
+        assert first.done.wait(2.0)
+        assert first.outcomes[0].status == CLICK_TIMED_OUT
+        # B stays queued while the hung click is still running.
+        assert second.done.wait(0.2) is False
+
+        release.set()
+        assert second.done.wait(2.0)
+        assert second.outcomes[0].status == CLICK_SUCCEEDED
+        assert overlaps == []
+    finally:
+        release.set()
+        executor.stop()
+
+
+def test_executor_reports_the_late_result_of_a_timed_out_click() -> None:
+    executor = ClickExecutor(_logger(), timeout_s=0.05)
+    release = threading.Event()
+    outcomes: list[ClickOutcome] = []
+    late = threading.Event()
+
+    def _record(outcome: ClickOutcome) -> None:
+        outcomes.append(outcome)
+        if outcome.late:
+            late.set()
+
+    try:
+        assert executor.submit("target", lambda: not release.wait(5.0), _record) is True
+        assert late.wait(0.2) is False
+        release.set()
+        assert late.wait(2.0)
+    finally:
+        release.set()
+        executor.stop()
+
+    assert outcomes == [
+        ClickOutcome(key="target", status=CLICK_TIMED_OUT),
+        ClickOutcome(key="target", status=CLICK_FAILED, late=True),
+    ]
+
+
+def test_executor_rejects_clicks_when_queue_is_full() -> None:
+    executor = ClickExecutor(_logger(), max_queue=1, timeout_s=5.0)
+    release = threading.Event()
+    started = threading.Event()
+    recorder = OutcomeRecorder()
+
+    def _blocking_click() -> bool:
+        started.set()
+        return release.wait(5.0)
+
+    try:
+        assert executor.submit("first", _blocking_click, recorder) is True
+        assert started.wait(2.0)
+        assert executor.submit("second", lambda: True, recorder) is True
+        assert executor.submit("third", lambda: True, recorder) is False
+    finally:
+        release.set()
+        executor.stop()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+
+from submit_autoclicker.adapters.locator import (
+    LOCATOR_CACHE_VERSION,
+    LocatorHints,
+    LocatorStep,
+    LocatorStore,
+    locator_path,
+    resolve_path,
+)
+from tests.fakes_uia import build_synthetic_desktop
+
+
+PATH = (
+    LocatorStep("Pane", "workbench.panel.chat", "pane-body"),
+    LocatorStep("Group", "chat-input", "interactive-input-part"),
+)
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("submit_autoclicker_test")
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def test_locator_path_stops_at_the_window_by_handle() -> None:
+    desktop = build_synthetic_desktop(window_count=1)
+    window = desktop.top_level[0]
+    submit = next(node for node in window.iter_subtree() if node.automation_id == "chat-submit")
+    desktop.counter.reset()
+
+    assert locator_path(window.handle, submit) == PATH
+    assert desktop.counter.calls["compare_elements"] == 0
+    assert resolve_path(window, PATH) is submit.parent()
+    # Without the window's handle there is nothing to stop at.
+    assert locator_path(0, submit) is None
+
+
+def test_hints_drop_entry_on_miss_and_bound_window_count() -> None:
+    hints = LocatorHints(max_windows=2)
+    for handle in (1, 2, 3):
+        hints.remember(handle, PATH)
+    assert 1 not in hints
+    assert hints.path_for(2, full_walk_every=10) == PATH
+
+    hints.record_miss(2)
+    assert 2 not in hints
+    assert hints.misses == 1
+
+
+def test_store_round_trips_through_versioned_file(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit ⏎"])
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    store.save(path, _logger())
+
+    loaded = LocatorStore.load(path, ["submit  ⏎"], _logger())
+    assert loaded.get(("code.exe", "Chrome_WidgetWin_1")) == PATH
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == LOCATOR_CACHE_VERSION
+
+
+def test_store_is_invalidated_when_button_texts_change(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit"])
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    store.save(path, _logger())
+
+    assert len(LocatorStore.load(path, ["Continue"], _logger())) == 0
+
+    store.bind_button_texts(["Submit", "Continue"])
+    assert len(store) == 0
+
+
+def test_store_ignores_other_versions_and_corrupt_files(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit"])
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    store.save(path, _logger())
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["version"] = LOCATOR_CACHE_VERSION + 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert len(LocatorStore.load(path, ["Submit"], _logger())) == 0
+
+    path.write_text("{not json", encoding="utf-8")
+    assert len(LocatorStore.load(path, ["Submit"], _logger())) == 0
+
+
+def test_store_trims_oldest_entries_to_fit_size_cap(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit"], max_entries=100, max_bytes=1024)
+    for index in range(40):
+        store.remember((f"app{index}.exe", "Chrome_WidgetWin_1"), PATH)
+    store.save(path, _logger())
+
+    assert path.stat().st_size <= 1024
+    loaded = LocatorStore.load(path, ["Submit"], _logger(), max_entries=100, max_bytes=1024)
+    assert 0 < len(loaded) < 40
+    assert loaded.get(("app39.exe", "Chrome_WidgetWin_1")) == PATH
+    assert loaded.get(("app0.exe", "Chrome_WidgetWin_1")) is None
+
+
+def test_store_autosaves_new_paths_without_a_clean_shutdown(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit"])
+    store.autosave(path, _logger(), min_interval_s=0.0)
+
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    deadline = time.monotonic() + 2.0
+    while store.saves == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert LocatorStore.load(path, ["Submit"], _logger()).get(("code.exe", "Chrome_WidgetWin_1")) == PATH
+
+    # Re-learning the same path is not a change and writes nothing.
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    time.sleep(0.05)
+    assert store.saves == 1
+
+
+def test_store_rate_limits_autosave_and_flushes_the_rest(tmp_path: Path) -> None:
+    path = tmp_path / "locator_cache.json"
+    store = LocatorStore(["Submit"])
+    store.autosave(path, _logger(), min_interval_s=60.0)
+
+    store.remember(("code.exe", "Chrome_WidgetWin_1"), PATH)
+    deadline = time.monotonic() + 2.0
+    while store.saves == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    store.remember(("cursor.exe", "Chrome_WidgetWin_1"), PATH)
+    time.sleep(0.05)
+    assert store.saves == 1
+
+    store.flush()
+    assert store.saves == 2
+    assert len(LocatorStore.load(path, ["Submit"], _logger())) == 2
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+
+from submit_autoclicker.core.lru import BoundedLRU
+
+
+def test_evicts_least_recently_used_entry() -> None:
+    lru: BoundedLRU[str, int] = BoundedLRU(max_entries=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+
+    assert lru.keys() == ["a", "c"]
+    assert lru.get("b") is None
+
+
+def test_peek_and_pop_do_not_count_as_a_use() -> None:
+    lru: BoundedLRU[str, int] = BoundedLRU(max_entries=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.peek("a") == 1
+    lru.put("c", 3)
+    assert "a" not in lru
+
+    assert lru.pop("b") == 2
+    assert lru.pop("b") is None
+    assert len(lru) == 1
+
+
+def test_setdefault_keeps_the_existing_value_and_touches_it() -> None:
+    lru: BoundedLRU[str, float] = BoundedLRU(max_entries=2)
+    assert lru.setdefault("a", 1.0) == 1.0
+    lru.put("b", 2.0)
+    assert lru.setdefault("a", 5.0) == 1.0
+    lru.put("c", 3.0)
+    assert lru.items() == [("a", 1.0), ("c", 3.0)]
+
+
+def test_resize_and_discard_where() -> None:
+    lru: BoundedLRU[int, str] = BoundedLRU(max_entries=4)
+    for key in range(4):
+        lru.put(key, str(key))
+
+    assert lru.discard_where(lambda key: key % 2 == 0) == 2
+    assert lru.keys() == [1, 3]
+    lru.resize(1)
+    assert lru.keys() == [3]
+    assert lru.max_entries == 1
+    lru.clear()
+    assert len(lru) == 0
+
+
+def test_concurrent_puts_stay_within_the_bound() -> None:
+    lru: BoundedLRU[tuple[int, int], int] = BoundedLRU(max_entries=16)
+
+    def _fill(worker: int) -> None:
+        for index in range(500):
+            lru.put((worker, index), index)
+            lru.get((worker, index // 2))
+
+    threads = [threading.Thread(target=_fill, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(lru) == 16
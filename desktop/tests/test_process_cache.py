@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from submit_autoclicker.adapters.process_cache import ProcessNameCache, ProcessPresenceGate
+from tests.fakes_uia import FakeNoSuchProcess, FakeProcessTable
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def now(self) -> float:
+        return self.value
+
+
+def _build_cache(fake: FakeProcessTable, clock: FakeClock, max_entries: int = 8) -> ProcessNameCache:
+    return ProcessNameCache(
+        psutil_module=fake,
+        max_entries=max_entries,
+        revalidate_interval_s=2.0,
+        monotonic_fn=clock.now,
+    )
+
+
+def test_cache_serves_fresh_entries_without_syscalls() -> None:
+    fake = FakeProcessTable()
+    fake.table[100] = ("Code.exe", 1.0)
+    clock = FakeClock()
+    cache = _build_cache(fake, clock)
+
+    assert cache.name(100) == "Code.exe"
+    assert cache.name(100) == "Code.exe"
+    assert cache.name(100) == "Code.exe"
+
+    assert fake.calls["name"] == 1
+    assert fake.calls["create_time"] == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_revalidates_by_create_time_and_detects_pid_reuse() -> None:
+    fake = FakeProcessTable()
+    fake.table[100] = ("Code.exe", 1.0)
+    clock = FakeClock()
+    cache = _build_cache(fake, clock)
+    assert cache.name(100) == "Code.exe"
+
+    clock.value = 3.0
+    assert cache.name(100) == "Code.exe"
+    assert cache.revalidations == 1
+    assert fake.calls["name"] == 1
+
+    # Same pid, new process.
+    fake.table[100] = ("notepad.exe", 5.0)
+    clock.value = 6.0
+    assert cache.name(100) == "notepad.exe"
+    assert cache.stale == 1
+    assert fake.calls["name"] == 2
+
+
+def test_cache_drops_exited_processes() -> None:
+    fake = FakeProcessTable()
+    fake.table[100] = ("Code.exe", 1.0)
+    clock = FakeClock()
+    cache = _build_cache(fake, clock)
+    assert cache.name(100) == "Code.exe"
+
+    del fake.table[100]
+    clock.value = 3.0
+    with pytest.raises(FakeNoSuchProcess):
+        cache.name(100)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used_pids() -> None:
+    fake = FakeProcessTable()
+    for pid in range(4):
+        fake.table[pid] = (f"proc{pid}.exe", float(pid))
+    clock = FakeClock()
+    cache = _build_cache(fake, clock, max_entries=2)
+
+    cache.name(0)
+    cache.name(1)
+    cache.name(0)
+    cache.name(2)
+
+    assert len(cache) == 2
+    calls_before = fake.calls["name"]
+    cache.name(0)
+    assert fake.calls["name"] == calls_before
+    cache.name(1)
+    assert fake.calls["name"] == calls_before + 1
+
+
+def test_presence_gate_tracks_allowlisted_pids_at_low_rate() -> None:
+    fake = FakeProcessTable({1: ("Code.exe", 1.0), 2: ("explorer.exe", 1.0)})
+    clock = FakeClock()
+    gate = ProcessPresenceGate(psutil_module=fake, monotonic_fn=clock.now)
+
+    assert gate.pids(["code.exe"], refresh_interval_s=2.0) == {1}
+    fake.table[3] = ("Code.exe", 2.0)
+    assert gate.pids(["code.exe"], refresh_interval_s=2.0) == {1}
+    assert fake.calls["process_iter"] == 1
+
+    clock.value = 2.0
+    assert gate.pids(["code.exe"], refresh_interval_s=2.0) == {1, 3}
+
+    del fake.table[1]
+    del fake.table[3]
+    gate.invalidate()
+    assert gate.pids(["code.exe"], refresh_interval_s=2.0) == frozenset()
+    assert gate.refreshes == 3
+
+
+def test_presence_gate_refreshes_when_allowlist_changes() -> None:
+    fake = FakeProcessTable({1: ("Code.exe", 1.0), 2: ("notepad.exe", 1.0)})
+    gate = ProcessPresenceGate(psutil_module=fake, monotonic_fn=FakeClock().now)
+
+    assert gate.pids(["Code.exe"], refresh_interval_s=60.0) == {1}
+    assert gate.pids(["notepad.exe"], refresh_interval_s=60.0) == {2}
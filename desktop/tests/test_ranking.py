@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.policy import CompiledPolicy
+from submit_autoclicker.core.ranking import CandidateRanker, ScoreWeights
+from submit_autoclicker.models import ButtonCandidate, WindowIdentity
+
+
+def _candidate(handle: int, button_text: str = "Submit") -> ButtonCandidate:
+    return ButtonCandidate(
+        window=WindowIdentity(title="Visual Studio Code", process_name="Code.exe", handle=handle),
+        button_text=button_text,
+        enabled=True,
+        near_text="",
+        source="fake",
+        click_action=lambda allow_focus: True,
+    )
+
+
+def _rank(
+    ranker: CandidateRanker,
+    found: list,
+    *,
+    foreground: int | None = None,
+    now: float = 0.0,
+    full_scan: bool = True,
+) -> list[int]:
+    config = AppConfig(button_texts=["Submit"])
+    ranked = ranker.rank(
+        found,
+        policy=CompiledPolicy(config),
+        weights=ScoreWeights.from_config(config),
+        provider_names=["uia", "image"],
+        foreground=foreground,
+        now=now,
+        full_scan=full_scan,
+    )
+    return [candidate.window.handle for candidate, _ in ranked]
+
+
+def test_rank_prefers_foreground_exact_match_and_earlier_provider() -> None:
+    ranker = CandidateRanker()
+    found = [
+        (_candidate(1, "Submit ⏎"), "uia"),
+        (_candidate(2), "image"),
+        (_candidate(3), "uia"),
+        (_candidate(4, "Submit ⏎"), "uia"),
+    ]
+
+    # Defaults: foreground 4, exact match 2, provider ahead of the last one 1.
+    assert _rank(ranker, found, foreground=4) == [4, 3, 2, 1]
+    assert _rank(ranker, found) == [3, 2, 1, 4]
+
+
+def test_waiting_windows_eventually_outrank_the_foreground() -> None:
+    ranker = CandidateRanker()
+    found = [(_candidate(1), "uia"), (_candidate(2), "uia")]
+
+    served = []
+    for second in range(20):
+        best = _rank(ranker, found, foreground=1, now=float(second))[0]
+        served.append(best)
+        ranker.note_served(next(candidate for candidate, _ in found if candidate.window.handle == best))
+
+    # The background window is served every time it has waited more than 4 / 0.5 = 8 seconds.
+    assert served.count(2) == 2
+    assert served[9] == 2
+
+
+def test_windows_without_a_candidate_stop_waiting() -> None:
+    ranker = CandidateRanker()
+    background = (_candidate(1), "uia")
+    foreground = (_candidate(2), "uia")
+
+    assert _rank(ranker, [background], now=0.0) == [1]
+    # A partial scan that does not reach the background window keeps its wait time.
+    assert _rank(ranker, [foreground], foreground=2, now=10.0, full_scan=False) == [2]
+    assert len(ranker) == 2
+    # A full scan without its candidate ends the wait, so an hour later it starts from zero.
+    assert _rank(ranker, [foreground], foreground=2, now=20.0) == [2]
+    assert len(ranker) == 1
+    ranker.note_served(foreground[0])
+    assert _rank(ranker, [background, foreground], foreground=2, now=3600.0) == [2, 1]
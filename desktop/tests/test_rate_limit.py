@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.rate_limit import ClickRateLimiter
+
+
+def _config(**overrides: object) -> AppConfig:
+    config = AppConfig(click_rate_limit=True, click_burst=2, click_refill_per_s=0.5)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+def test_global_bucket_allows_a_burst_then_the_refill_rate() -> None:
+    limiter = ClickRateLimiter(_config())
+
+    for _ in range(2):
+        assert limiter.allows("Code.exe", now=0.0) is True
+        limiter.consume("Code.exe", now=0.0)
+    assert limiter.allows("Code.exe", now=0.0) is False
+    assert limiter.global_ready(now=1.0) is False
+    assert limiter.global_ready(now=2.0) is True
+    assert limiter.remaining(now=2.0) == (1.0, {})
+
+    limiter.consume("Code.exe", now=2.0)
+    limiter.refund("Code.exe")
+    assert limiter.remaining(now=2.0) == (1.0, {})
+    # Never more than the burst size, however long the limiter idles.
+    assert limiter.remaining(now=100.0) == (2.0, {})
+
+
+def test_process_buckets_limit_each_process_separately() -> None:
+    limiter = ClickRateLimiter(_config(click_burst=10, process_click_burst=1, process_click_refill_per_s=0.1))
+
+    limiter.consume("Code.exe", now=0.0)
+    assert limiter.allows("code.exe", now=1.0) is False
+    assert limiter.allows("Cursor.exe", now=1.0) is True
+    assert limiter.allows("Code.exe", now=10.0) is True
+    assert limiter.remaining(now=10.0) == (10.0, {"code.exe": 1.0, "cursor.exe": 1.0})
+
+    # Reloading unchanged limits keeps the levels; changed limits start full.
+    limiter.consume("Code.exe", now=10.0)
+    limiter.configure(_config(click_burst=10, process_click_burst=1, process_click_refill_per_s=0.1))
+    assert limiter.allows("Code.exe", now=10.0) is False
+    limiter.configure(_config(click_burst=10, process_click_burst=2, process_click_refill_per_s=0.1))
+    assert limiter.allows("Code.exe", now=10.0) is True
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.scheduler import (
+    SCAN_TIER_FOREGROUND,
+    SCAN_TIER_FULL,
+    SCAN_TIER_RECENT,
+    AdaptivePollScheduler,
+    ScanTierSchedule,
+)
+
+
+def _build_config() -> AppConfig:
+    return AppConfig(
+        poll_interval_ms=200,
+        adaptive_polling=True,
+        idle_backoff_max_ms=1000,
+        idle_backoff_factor=2.0,
+        burst_interval_ms=50,
+        burst_window_ms=3000,
+    )
+
+
+def test_idle_scans_back_off_exponentially_up_to_ceiling() -> None:
+    scheduler = AdaptivePollScheduler(_build_config())
+
+    intervals = []
+    for _ in range(5):
+        intervals.append(scheduler.interval_ms(now=0.0))
+        scheduler.record_scan(found=False, now=0.0)
+
+    assert intervals == [200, 400, 800, 1000, 1000]
+
+
+def test_activity_snaps_to_burst_interval_for_window() -> None:
+    scheduler = AdaptivePollScheduler(_build_config())
+    for _ in range(4):
+        scheduler.record_scan(found=False, now=0.0)
+    assert scheduler.interval_ms(now=0.0) == 1000
+
+    scheduler.record_scan(found=True, now=10.0)
+    assert scheduler.interval_ms(now=10.0) == 50
+
+    # Idle scans inside the burst window keep the fast interval.
+    scheduler.record_scan(found=False, now=11.0)
+    assert scheduler.interval_ms(now=12.9) == 50
+
+    assert scheduler.interval_ms(now=13.0) == 200
+    scheduler.record_scan(found=False, now=13.0)
+    assert scheduler.interval_ms(now=13.0) == 400
+
+
+def test_configure_keeps_backoff_state() -> None:
+    scheduler = AdaptivePollScheduler(_build_config())
+    scheduler.record_scan(found=False, now=0.0)
+
+    updated = _build_config()
+    updated.poll_interval_ms = 100
+    scheduler.configure(updated)
+
+    assert scheduler.interval_ms(now=0.0) == 200
+
+
+def test_tier_schedule_scans_foreground_every_tick_and_sweeps_periodically() -> None:
+    config = AppConfig(foreground_tiering=True, recent_window_every=2, full_sweep_every=5)
+    schedule = ScanTierSchedule()
+
+    tiers = [schedule.next_tier(config) for _ in range(7)]
+    assert tiers == [
+        SCAN_TIER_FULL,
+        SCAN_TIER_FOREGROUND,
+        SCAN_TIER_RECENT,
+        SCAN_TIER_FOREGROUND,
+        SCAN_TIER_RECENT,
+        SCAN_TIER_FULL,
+        SCAN_TIER_FOREGROUND,
+    ]
+
+    schedule.request_full_sweep()
+    assert schedule.next_tier(config) == SCAN_TIER_FULL
+    assert schedule.counts == {SCAN_TIER_FOREGROUND: 3, SCAN_TIER_RECENT: 2, SCAN_TIER_FULL: 3}
+    assert ScanTierSchedule().next_tier(AppConfig()) == SCAN_TIER_FULL
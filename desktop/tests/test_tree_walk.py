@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from submit_autoclicker.adapters.tree_walk import (
+    BUDGET_DEPTH,
+    BUDGET_NODES,
+    BUDGET_TIME,
+    WalkBudget,
+    iter_buttons_prioritized,
+)
+from tests.fakes_uia import FakeElement, ReadCounter, build_synthetic_desktop
+
+
+def _walk(root: FakeElement, budget: WalkBudget, **kwargs: object) -> tuple[list[str], list[str]]:
+    reasons: list[str] = []
+    names = [button.name for button in iter_buttons_prioritized(root, budget, on_exhausted=reasons.append, **kwargs)]
+    return names, reasons
+
+
+def test_unlimited_walk_finds_the_same_buttons_as_descendants() -> None:
+    window = build_synthetic_desktop(window_count=1, buttons_per_window=12).top_level[0]
+    expected = sorted(node.name for node in window.iter_subtree() if node.control_type == "Button")
+
+    names, reasons = _walk(window, WalkBudget(max_nodes=10_000))
+
+    assert sorted(names) == expected
+    assert reasons == []
+
+
+def test_chat_input_region_is_visited_before_toolbar() -> None:
+    window = build_synthetic_desktop(window_count=1, buttons_per_window=40).top_level[0]
+
+    # Window children (2), chat panel (1), chat input (3): the toolbar's 40 buttons are never reached.
+    names, reasons = _walk(window, WalkBudget(max_nodes=6))
+
+    assert names == ["Attach context", "Submit ⏎"]
+    assert reasons == [BUDGET_NODES]
+
+
+def test_depth_limit_stops_expanding_deep_containers() -> None:
+    window = build_synthetic_desktop(window_count=1, buttons_per_window=2).top_level[0]
+
+    shallow, shallow_reasons = _walk(window, WalkBudget(max_depth=2))
+    deep, deep_reasons = _walk(window, WalkBudget(max_depth=4))
+
+    assert "Submit ⏎" not in shallow
+    assert shallow_reasons == [BUDGET_DEPTH]
+    assert "Submit ⏎" in deep
+    assert deep_reasons == []
+
+
+def test_time_budget_ends_the_walk() -> None:
+    counter = ReadCounter()
+    root = FakeElement(counter, control_type="Window")
+    for index in range(5):
+        root.add_child(
+            FakeElement(
+                counter,
+                control_type="Pane",
+                children=[FakeElement(counter, name=f"Button {index}", control_type="Button")],
+            )
+        )
+    ticks = iter(range(100))
+
+    names, reasons = _walk(root, WalkBudget(time_budget_s=3.5), monotonic_fn=lambda: next(ticks))
+
+    assert names == ["Button 0", "Button 1"]
+    assert reasons == [BUDGET_TIME]
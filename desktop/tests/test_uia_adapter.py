@@ -0,0 +1,667 @@
+from __future__ import annotations
+
+import logging
+import random
+
+from submit_autoclicker.adapters.image_adapter import ImageFallbackAdapter
+from submit_autoclicker.adapters.locator import LocatorStore
+from submit_autoclicker.adapters.process_cache import ProcessNameCache, ProcessPresenceGate
+from submit_autoclicker.adapters.session import AutomationSession
+from submit_autoclicker.adapters.uia_adapter import UIAAdapter
+from submit_autoclicker.adapters.uia_backend import (
+    AndCondition,
+    OrCondition,
+    PropertyCondition,
+    button_name_condition,
+)
+from submit_autoclicker.config import AppConfig
+from submit_autoclicker.core.engine import ClickEngine
+from submit_autoclicker.core.events import EVENT_STRUCTURE_CHANGED, EVENT_WINDOW_OPENED
+from submit_autoclicker.core.scheduler import SCAN_TIER_FOREGROUND, SCAN_TIER_FULL, SCAN_TIER_RECENT
+from submit_autoclicker.models import ChangeEvent
+from tests.fakes_uia import (
+    FakeConditionSearch,
+    FakeDesktop,
+    FakeDesktopFactory,
+    FakeElement,
+    FakeProcessTable,
+    FakeRect,
+    FakeSubtreeFetcher,
+    ReadCounter,
+    build_synthetic_desktop,
+)
+
+
+class ListOnlyProvider:
+    def __init__(self, adapter: UIAAdapter) -> None:
+        self.name = adapter.name
+        self._adapter = adapter
+
+    def scan(self, config: AppConfig) -> list:
+        return self._adapter.scan(config)
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("submit_autoclicker_test")
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def _build_config() -> AppConfig:
+    return AppConfig(
+        allowed_processes=["Code.exe"],
+        allowed_window_title_contains=["Visual Studio Code"],
+        button_texts=["Submit ⏎"],
+        click_cooldown_ms=0,
+        dry_run=False,
+    )
+
+
+def _build_adapter(
+    desktop: FakeDesktop,
+    processes: FakeProcessTable | None = None,
+    **kwargs: object,
+) -> UIAAdapter:
+    processes = processes or FakeProcessTable({4242: ("Code.exe", 1.0)})
+    return UIAAdapter(
+        _logger(),
+        session=AutomationSession(_logger(), desktop_factory=lambda: desktop),
+        process_name_fn=ProcessNameCache(psutil_module=processes).name,
+        presence_gate=ProcessPresenceGate(psutil_module=processes),
+        **kwargs,
+    )
+
+
+def test_scan_returns_every_matching_button() -> None:
+    desktop = build_synthetic_desktop(window_count=5, buttons_per_window=3, enabled_submit_windows=(2,))
+    adapter = _build_adapter(desktop)
+
+    candidates = adapter.scan(_build_config())
+
+    assert [candidate.enabled for candidate in candidates] == [False, False, True, False, False]
+    assert all(candidate.button_text == "Submit ⏎" for candidate in candidates)
+    assert "make these changes" in candidates[2].near_text
+
+
+def test_streaming_scan_stops_walking_after_first_acceptable_candidate() -> None:
+    list_desktop = build_synthetic_desktop(window_count=50)
+    list_engine = ClickEngine(
+        config=_build_config(),
+        providers=[ListOnlyProvider(_build_adapter(list_desktop))],
+        logger=_logger(),
+    )
+    stream_desktop = build_synthetic_desktop(window_count=50)
+    stream_engine = ClickEngine(
+        config=_build_config(),
+        providers=[_build_adapter(stream_desktop)],
+        logger=_logger(),
+    )
+
+    assert list_engine.run_once() is True
+    assert stream_engine.run_once() is True
+
+    assert stream_desktop.counter.calls["process_id"] == 11
+    assert list_desktop.counter.calls["process_id"] == 50
+    assert stream_desktop.counter.total * 3 < list_desktop.counter.total
+
+    clicked = [node for window in stream_desktop.top_level for node in window.iter_subtree() if node.invocations]
+    assert len(clicked) == 1
+    assert clicked[0].enabled is True
+
+
+class RecordingEventSource:
+    active = True
+
+    def __init__(self) -> None:
+        self.watched: list[int] = []
+        self.retained: set[int] | None = None
+
+    def watch_window(self, window: object, handle: int | None) -> None:
+        if handle:
+            self.watched.append(handle)
+
+    def retain_windows(self, handles: set[int]) -> None:
+        self.retained = set(handles)
+
+
+def test_streaming_scan_subscribes_every_allowlisted_window_before_the_early_exit() -> None:
+    desktop = build_synthetic_desktop(window_count=50)
+    adapter = _build_adapter(desktop)
+    source = RecordingEventSource()
+    adapter.event_source = source
+
+    first = next(candidate for candidate in adapter.iter_scan(_build_config()) if candidate.enabled)
+
+    handles = [window.handle for window in desktop.top_level]
+    assert first.window.handle == handles[10]
+    assert source.watched == handles
+    assert source.retained == set(handles)
+
+
+def test_engine_shares_policy_decision_cache_with_adapter() -> None:
+    desktop = build_synthetic_desktop(window_count=4, buttons_per_window=2, enabled_submit_windows=())
+    adapter = _build_adapter(desktop)
+    engine = ClickEngine(config=_build_config(), providers=[adapter], logger=_logger())
+
+    assert engine.run_once() is False
+    assert engine.run_once() is False
+    status = engine.status()
+    assert status["policy_cache_misses"] == 4
+    assert status["policy_cache_hits"] == 4
+
+    previous_version = status["policy_version"]
+    engine.update_config(_build_config())
+    status = engine.status()
+    assert status["policy_version"] != previous_version
+    assert status["policy_cache_hits"] == 0
+    assert engine.run_once() is False
+    assert engine.status()["policy_cache_misses"] == 4
+
+
+def test_presence_gate_skips_uia_when_no_allowlisted_process_runs() -> None:
+    desktop = build_synthetic_desktop(window_count=3)
+    constructions = {"count": 0}
+
+    def desktop_factory() -> FakeDesktop:
+        constructions["count"] += 1
+        return desktop
+
+    processes = FakeProcessTable({1: ("explorer.exe", 1.0)})
+    adapter = UIAAdapter(
+        _logger(),
+        session=AutomationSession(_logger(), desktop_factory=desktop_factory),
+        process_name_fn=ProcessNameCache(psutil_module=processes).name,
+        presence_gate=ProcessPresenceGate(psutil_module=processes),
+    )
+
+    assert adapter.scan(_build_config()) == []
+    assert constructions["count"] == 0
+    assert desktop.counter.total == 0
+    assert adapter.metrics()["gated_scans"] == 1
+
+
+def test_presence_gate_filters_windows_by_pid_before_reading_titles() -> None:
+    desktop = build_synthetic_desktop(window_count=4, enabled_submit_windows=(3,))
+    desktop.top_level[0]._process_id = 7
+    desktop.top_level[1]._process_id = 7
+    processes = FakeProcessTable({4242: ("Code.exe", 1.0), 7: ("explorer.exe", 1.0)})
+    adapter = _build_adapter(desktop, processes)
+
+    candidates = adapter.scan(_build_config())
+
+    assert [candidate.window.handle for candidate in candidates] == [0x1002, 0x1003]
+    assert adapter.metrics()["windows_skipped_by_pid"] == 2
+    assert processes.calls["name"] == 1
+    # Two gated windows: no title read, no descendants walk. The other two walk once each.
+    assert desktop.counter.calls["process_id"] == 4
+    assert desktop.counter.calls["descendants"] == 2
+
+
+def test_session_reuses_one_desktop_across_scans_and_rebuilds_after_failure() -> None:
+    desktop = build_synthetic_desktop(window_count=3, enabled_submit_windows=(1,))
+    factory = FakeDesktopFactory(desktop)
+    session = AutomationSession(_logger(), desktop_factory=factory)
+    processes = FakeProcessTable({4242: ("Code.exe", 1.0)})
+    adapter = UIAAdapter(
+        _logger(),
+        session=session,
+        process_name_fn=ProcessNameCache(psutil_module=processes).name,
+        presence_gate=ProcessPresenceGate(psutil_module=processes),
+    )
+    config = _build_config()
+
+    for _ in range(5):
+        assert len(adapter.scan(config)) == 3
+    assert factory.constructions == 1
+
+    factory.created[-1].broken = True
+    assert adapter.scan(config) == []
+    assert session.failures == 1
+    assert len(adapter.scan(config)) == 3
+    assert factory.constructions == 2
+    assert adapter.metrics()["desktop_constructions"] == 2
+
+
+def test_image_adapter_reads_active_window_identity_and_region_in_one_lookup() -> None:
+    desktop = build_synthetic_desktop(window_count=2)
+    desktop.active = desktop.top_level[1]
+    desktop.active.rect = FakeRect(100, 50, 900, 650)
+    factory = FakeDesktopFactory(desktop)
+    session = AutomationSession(_logger(), desktop_factory=factory)
+    processes = FakeProcessTable({4242: ("Code.exe", 1.0)})
+    adapter = ImageFallbackAdapter(
+        _logger(),
+        session=session,
+        process_name_fn=ProcessNameCache(psutil_module=processes).name,
+    )
+
+    for _ in range(3):
+        identity, region = adapter._active_window_info()
+        assert identity.handle == 0x1001
+        assert identity.process_name == "Code.exe"
+        assert region == (100, 50, 800, 600)
+
+    assert factory.constructions == 1
+    assert desktop.counter.calls["get_active"] == 3
+
+
+def _candidate_view(candidates: list) -> list[tuple[int, str, bool, str]]:
+    return [
+        (candidate.window.handle, candidate.button_text, candidate.enabled, candidate.near_text)
+        for candidate in candidates
+    ]
+
+
+def test_batched_fetch_matches_element_walk_with_one_round_trip_per_window() -> None:
+    live_desktop = build_synthetic_desktop(window_count=4, buttons_per_window=10, enabled_submit_windows=(1, 3))
+    batched_desktop = build_synthetic_desktop(window_count=4, buttons_per_window=10, enabled_submit_windows=(1, 3))
+    fetcher = FakeSubtreeFetcher(batched_desktop.counter)
+    live_adapter = _build_adapter(live_desktop)
+    batched_adapter = _build_adapter(batched_desktop, tree_fetcher=fetcher)
+    config = _build_config()
+    config.batched_uia_fetch = True
+
+    live = live_adapter.scan(_build_config())
+    batched = batched_adapter.scan(config)
+
+    assert _candidate_view(batched) == _candidate_view(live)
+    assert fetcher.round_trips == 4
+    assert batched_desktop.counter.calls["descendants"] == 0
+    assert batched_desktop.counter.calls["window_text"] == 4
+    assert batched_desktop.counter.total < live_desktop.counter.total / 5
+
+    assert batched[1].click_action(False) is True
+    assert sum(node.invocations for node in batched_desktop.top_level[1].iter_subtree()) == 1
+
+
+def test_name_conditions_return_the_same_candidates_as_the_python_filter() -> None:
+    rng = random.Random(14)
+    words = ["Submit", "submit", "SUBMIT", "Continue", "Yes", "Apply", "Submitted", "Run", "Keep"]
+    suffixes = ["", " ⏎", "  ⏎", ", and don't ask again", "ted", "...", " (Ctrl+Enter)", "2"]
+    patterns_pool = ["Submit ⏎", "Submit", "Continue", "Yes", "yes,", "Apply Changes", "Keep  All"]
+
+    for _ in range(40):
+        live_desktop = FakeDesktop(ReadCounter())
+        search_desktop = FakeDesktop(ReadCounter())
+        seed = rng.random()
+        for desktop in (live_desktop, search_desktop):
+            labels = random.Random(seed)
+            for index in range(3):
+                window = FakeElement(
+                    desktop.counter,
+                    name=f"proj{index} - Visual Studio Code",
+                    control_type="Window",
+                    process_id=4242,
+                    handle=0x2000 + index,
+                )
+                for _ in range(12):
+                    window.add_child(
+                        FakeElement(
+                            desktop.counter,
+                            name=f"{labels.choice(words)}{labels.choice(suffixes)}",
+                            control_type=labels.choice(["Button", "Button", "Text"]),
+                        )
+                    )
+                desktop.top_level.append(window)
+        config = _build_config()
+        config.button_texts = rng.sample(patterns_pool, rng.randint(1, 3))
+
+        live = _build_adapter(live_desktop).scan(config)
+        config.uia_name_conditions = True
+        search = FakeConditionSearch(search_desktop.counter)
+        adapter = _build_adapter(search_desktop, condition_search=search)
+        pushed_down = adapter.scan(config)
+
+        assert _candidate_view(pushed_down) == _candidate_view(live), config.button_texts
+        assert adapter.metrics()["condition_searches"] == 3
+
+
+def test_name_conditions_cut_elements_returned_by_the_provider() -> None:
+    live_desktop = build_synthetic_desktop(window_count=5, buttons_per_window=40)
+    search_desktop = build_synthetic_desktop(window_count=5, buttons_per_window=40)
+    config = _build_config()
+    config.uia_name_conditions = True
+
+    live = _build_adapter(live_desktop).scan(_build_config())
+    pushed_down = _build_adapter(search_desktop, condition_search=FakeConditionSearch(search_desktop.counter)).scan(
+        config
+    )
+
+    assert _candidate_view(pushed_down) == _candidate_view(live)
+    assert search_desktop.counter.calls["descendant_nodes"] < live_desktop.counter.calls["descendant_nodes"] / 5
+
+
+def test_name_condition_is_skipped_for_labels_needing_full_case_folding() -> None:
+    assert button_name_condition(["Straße"]) is None
+    assert button_name_condition(["  "]) is None
+    assert button_name_condition(["Submit ⏎", "submit", "Yes, and don't ask"]) == AndCondition(
+        (
+            PropertyCondition("control_type", "Button"),
+            OrCondition(
+                (
+                    PropertyCondition("name", "submit", ignore_case=True, substring=True),
+                    PropertyCondition("name", "yes,", ignore_case=True, substring=True),
+                )
+            ),
+        )
+    )
+
+
+def test_locator_hint_searches_last_known_panel_first() -> None:
+    desktop = build_synthetic_desktop(window_count=2, buttons_per_window=30, enabled_submit_windows=(0, 1))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.locator_hints = True
+
+    first = adapter.scan(config)
+    desktop.counter.reset()
+    second = adapter.scan(config)
+
+    assert _candidate_view(second) == _candidate_view(first)
+    assert adapter.metrics()["locator_hits"] == 2
+    assert adapter.metrics()["locator_misses"] == 0
+    # Hinted scans never list the toolbar's 30 buttons.
+    assert desktop.counter.calls["descendant_nodes"] < 20
+
+
+def test_locator_hint_miss_falls_back_to_full_walk_and_relearns() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.locator_hints = True
+    adapter.scan(config)
+
+    window = desktop.top_level[0]
+    panel = next(node for node in window.iter_subtree() if node.automation_id == "workbench.panel.chat")
+    chat_input = next(node for node in panel.iter_subtree() if node.automation_id == "chat-input")
+    panel.remove_child(chat_input)
+    window.add_child(chat_input)
+
+    assert [candidate.button_text for candidate in adapter.scan(config)] == ["Submit ⏎"]
+    assert adapter.metrics()["locator_misses"] == 1
+    assert [candidate.button_text for candidate in adapter.scan(config)] == ["Submit ⏎"]
+    assert adapter.metrics()["locator_hits"] == 1
+
+
+def test_locator_hint_forces_full_walk_every_nth_scan() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.locator_hints = True
+    config.locator_full_walk_every = 3
+
+    for _ in range(5):
+        adapter.scan(config)
+
+    metrics = adapter.metrics()
+    assert metrics["locator_full_walks"] == 1
+    assert metrics["locator_hits"] == 3
+
+
+def test_persisted_locator_store_warm_starts_a_fresh_adapter(tmp_path) -> None:
+    cache_path = tmp_path / "locator_cache.json"
+    config = _build_config()
+    config.locator_hints = True
+
+    first_store = LocatorStore(config.button_texts)
+    _build_adapter(build_synthetic_desktop(window_count=1), locator_store=first_store).scan(config)
+    first_store.save(cache_path, _logger())
+
+    desktop = build_synthetic_desktop(window_count=1, buttons_per_window=200)
+    desktop.top_level[0].handle = 0x9000
+    adapter = _build_adapter(desktop, locator_store=LocatorStore.load(cache_path, config.button_texts, _logger()))
+
+    assert [candidate.button_text for candidate in adapter.scan(config)] == ["Submit ⏎"]
+    metrics = adapter.metrics()
+    assert metrics["locator_warm_starts"] == 1
+    assert metrics["locator_hits"] == 1
+    assert desktop.counter.calls["descendant_nodes"] < 10
+
+
+def test_near_text_is_only_collected_when_policy_requires_it() -> None:
+    desktop = build_synthetic_desktop(window_count=3, enabled_submit_windows=(2,))
+    adapter = _build_adapter(desktop)
+    engine = ClickEngine(config=_build_config(), providers=[adapter], logger=_logger())
+
+    assert engine.run_once() is True
+    assert adapter.metrics()["near_text_collections"] == 0
+    assert desktop.counter.calls["children"] == 0
+
+    config = _build_config()
+    config.require_near_text_contains = ["make these changes"]
+    engine.update_config(config)
+    assert engine.run_once() is True
+    # Disabled Submit buttons in windows 0 and 1 are skipped before their context is read.
+    assert adapter.metrics()["near_text_collections"] == 1
+
+
+def test_near_text_is_memoized_and_walk_is_bounded() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    chat_input = next(node for node in desktop.top_level[0].iter_subtree() if node.automation_id == "chat-input")
+    for index in range(500):
+        chat_input.add_child(FakeElement(desktop.counter, name=f"message {index}", control_type="Text"))
+    adapter = _build_adapter(desktop)
+    candidate = adapter.scan(_build_config())[0]
+    desktop.counter.reset()
+
+    first = candidate.near_text
+    second = candidate.near_text
+
+    assert first is second
+    assert first.startswith("Do you want to make these changes? | Attach context | Submit ⏎ | message 0")
+    assert adapter.metrics()["near_text_collections"] == 1
+    assert desktop.counter.calls["window_text"] <= 30
+    assert desktop.counter.calls["compare_elements"] == 0
+
+
+def test_walk_budget_exhaustion_is_reported_per_window() -> None:
+    desktop = build_synthetic_desktop(window_count=2, buttons_per_window=40, enabled_submit_windows=(0, 1))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.walk_node_budget = 6
+
+    candidates = adapter.scan(config)
+
+    assert [candidate.button_text for candidate in candidates] == ["Submit ⏎", "Submit ⏎"]
+    metrics = adapter.metrics()
+    assert metrics["walk_budget_exhausted"] == 2
+    assert metrics["walk_budget_windows"] == {
+        "proj0 - Visual Studio Code (0x1000)": {"nodes": 1},
+        "proj1 - Visual Studio Code (0x1001)": {"nodes": 1},
+    }
+    assert desktop.counter.calls["descendants"] == 0
+
+
+def _negative_cache_config() -> AppConfig:
+    config = _build_config()
+    config.negative_cache = True
+    config.negative_cache_threshold = 2
+    config.negative_cache_max_backoff = 4
+    return config
+
+
+def test_negative_cache_backs_off_windows_without_buttons() -> None:
+    desktop = build_synthetic_desktop(window_count=4, enabled_submit_windows=(0,))
+    for window in desktop.top_level[1:]:
+        chat_panel = next(node for node in window.iter_subtree() if node.automation_id == "workbench.panel.chat")
+        window.remove_child(chat_panel)
+    adapter = _build_adapter(desktop)
+    config = _negative_cache_config()
+
+    scanned_per_cycle = []
+    for _ in range(10):
+        desktop.counter.reset()
+        assert [candidate.window.handle for candidate in adapter.scan(config)] == [0x1000]
+        scanned_per_cycle.append(desktop.counter.calls["descendants"])
+
+    # Two empty scans, then windows 1-3 come back after 2 and then every 4 cycles.
+    assert scanned_per_cycle == [4, 4, 1, 4, 1, 1, 1, 4, 1, 1]
+    assert adapter.metrics()["negative_cache_skip_ratio"] == 0.75
+
+
+def test_negative_cache_resets_on_structure_change_and_title_change() -> None:
+    desktop = build_synthetic_desktop(window_count=2, enabled_submit_windows=(0,))
+    empty_window = desktop.top_level[1]
+    chat_panel = next(node for node in empty_window.iter_subtree() if node.automation_id == "workbench.panel.chat")
+    empty_window.remove_child(chat_panel)
+    adapter = _build_adapter(desktop)
+    config = _negative_cache_config()
+    for _ in range(2):
+        adapter.scan(config)
+    assert len(adapter.scan(config)) == 1
+    assert adapter.metrics()["negative_cache_skipped"] == 1
+
+    empty_window.add_child(chat_panel)
+    adapter.on_change_events([ChangeEvent(kind=EVENT_STRUCTURE_CHANGED, handle=empty_window.handle)])
+    assert len(adapter.scan(config)) == 2
+
+    empty_window.remove_child(chat_panel)
+    for _ in range(2):
+        adapter.scan(config)
+    empty_window.name = "other.py - proj1 - Visual Studio Code"
+    desktop.counter.reset()
+    adapter.scan(config)
+    assert desktop.counter.calls["descendants"] == 2
+
+
+def test_foreground_tiering_limits_scans_to_foreground_and_recent_windows() -> None:
+    desktop = build_synthetic_desktop(window_count=4, enabled_submit_windows=(0, 1, 2, 3))
+    foreground = [0x1000]
+    adapter = _build_adapter(desktop, foreground_fn=lambda: foreground[0])
+    config = _build_config()
+    config.foreground_tiering = True
+    config.recent_window_count = 2
+
+    def scan(tier: str) -> list[int]:
+        adapter.set_scan_tier(tier)
+        return [candidate.window.handle for candidate in adapter.scan(config)]
+
+    assert scan(SCAN_TIER_FULL) == [0x1000, 0x1001, 0x1002, 0x1003]
+    foreground[0] = 0x1002
+    assert scan(SCAN_TIER_FOREGROUND) == [0x1002]
+    foreground[0] = 0x1001
+    assert scan(SCAN_TIER_FOREGROUND) == [0x1001]
+    # The two windows that last had the foreground, plus the current one.
+    foreground[0] = 0x1003
+    assert scan(SCAN_TIER_RECENT) == [0x1001, 0x1002, 0x1003]
+    # The tier applies to one scan; without a new one the next scan covers everything.
+    assert len(adapter.scan(config)) == 4
+
+    metrics = adapter.metrics()
+    assert metrics["windows_skipped_by_tier"] == 7
+    assert metrics["foreground_changes"] == 4
+    assert metrics["scan_tier"] == SCAN_TIER_FULL
+
+    # Unknown foreground window: fall back to the recent windows.
+    foreground[0] = None
+    assert scan(SCAN_TIER_FOREGROUND) == [0x1001, 0x1003]
+
+
+def test_only_an_allowlisted_window_opening_snaps_to_burst() -> None:
+    desktop = build_synthetic_desktop(window_count=1)
+    desktop.top_level.append(
+        FakeElement(desktop.counter, name="Untitled - Notepad", control_type="Window", process_id=4242, handle=0x2000)
+    )
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.adaptive_polling = True
+    config.poll_interval_ms = 400
+    config.burst_interval_ms = 20
+    config.event_debounce_ms = 0
+    engine = ClickEngine(config, [adapter], _logger())
+
+    engine._trigger.notify(ChangeEvent(kind=EVENT_WINDOW_OPENED, handle=0x2000))
+    engine._wait_for_next_scan()
+    assert engine.status()["current_interval_ms"] == 400
+
+    engine._trigger.notify(ChangeEvent(kind=EVENT_WINDOW_OPENED, handle=0x1000))
+    engine._wait_for_next_scan()
+    assert engine.status()["current_interval_ms"] == 20
+
+
+def test_engine_requests_full_sweep_after_window_opened_event() -> None:
+    desktop = build_synthetic_desktop(window_count=3, enabled_submit_windows=(0, 1, 2))
+    adapter = _build_adapter(desktop, foreground_fn=lambda: 0x1001)
+    config = _build_config()
+    config.foreground_tiering = True
+    config.per_target_cooldown = True
+    config.dry_run = True
+    config.event_debounce_ms = 0
+    engine = ClickEngine(config, [adapter], _logger())
+
+    tiers = []
+    for _ in range(3):
+        engine.run_once()
+        tiers.append(adapter.metrics()["scan_tier"])
+    # Only a window that passes the allowlist is worth a full sweep.
+    for title, handle in (("Untitled - Notepad", 0x2000), ("proj3 - Visual Studio Code", 0x1003)):
+        desktop.top_level.append(
+            FakeElement(desktop.counter, name=title, control_type="Window", process_id=4242, handle=handle)
+        )
+        engine._trigger.notify(ChangeEvent(kind=EVENT_WINDOW_OPENED, handle=handle))
+        engine._wait_for_next_scan()
+        engine.run_once()
+        tiers.append(adapter.metrics()["scan_tier"])
+
+    assert tiers == [SCAN_TIER_FULL, SCAN_TIER_FOREGROUND, SCAN_TIER_FOREGROUND, SCAN_TIER_RECENT, SCAN_TIER_FULL]
+    assert engine.status()["scan_tiers"] == {SCAN_TIER_FOREGROUND: 2, SCAN_TIER_RECENT: 1, SCAN_TIER_FULL: 2}
+
+
+def test_verify_action_requeries_only_the_clicked_button() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    adapter = _build_adapter(desktop)
+    (candidate,) = adapter.scan(_build_config())
+    submit = next(node for node in desktop.top_level[0].iter_subtree() if node.automation_id == "chat-submit")
+
+    desktop.counter.reset()
+    assert candidate.verify_action() is False
+    assert set(desktop.counter.calls) == {"is_enabled", "is_visible"}
+
+    submit.enabled = False
+    assert candidate.verify_action() is True
+    submit.enabled = True
+    submit.detached = True
+    assert candidate.verify_action() is True
+
+
+def test_suppress_repeat_clicks_tells_a_fresh_prompt_by_runtime_id() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.suppress_repeat_clicks = True
+    engine = ClickEngine(config, [adapter], _logger())
+    submit = next(node for node in desktop.top_level[0].iter_subtree() if node.automation_id == "chat-submit")
+
+    assert engine.run_once() is True
+    assert engine.run_once() is False
+    assert submit.invocations == 1
+
+    # A new prompt brings a new button with the same label and the same surrounding text.
+    parent = submit._parent
+    parent.remove_child(submit)
+    fresh = parent.add_child(
+        FakeElement(desktop.counter, name=submit.name, control_type="Button", automation_id="chat-submit")
+    )
+    assert engine.run_once() is True
+    assert fresh.invocations == 1
+
+
+def test_suppress_repeat_clicks_clicks_the_same_button_again_after_it_was_busy() -> None:
+    desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+    adapter = _build_adapter(desktop)
+    config = _build_config()
+    config.suppress_repeat_clicks = True
+    engine = ClickEngine(config, [adapter], _logger())
+    submit = next(node for node in desktop.top_level[0].iter_subtree() if node.automation_id == "chat-submit")
+
+    assert engine.run_once() is True
+    assert engine.run_once() is False
+
+    # The streaming scan reports the busy (disabled) button so the click is re-armed...
+    submit.enabled = False
+    assert engine.run_once() is False
+    # ...and the same element, enabled for the next prompt, is clicked again.
+    submit.enabled = True
+    assert engine.run_once() is True
+    assert submit.invocations == 2
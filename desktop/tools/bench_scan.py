@@ -0,0 +1,423 @@
+"""
+Scan-cost benchmarks against the in-process fake UIA tree.
+
+Usage:
+    python tools/bench_scan.py [scenario ...]
+
+Each scenario prints element reads (cross-process call equivalents) and wall time
+for the baseline strategy and the optimized one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from submit_autoclicker.adapters.process_cache import ProcessNameCache, ProcessPresenceGate  # noqa: E402
+from submit_autoclicker.adapters.session import AutomationSession  # noqa: E402
+from submit_autoclicker.adapters.uia_adapter import UIAAdapter  # noqa: E402
+from submit_autoclicker.config import AppConfig  # noqa: E402
+from submit_autoclicker.core.engine import ClickEngine  # noqa: E402
+from submit_autoclicker.core.events import FakeEventSource  # noqa: E402
+from submit_autoclicker.core.policy import (  # noqa: E402
+    AllowlistPolicy,
+    ButtonTextMatcher,
+    button_text_matches,
+    normalize_text,
+)
+from submit_autoclicker.core.scheduler import ScanTierSchedule  # noqa: E402
+from submit_autoclicker.models import WindowIdentity  # noqa: E402
+from tests.fakes_uia import (  # noqa: E402
+    FakeConditionSearch,
+    FakeElement,
+    FakeDesktopFactory,
+    FakeProcessTable,
+    FakeSubtreeFetcher,
+    build_synthetic_desktop,
+)
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("submit_autoclicker_bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+
+def _config() -> AppConfig:
+    return AppConfig(
+        allowed_processes=["Code.exe"],
+        allowed_window_title_contains=["Visual Studio Code"],
+        button_texts=["Submit ⏎"],
+        click_cooldown_ms=0,
+        dry_run=True,
+    )
+
+
+def _report(label: str, reads: int, seconds: float) -> None:
+    print(f"  {label:<28} reads={reads:>7}  time={seconds * 1000:8.2f} ms")
+
+
+def _build_adapter(desktop, **kwargs: object) -> UIAAdapter:
+    processes = FakeProcessTable({4242: ("Code.exe", 1.0)})
+    kwargs.setdefault("session", AutomationSession(_logger(), desktop_factory=lambda: desktop))
+    return UIAAdapter(
+        _logger(),
+        process_name_fn=ProcessNameCache(psutil_module=processes).name,
+        presence_gate=ProcessPresenceGate(psutil_module=processes),
+        **kwargs,
+    )
+
+
+class _ListOnlyProvider:
+    """Hides iter_scan so the engine falls back to the list protocol."""
+
+    def __init__(self, adapter: UIAAdapter) -> None:
+        self.name = adapter.name
+        self._adapter = adapter
+
+    def scan(self, config: AppConfig) -> list:
+        return self._adapter.scan(config)
+
+
+class _WatchedProvider:
+    """Streams the adapter's candidates and reports every window as watched by change events."""
+
+    def __init__(self, adapter: UIAAdapter) -> None:
+        self.name = adapter.name
+        self._adapter = adapter
+
+    def scan(self, config: AppConfig) -> list:
+        return self._adapter.scan(config)
+
+    def iter_scan(self, config: AppConfig):
+        return self._adapter.iter_scan(config)
+
+    def is_watching_window(self, handle: int) -> bool:
+        return True
+
+
+def bench_streaming(window_count: int = 50) -> dict[str, float]:
+    """List-returning scan vs streaming scan with early exit (Submit enabled in window 10)."""
+    results: dict[str, float] = {}
+    for label, wrap in (("list", True), ("streaming", False)):
+        desktop = build_synthetic_desktop(window_count=window_count)
+        adapter = _build_adapter(desktop)
+        provider = _ListOnlyProvider(adapter) if wrap else adapter
+        engine = ClickEngine(config=_config(), providers=[provider], logger=_logger())
+
+        started = time.perf_counter()
+        matched = engine.run_once()
+        elapsed = time.perf_counter() - started
+        assert matched, "synthetic tree should contain an enabled Submit button"
+        _report(label, desktop.counter.total, elapsed)
+        results[label] = desktop.counter.total
+    return results
+
+
+def bench_button_matcher(label_count: int = 5000, rounds: int = 5) -> dict[str, float]:
+    """Per-call normalize loop vs the precompiled trie over a batch of VS Code-like button labels."""
+    rng = random.Random(7)
+    words = ["Submit", "Continue", "Apply", "Yes", "Run", "Open", "Close", "More Actions...", "Go", "Cancel"]
+    labels = [
+        f"{rng.choice(words)}{rng.choice(['', ' ⏎', ' (Ctrl+Enter)', 'ted', ' Changes', '...'])}"
+        for _ in range(label_count)
+    ]
+    patterns = ["Submit ⏎", "Submit ↩", "Submit ↵", "Submit", "Continue", "Apply", "Yes", "Allow", "Keep"]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        expected = [button_text_matches(label, patterns) for label in labels]
+    function_seconds = (time.perf_counter() - started) / rounds
+
+    matcher = ButtonTextMatcher(patterns)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        actual = [matcher.matches(label) for label in labels]
+    matcher_seconds = (time.perf_counter() - started) / rounds
+
+    assert actual == expected, "compiled matcher diverged from button_text_matches"
+    print(f"  {'button_text_matches':<28} labels={label_count:>6}  time={function_seconds * 1000:8.2f} ms")
+    print(f"  {'ButtonTextMatcher':<28} labels={label_count:>6}  time={matcher_seconds * 1000:8.2f} ms")
+    return {"function": function_seconds, "matcher": matcher_seconds}
+
+
+def bench_title_allowlist(fragment_count: int = 60, window_count: int = 2000, rounds: int = 5) -> dict[str, float]:
+    """Per-needle `in` loop vs the Aho-Corasick allowlist over many title fragments."""
+    rng = random.Random(11)
+    fragments = [f"team{index}-workspace" for index in range(fragment_count)] + ["Visual Studio Code"]
+    titles = [
+        f"{rng.choice(['main.py', 'README.md', 'chat'])} - proj{index} - "
+        f"{rng.choice(['Visual Studio Code', 'Notepad', 'Chrome', 'Terminal'])}"
+        for index in range(window_count)
+    ]
+    windows = [WindowIdentity(title=title, process_name="Code.exe") for title in titles]
+    needles = [normalize_text(fragment) for fragment in fragments]
+
+    def naive_is_allowed(window: WindowIdentity) -> bool:
+        title = normalize_text(window.title)
+        return any(needle in title for needle in needles)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        expected = [naive_is_allowed(window) for window in windows]
+    naive_seconds = (time.perf_counter() - started) / rounds
+
+    policy = AllowlistPolicy(["Code.exe"], fragments)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        actual = [policy.is_allowed(window) for window in windows]
+    compiled_seconds = (time.perf_counter() - started) / rounds
+
+    assert actual == expected, "Aho-Corasick allowlist diverged from the naive scan"
+    print(f"  {'naive substring loop':<28} titles={window_count:>6}  time={naive_seconds * 1000:8.2f} ms")
+    print(f"  {'AllowlistPolicy (automaton)':<28} titles={window_count:>6}  time={compiled_seconds * 1000:8.2f} ms")
+    return {"naive": naive_seconds, "automaton": compiled_seconds}
+
+
+def bench_session(scans: int = 200, construction_cost_ms: float = 2.0) -> dict[str, float]:
+    """New Desktop per scan vs one persistent session; construction_cost_ms models COM/UIA setup."""
+    results: dict[str, float] = {}
+    for label, persistent in (("desktop per scan", False), ("persistent session", True)):
+        desktop = build_synthetic_desktop(window_count=5, enabled_submit_windows=())
+        factory = FakeDesktopFactory(desktop)
+
+        def costly_factory(factory: FakeDesktopFactory = factory):
+            time.sleep(construction_cost_ms / 1000.0)
+            return factory()
+
+        session = AutomationSession(_logger(), desktop_factory=costly_factory)
+        adapter = _build_adapter(desktop, session=session)
+        config = _config()
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            if not persistent:
+                session.invalidate()
+            adapter.scan(config)
+        elapsed = time.perf_counter() - started
+        print(f"  {label:<28} constructions={factory.constructions:>5}  time={elapsed * 1000:8.2f} ms")
+        results[label] = factory.constructions
+    return results
+
+
+def bench_batched_fetch(window_count: int = 50, buttons_per_window: int = 40) -> dict[str, float]:
+    """Per-element property reads vs one cached subtree fetch per window (full list scan)."""
+    results: dict[str, float] = {}
+    for label, batched in (("per-element reads", False), ("batched subtree fetch", True)):
+        desktop = build_synthetic_desktop(window_count=window_count, buttons_per_window=buttons_per_window)
+        fetcher = FakeSubtreeFetcher(desktop.counter)
+        adapter = _build_adapter(desktop, tree_fetcher=fetcher)
+        config = _config()
+        config.batched_uia_fetch = batched
+
+        started = time.perf_counter()
+        candidates = adapter.scan(config)
+        elapsed = time.perf_counter() - started
+        assert len(candidates) == window_count, "every window should yield its Submit button"
+        _report(label, desktop.counter.total, elapsed)
+        results[label] = desktop.counter.total
+    return results
+
+
+def bench_name_conditions(window_count: int = 50, buttons_per_window: int = 200) -> dict[str, float]:
+    """All Button descendants filtered in Python vs a ControlType AND Name-substring UIA condition."""
+    results: dict[str, float] = {}
+    for label, pushed_down in (("all buttons + python filter", False), ("name condition", True)):
+        desktop = build_synthetic_desktop(window_count=window_count, buttons_per_window=buttons_per_window)
+        adapter = _build_adapter(desktop, condition_search=FakeConditionSearch(desktop.counter))
+        config = _config()
+        config.uia_name_conditions = pushed_down
+
+        started = time.perf_counter()
+        candidates = adapter.scan(config)
+        elapsed = time.perf_counter() - started
+        assert len(candidates) == window_count, "every window should yield its Submit button"
+        _report(label, desktop.counter.total, elapsed)
+        results[label] = desktop.counter.total
+    return results
+
+
+def bench_locator_hints(window_count: int = 50, buttons_per_window: int = 200, scans: int = 10) -> dict[str, float]:
+    """Full Button walk every scan vs learned per-window locator hints (steady state after the first scan)."""
+    results: dict[str, float] = {}
+    for label, hinted in (("full walk", False), ("locator hints", True)):
+        desktop = build_synthetic_desktop(
+            window_count=window_count,
+            buttons_per_window=buttons_per_window,
+            enabled_submit_windows=tuple(range(window_count)),
+        )
+        adapter = _build_adapter(desktop)
+        config = _config()
+        config.locator_hints = hinted
+        adapter.scan(config)
+        desktop.counter.reset()
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            assert len(adapter.scan(config)) == window_count, "every window should yield its Submit button"
+        elapsed = time.perf_counter() - started
+        _report(label, desktop.counter.total // scans, elapsed / scans)
+        results[label] = desktop.counter.total / scans
+    return results
+
+
+def bench_walk_budget(webview_nodes: int = 20_000, window_count: int = 50, node_budget: int = 500) -> dict[str, float]:
+    """
+    Unbounded descendants() vs a node-budgeted best-first walk, on one window with a huge webview
+    and on the plain 50-window desktop. Both modes report the same counted reads; "nodes" is how
+    many elements the provider traverses (descendants() visits the whole subtree server-side).
+    Budgets do not pay off in reads: the walk fetches children and control types one call at a
+    time and costs more than one descendants query in both layouts. They only cap provider-side
+    traversal and time on very large subtrees.
+    """
+    results: dict[str, float] = {}
+    for layout in ("webview", "desktop"):
+        for mode, budget in (("unbounded descendants", 0), ("budgeted best-first", node_budget)):
+            if layout == "webview":
+                desktop = build_synthetic_desktop(window_count=1, enabled_submit_windows=(0,))
+                webview = desktop.top_level[0].add_child(
+                    FakeElement(desktop.counter, name="webview", control_type="Document")
+                )
+                for index in range(webview_nodes):
+                    webview.add_child(FakeElement(desktop.counter, name=f"line {index}", control_type="Text"))
+            else:
+                desktop = build_synthetic_desktop(window_count=window_count, enabled_submit_windows=(0,))
+            adapter = _build_adapter(desktop)
+            config = _config()
+            config.walk_node_budget = budget
+
+            started = time.perf_counter()
+            candidates = adapter.scan(config)
+            elapsed = time.perf_counter() - started
+            enabled = [candidate.button_text for candidate in candidates if candidate.enabled]
+            assert enabled == ["Submit ⏎"], "the enabled Submit should be found"
+            if budget:
+                nodes = desktop.counter.calls["control_type"]
+            else:
+                nodes = sum(sum(1 for _ in window.iter_subtree()) - 1 for window in desktop.top_level)
+            label = f"{layout}: {mode}"
+            print(f"  {label:<36} reads={desktop.counter.total:>7}  nodes={nodes:>7}  time={elapsed * 1000:8.2f} ms")
+            results[label] = desktop.counter.total
+    return results
+
+
+def bench_negative_cache(window_count: int = 50, scans: int = 40) -> dict[str, float]:
+    """Re-walking every allowlisted window vs backing off windows that never hold a matching button."""
+    results: dict[str, float] = {}
+    for label, enabled in (("walk every window", False), ("negative cache", True)):
+        desktop = build_synthetic_desktop(window_count=window_count, enabled_submit_windows=(0,))
+        for window in desktop.top_level[1:]:
+            chat_panel = next(node for node in window.iter_subtree() if node.automation_id == "workbench.panel.chat")
+            window.remove_child(chat_panel)
+        adapter = _build_adapter(desktop)
+        config = _config()
+        config.negative_cache = enabled
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            assert len(adapter.scan(config)) == 1, "window 0 should keep yielding its Submit button"
+        elapsed = time.perf_counter() - started
+        _report(label, desktop.counter.total // scans, elapsed / scans)
+        results[label] = desktop.counter.total / scans
+    return results
+
+
+def bench_foreground_tiering(window_count: int = 50, scans: int = 40) -> dict[str, float]:
+    """Scanning every window each tick vs foreground every tick, recent windows every 3rd, full sweep every 20th."""
+    results: dict[str, float] = {}
+    for label, enabled in (("every window every tick", False), ("foreground-first tiers", True)):
+        desktop = build_synthetic_desktop(window_count=window_count, enabled_submit_windows=(0,))
+        foreground = desktop.top_level[0].handle
+        adapter = _build_adapter(desktop, foreground_fn=lambda: foreground)
+        config = _config()
+        config.foreground_tiering = enabled
+        schedule = ScanTierSchedule()
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            adapter.set_scan_tier(schedule.next_tier(config))
+            handles = {candidate.window.handle for candidate in adapter.scan(config)}
+            assert foreground in handles, "the foreground window should yield its Submit button"
+        elapsed = time.perf_counter() - started
+        _report(label, desktop.counter.total // scans, elapsed / scans)
+        results[label] = desktop.counter.total / scans
+    return results
+
+
+def bench_incremental(window_count: int = 50, scans: int = 20) -> dict[str, float]:
+    """
+    Evaluating every candidate vs reusing rejections in windows watched by change events.
+    Every window holds an enabled Submit button whose near text fails require_near_text_contains;
+    name conditions keep the button search itself cheap, so the near-text walk dominates.
+    "incremental, polling" pays the runtime-id read without any reuse.
+    """
+    results: dict[str, float] = {}
+    modes = (
+        ("evaluate every candidate", False, False),
+        ("incremental, polling", True, False),
+        ("incremental, events", True, True),
+    )
+    for label, incremental, watched in modes:
+        desktop = build_synthetic_desktop(window_count=window_count, enabled_submit_windows=tuple(range(window_count)))
+        adapter = _build_adapter(desktop, condition_search=FakeConditionSearch(desktop.counter))
+        config = _config()
+        config.uia_name_conditions = True
+        config.require_near_text_contains = ["Allow edits"]
+        config.incremental_scans = incremental
+        config.incremental_revalidate_every = scans
+        engine = ClickEngine(config=config, providers=[_WatchedProvider(adapter)], logger=_logger())
+        if watched:
+            # Stands in for a running engine whose change event source is active.
+            engine._active_event_sources.append(FakeEventSource())
+        engine.run_once()
+        desktop.counter.reset()
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            assert not engine.run_once(), "no near text should satisfy the requirement"
+        elapsed = time.perf_counter() - started
+        _report(label, desktop.counter.total // scans, elapsed / scans)
+        results[label] = desktop.counter.total / scans
+    return results
+
+
+SCENARIOS: dict[str, Callable[[], dict[str, float]]] = {
+    "streaming": bench_streaming,
+    "button_matcher": bench_button_matcher,
+    "title_allowlist": bench_title_allowlist,
+    "session": bench_session,
+    "batched_fetch": bench_batched_fetch,
+    "name_conditions": bench_name_conditions,
+    "locator_hints": bench_locator_hints,
+    "walk_budget": bench_walk_budget,
+    "negative_cache": bench_negative_cache,
+    "foreground_tiering": bench_foreground_tiering,
+    "incremental": bench_incremental,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"One of: {', '.join(SCENARIOS)}")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    for name in args.scenarios or list(SCENARIOS):
+        print(f"{name}:")
+        SCENARIOS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())